@@ -0,0 +1,564 @@
+import json
+import sys
+from argparse import ArgumentParser, Namespace
+from contextlib import contextmanager
+from dataclasses import asdict
+from os import path
+from time import perf_counter
+from typing import Iterator, List, Optional
+
+from .cache import ParsedCache, ResultCache
+from .io import Source
+from .runner import (AUTO_ENGINE, REFERENCE_ENGINE, Result,
+                     UnknownPartException, is_available, list_days,
+                     list_engines, list_parts, load_combined, run_day,
+                     run_part)
+
+# The batch, daemon, differential, generators, memory and profiling modules pull in multiprocessing, asyncio,
+# cProfile and tracemalloc, so they are only imported by the commands that use them, to keep a plain run quick to start
+
+STDIN = "-"
+
+# The keys of `profiling.SORT_KEYS`, repeated here so the parser can be built without importing the profiler
+PROFILE_SORT_KEYS = ("cumtime", "tottime")
+
+
+@contextmanager
+def resolve_input(input_path: Optional[str], spool: bool = True) -> Iterator[Optional[Source]]:
+    """
+    Resolves `-` as an `input_path` to standard input.
+    Unless `spool` is unset, standard input is copied to a temporary file first, since a stream can only be read once.
+    """
+
+    if input_path != STDIN:
+        yield input_path
+        return
+    # END IF
+
+    if not spool:
+        yield sys.stdin.buffer
+        return
+    # END IF
+
+    from shutil import copyfileobj
+    from tempfile import NamedTemporaryFile
+
+    with NamedTemporaryFile(prefix="thijs-") as file:
+        copyfileobj(sys.stdin.buffer, file)
+        file.flush()
+        yield file.name
+    # END WITH file
+# END resolve_input
+
+
+def format_result(result: Result) -> str:
+    answer = str(result.answer)
+
+    # Multi-line answers, like rendered displays, start on a line of their own
+    if "\n" in answer:
+        answer = "\n" + answer
+    # END IF
+
+    cached = " (cached)" if result.cached else ""
+    engine = f" [{result.engine}]" if result.engine != REFERENCE_ENGINE else ""
+    parse_time = f"{'shared':>15}" if result.shared_parse else f"{result.parse_time * 1000:>12.3f} ms"
+
+    return "\n".join([
+        f"{result.day} part {result.part}{engine}: {answer}{cached}",
+        f"    parse {parse_time}",
+        f"    solve {result.solve_time * 1000:>12.3f} ms",
+        f"    total {result.total_time * 1000:>12.3f} ms",
+        *(f"    {name} {value:>{max(0, 24 - len(name))},}" for name, value in sorted(result.metrics.items())),
+    ])
+# END format_result
+
+
+def profile_output_path(template: str, day: str, part: int) -> str:
+    """
+    Fills in the `{day}` and `{part}` placeholders of `template`, so every part can be dumped to a file of its own.
+    """
+
+    return template.format(day=day, part=part)
+# END profile_output_path
+
+
+def command_profile(arguments: Namespace, days: List[str], input_path: Optional[Source]) -> int:
+    from .profiling import format_report, profile_part
+
+    for day in days:
+        parts = arguments.parts or list_parts(day)
+
+        for part in parts:
+            dump_path = None
+
+            if arguments.profile_output is not None:
+                dump_path = profile_output_path(arguments.profile_output, day, part)
+            # END IF
+
+            try:
+                answer, report = profile_part(
+                    day,
+                    part,
+                    input_path,
+                    top=arguments.profile_top,
+                    sort=arguments.profile_sort,
+                    engine=arguments.engine,
+                    dump_path=dump_path,
+                    sample_lines=arguments.profile_lines
+                )
+            except UnknownPartException as exception:
+                print(f"Unknown part {exception.part} for {exception.day}", file=sys.stderr)
+                return 2
+            # END TRY
+
+            print(f"{day} part {part}: {answer}", flush=True)
+            print(format_report(report), flush=True)
+
+            if dump_path is not None:
+                print(f"Wrote the profile to {dump_path}", file=sys.stderr)
+            # END IF
+        # END LOOP
+    # END LOOP
+
+    return 0
+# END command_profile
+
+
+def command_memory(arguments: Namespace, days: List[str], input_path: Optional[Source]) -> int:
+    from .memory import format_memory_report, measure_memory
+
+    for day in days:
+        parts = arguments.parts or list_parts(day)
+
+        for part in parts:
+            try:
+                answer, report = measure_memory(day, part, input_path, top=arguments.memory_top, engine=arguments.engine)
+            except UnknownPartException as exception:
+                print(f"Unknown part {exception.part} for {exception.day}", file=sys.stderr)
+                return 2
+            # END TRY
+
+            if arguments.json:
+                print(json.dumps({"day": day, "part": part, "answer": answer, **asdict(report)}), flush=True)
+            else:
+                print(f"{day} part {part}: {answer}", flush=True)
+                print(format_memory_report(report), flush=True)
+            # END IF
+        # END LOOP
+    # END LOOP
+
+    return 0
+# END command_memory
+
+
+def reads_input_once(arguments: Namespace, days: List[str]) -> bool:
+    """
+    Returns `True` if the input of the run is parsed only once, so standard input can be streamed to the parser.
+    """
+
+    if len(days) != 1:
+        return False
+    # END IF
+
+    parts = arguments.parts or list_parts(days[0])
+
+    if len(parts) == 1:
+        return True
+    # END IF
+
+    solves_combined = arguments.parts is None and arguments.combined and not (arguments.profile or arguments.memory)
+
+    return solves_combined and load_combined(days[0]) is not None
+# END reads_input_once
+
+
+def command_list(arguments: Namespace) -> int:
+    for day in list_days():
+        parts = ", ".join(str(part) for part in list_parts(day))
+        engines = list_engines(day)
+
+        if len(engines) > 1:
+            print(f"{day} (parts {parts}; engines {', '.join(engines)})")
+        else:
+            print(f"{day} (parts {parts})")
+        # END IF
+    # END LOOP
+    return 0
+# END command_list
+
+
+def command_run(arguments: Namespace) -> int:
+    days: List[str] = arguments.days or list_days()
+
+    if arguments.input is not None and len(days) != 1:
+        print("An input can only be given for a single day", file=sys.stderr)
+        return 2
+    # END IF
+
+    unknown_days = [day for day in days if day not in list_days()]
+
+    if unknown_days:
+        print(f"Unknown day: {', '.join(unknown_days)}", file=sys.stderr)
+        return 2
+    # END IF
+
+    if arguments.engine != AUTO_ENGINE:
+        missing_engine = [day for day in days if arguments.engine not in list_engines(day)]
+
+        if missing_engine:
+            print(f"Unknown engine {arguments.engine} for {', '.join(missing_engine)}", file=sys.stderr)
+            return 2
+        # END IF
+
+        unavailable = [day for day in days if not is_available(day, arguments.engine)]
+
+        if unavailable:
+            print(f"Engine {arguments.engine} for {', '.join(unavailable)} needs packages that are not installed", file=sys.stderr)
+            return 2
+        # END IF
+    # END IF
+
+    # Counting operations needs a solve, so a cached answer is never used then
+    cache = ResultCache() if arguments.cache and not arguments.metrics else None
+    parsed_cache = ParsedCache() if arguments.cache else None
+
+    with resolve_input(arguments.input, spool=not reads_input_once(arguments, days)) as input_path:
+        # Profiling and tracing memory always parse and solve, since a cached answer says nothing about the solver
+        if arguments.profile:
+            return command_profile(arguments, days, input_path)
+        # END IF
+
+        if arguments.memory:
+            return command_memory(arguments, days, input_path)
+        # END IF
+
+        for day in days:
+            try:
+                # All parts of a day are solved from a single parse, unless the parts are asked for separately
+                if arguments.parts is None and arguments.combined:
+                    results = run_day(day, input_path, cache, parsed_cache, arguments.metrics, arguments.engine)
+                else:
+                    results = [
+                        run_part(day, part, input_path, cache, parsed_cache, arguments.metrics, arguments.engine)
+                        for part in arguments.parts or list_parts(day)
+                    ]
+                # END IF
+            except UnknownPartException as exception:
+                print(f"Unknown part {exception.part} for {exception.day}", file=sys.stderr)
+                return 2
+            # END TRY
+
+            for result in results:
+                if arguments.json:
+                    print(json.dumps(asdict(result)), flush=True)
+                else:
+                    print(format_result(result), flush=True)
+                # END IF
+            # END LOOP
+        # END LOOP
+    # END WITH input_path
+
+    return 0
+# END command_run
+
+
+def command_batch(arguments: Namespace) -> int:
+    from .batch import Failure, NoInputsException, find_inputs, run_batch
+
+    if arguments.day not in list_days():
+        print(f"Unknown day: {arguments.day}", file=sys.stderr)
+        return 2
+    # END IF
+
+    try:
+        input_paths = find_inputs(arguments.inputs)
+    except NoInputsException as exception:
+        print(f"No inputs found at {exception.pattern}", file=sys.stderr)
+        return 2
+    # END TRY
+
+    parts = arguments.parts or list_parts(arguments.day)
+    n_failures = 0
+    start = perf_counter()
+
+    try:
+        outcomes = run_batch(arguments.day, parts, input_paths, arguments.workers, arguments.chunksize)
+
+        for outcome in outcomes:
+            if isinstance(outcome, Failure):
+                n_failures += 1
+            # END IF
+
+            if arguments.json:
+                print(json.dumps(asdict(outcome)), flush=True)
+            elif isinstance(outcome, Failure):
+                print(f"{outcome.input_path} part {outcome.part}: failed with {outcome.error}", flush=True)
+            else:
+                print(f"{outcome.input_path} part {outcome.part}: {outcome.answer}", flush=True)
+            # END IF
+        # END LOOP
+    except UnknownPartException as exception:
+        print(f"Unknown part {exception.part} for {exception.day}", file=sys.stderr)
+        return 2
+    # END TRY
+
+    elapsed = perf_counter() - start
+    n_results = len(input_paths) * len(parts)
+
+    print(
+        f"Solved {n_results - n_failures} of {n_results} in {elapsed:.3f} s ({n_results / elapsed:.2f} per second)",
+        file=sys.stderr
+    )
+
+    return 1 if n_failures else 0
+# END command_batch
+
+
+def command_cache(arguments: Namespace) -> int:
+    for cache in (ResultCache(), ParsedCache()):
+        if arguments.clear:
+            cache.clear()
+        # END IF
+
+        n_entries = sum(1 for _ in cache.entries())
+        print(f"{cache.directory}: {n_entries} entries, {cache.size() / 2 ** 10:.1f} KiB of {cache.max_bytes / 2 ** 20:.0f} MiB")
+    # END LOOP
+
+    return 0
+# END command_cache
+
+
+def command_generate(arguments: Namespace) -> int:
+    from .generators import DEFAULT_SIZES, generate
+
+    if arguments.day not in DEFAULT_SIZES:
+        print(f"Unknown day: {arguments.day}", file=sys.stderr)
+        return 2
+    # END IF
+
+    print(generate(arguments.day, arguments.target, arguments.size, arguments.seed))
+
+    return 0
+# END command_generate
+
+
+def command_daemon(arguments: Namespace) -> int:
+    from .daemon import Daemon
+
+    daemon = Daemon(workers=arguments.workers)
+
+    if arguments.socket is not None:
+        daemon.socket_path = arguments.socket
+    # END IF
+
+    print(f"Listening on {daemon.socket_path}", file=sys.stderr, flush=True)
+    daemon.run()
+
+    return 0
+# END command_daemon
+
+
+def command_leaderboard(arguments: Namespace) -> int:
+    from .calorie_counting.leaderboard import (DEFAULT_MAX_N,
+                                               CheckpointFormatException,
+                                               InventoryTruncatedException,
+                                               Leaderboard)
+    from .calorie_counting.fast.part_2 import TOP_N
+
+    checkpoint_path = arguments.checkpoint or f"{arguments.inventory}.leaderboard.json"
+
+    if not path.isfile(arguments.inventory):
+        print(f"No inventory at {arguments.inventory}", file=sys.stderr)
+        return 2
+    # END IF
+
+    try:
+        if path.exists(checkpoint_path):
+            leaderboard = Leaderboard.load(checkpoint_path)
+        else:
+            leaderboard = Leaderboard(max(arguments.max_n or DEFAULT_MAX_N, TOP_N))
+        # END IF
+
+        leaderboard.update(arguments.inventory)
+    except CheckpointFormatException:
+        print(f"Unreadable checkpoint at {checkpoint_path}", file=sys.stderr)
+        return 2
+    except InventoryTruncatedException as exception:
+        print(
+            f"{exception.path} shrank to {exception.size} bytes, below the {exception.offset} already ingested; "
+            f"remove {checkpoint_path} to start over",
+            file=sys.stderr
+        )
+        return 2
+    # END TRY
+
+    leaderboard.save(checkpoint_path)
+
+    for part, top_n in enumerate((1, TOP_N), start=1):
+        answer = leaderboard.top_n(top_n)
+
+        if arguments.json:
+            print(json.dumps({
+                "day": "calorie_counting",
+                "part": part,
+                "answer": answer,
+                "n_elves": leaderboard.n_elves,
+                "offset": leaderboard.offset
+            }), flush=True)
+        else:
+            print(f"calorie_counting part {part}: {answer}", flush=True)
+        # END IF
+    # END LOOP
+
+    return 0
+# END command_leaderboard
+
+
+def parse_sizes(value: str) -> List[int]:
+    return [int(size) for size in value.split(",")]
+# END parse_sizes
+
+
+def command_differential(arguments: Namespace) -> int:
+    from .differential import (combined_solver, day_solver, default_sizes,
+                               engine_solver, part_solver, run_differential)
+
+    if arguments.day not in list_days():
+        print(f"Unknown day: {arguments.day}", file=sys.stderr)
+        return 2
+    # END IF
+
+    if arguments.engine is not None and arguments.engine not in list_engines(arguments.day):
+        print(f"Unknown engine {arguments.engine} for {arguments.day}", file=sys.stderr)
+        return 2
+    # END IF
+
+    if arguments.engine is None and load_combined(arguments.day) is None:
+        print(f"{arguments.day} has no other engine to compare with", file=sys.stderr)
+        return 2
+    # END IF
+
+    if arguments.part is not None and arguments.part not in list_parts(arguments.day):
+        print(f"Unknown part {arguments.part} for {arguments.day}", file=sys.stderr)
+        return 2
+    # END IF
+
+    if arguments.part is None:
+        reference = day_solver(arguments.day)
+    else:
+        reference = part_solver(arguments.day, arguments.part)
+    # END IF
+
+    if arguments.engine is None:
+        candidate = combined_solver(arguments.day, arguments.part)
+    else:
+        candidate = engine_solver(arguments.day, arguments.engine, arguments.part)
+    # END IF
+    sizes = arguments.sizes or default_sizes(arguments.day)
+    n_mismatches = 0
+
+    for report in run_differential(reference, candidate, arguments.day, sizes, arguments.seeds):
+        n_mismatches += len(report.mismatches)
+
+        print(
+            f"size {report.size:>8}  inputs {report.n_inputs:>3}  "
+            f"reference {report.reference_time * 1000:>10.3f} ms  "
+            f"candidate {report.candidate_time * 1000:>10.3f} ms  "
+            f"speedup {report.speedup:>6.2f}x  "
+            f"mismatches {len(report.mismatches)}",
+            flush=True
+        )
+
+        for mismatch in report.mismatches:
+            print(f"    seed {mismatch.seed}: expected {mismatch.expected!r}, got {mismatch.actual!r}, on the input")
+            print("\n".join(f"        {line}" for line in mismatch.input_text.split("\n")), flush=True)
+        # END LOOP
+    # END LOOP
+
+    return 1 if n_mismatches else 0
+# END command_differential
+
+
+def create_parser() -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="python -m thijs",
+        description="Runs the Advent of Code solvers and times their parse and solve phases."
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="list the available days and parts")
+    list_parser.set_defaults(handler=command_list)
+
+    run_parser = commands.add_parser("run", help="solve one or more days")
+    run_parser.add_argument("days", nargs="*", metavar="day", help="the days to solve, all days if omitted")
+    run_parser.add_argument("-p", "--part", dest="parts", type=int, action="append", help="the part to solve, all parts if omitted")
+    run_parser.add_argument("-i", "--input", help="the input path, or - for stdin, optionally gzip or zstd compressed; defaults to the bundled data")
+    run_parser.add_argument("--json", action="store_true", help="print one JSON object per result")
+    run_parser.add_argument("--no-cache", dest="cache", action="store_false", help="always parse and solve, rather than reuse a cached answer or parsed input")
+    run_parser.add_argument("--separate", dest="combined", action="store_false", help="parse the input again for every part, rather than once per day")
+    run_parser.add_argument("--engine", default=AUTO_ENGINE, help="the engine to solve with, like reference, fast, parallel or vectorized; picked by the size of the input if omitted")
+    run_parser.add_argument("--metrics", action="store_true", help="count the operations of the solvers, like search nodes and simulation steps")
+    run_parser.add_argument("--profile", action="store_true", help="profile the parse and solve phases, rather than time them")
+    run_parser.add_argument("--profile-top", type=int, default=20, metavar="N", help="the number of hot functions and lines to report (default: %(default)s)")
+    run_parser.add_argument("--profile-sort", choices=PROFILE_SORT_KEYS, default="tottime", help="rank functions by their own or their cumulative time (default: %(default)s)")
+    run_parser.add_argument("--profile-output", metavar="FILE", help="write the pstats dump of each part to FILE, which may contain {day} and {part}")
+    run_parser.add_argument("--profile-lines", action="store_true", help="also sample the hottest lines of the solver")
+    run_parser.add_argument("--memory", action="store_true", help="trace the memory of the parse and solve phases, rather than time them")
+    run_parser.add_argument("--memory-top", type=int, default=10, metavar="N", help="the number of allocation sites and object types to report (default: %(default)s)")
+    run_parser.set_defaults(handler=command_run)
+
+    batch_parser = commands.add_parser("batch", help="solve many inputs of a day in parallel")
+    batch_parser.add_argument("day", help="the day to solve")
+    batch_parser.add_argument("inputs", help="a directory of inputs, or a glob pattern that matches them")
+    batch_parser.add_argument("-p", "--part", dest="parts", type=int, action="append", help="the part to solve, all parts if omitted")
+    batch_parser.add_argument("-w", "--workers", type=int, help="the number of worker processes, one per core if omitted")
+    batch_parser.add_argument("--chunksize", type=int, default=1, help="the number of inputs handed to a worker at once (default: %(default)s)")
+    batch_parser.add_argument("--json", action="store_true", help="print one JSON object per result")
+    batch_parser.set_defaults(handler=command_batch)
+
+    cache_parser = commands.add_parser("cache", help="show or clear the caches of answers and parsed inputs")
+    cache_parser.add_argument("--clear", action="store_true", help="remove every cached answer and parsed input")
+    cache_parser.set_defaults(handler=command_cache)
+
+    generate_parser = commands.add_parser("generate", help="write a synthetic input for a day")
+    generate_parser.add_argument("day", help="the day to generate an input for")
+    generate_parser.add_argument("target", help="the path to write to, a directory for supply_stacks")
+    generate_parser.add_argument("-s", "--size", type=int, help="the size of the input in the unit of the day, defaults to that of the bundled data")
+    generate_parser.add_argument("--seed", type=int, default=0, help="the seed of the random generator (default: %(default)s)")
+    generate_parser.set_defaults(handler=command_generate)
+
+    daemon_parser = commands.add_parser("daemon", help="serve answers over a Unix socket, with the solvers imported once")
+    daemon_parser.add_argument("-s", "--socket", help="the socket to listen on, defaults to $THIJS_SOCKET or a per-user socket")
+    daemon_parser.add_argument("-w", "--workers", type=int, help="the number of worker processes for solves that are not known to be quick, one per core if omitted")
+    daemon_parser.set_defaults(handler=command_daemon)
+
+    leaderboard_parser = commands.add_parser("leaderboard", help="answer calorie_counting for an inventory that grows, reading only what was appended since the last call")
+    leaderboard_parser.add_argument("inventory", help="the path of the inventory")
+    leaderboard_parser.add_argument("-c", "--checkpoint", help="the path of the checkpoint, next to the inventory if omitted")
+    leaderboard_parser.add_argument("--max-n", type=int, metavar="N", help="the number of totals kept by a new checkpoint, at least the 3 that part 2 needs")
+    leaderboard_parser.add_argument("--json", action="store_true", help="print one JSON object per part")
+    leaderboard_parser.set_defaults(handler=command_leaderboard)
+
+    differential_parser = commands.add_parser("differential", help="check an engine, or the combined solver, of a day against its parts on generated inputs")
+    differential_parser.add_argument("day", help="the day to check")
+    differential_parser.add_argument("-e", "--engine", help="the engine to check, the combined module of the day if omitted")
+    differential_parser.add_argument("-p", "--part", type=int, help="the part to check, all parts if omitted")
+    differential_parser.add_argument("--sizes", type=parse_sizes, help="comma separated input sizes in the unit of the day, from 1%% to 100%% of the bundled data if omitted")
+    differential_parser.add_argument("--seeds", type=int, default=5, help="the number of inputs generated per size (default: %(default)s)")
+    differential_parser.set_defaults(handler=command_differential)
+
+    return parser
+# END create_parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = create_parser()
+    arguments = parser.parse_args(argv)
+    return arguments.handler(arguments)
+# END main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+# END MAIN
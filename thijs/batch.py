@@ -0,0 +1,106 @@
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from glob import glob
+from os import cpu_count, devnull, path, scandir
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+from .runner import Day, Part, Result, load_part, run_part
+
+Task = Tuple[Part, str]
+
+
+@dataclass
+class Failure:
+    day: Day
+    part: Part
+    input_path: str
+
+    # The type and message of the exception that was raised while solving the input
+    error: str
+# END Failure
+
+
+Outcome = Union[Result, Failure]
+
+
+@dataclass
+class NoInputsException(Exception):
+    pattern: str
+# END NoInputsException
+
+
+def find_inputs(pattern: str) -> List[str]:
+    """
+    Lists the inputs in the directory at `pattern`, or the paths that match `pattern` as a glob.
+    Subdirectories count as inputs too, since some days take a directory of files.
+    """
+
+    if path.isdir(pattern):
+        input_paths = [entry.path for entry in scandir(pattern) if not entry.name.startswith(".")]
+    else:
+        input_paths = glob(pattern)
+    # END IF
+
+    if not input_paths:
+        raise NoInputsException(pattern)
+    # END IF
+
+    return sorted(input_paths)
+# END find_inputs
+
+
+def silence():
+    """
+    Discards the output of the solvers in a worker, since some of them narrate their progress.
+    """
+
+    sys.stdout = open(devnull, "w")
+# END silence
+
+
+def solve_chunk(day: Day, chunk: Sequence[Task]) -> List[Outcome]:
+    outcomes: List[Outcome] = []
+
+    for part, input_path in chunk:
+        try:
+            outcomes.append(run_part(day, part, input_path))
+        except Exception as exception:
+            outcomes.append(Failure(day, part, input_path, f"{type(exception).__name__}: {exception}"))
+        # END TRY
+    # END LOOP
+
+    return outcomes
+# END solve_chunk
+
+
+def run_batch(day: Day, parts: Sequence[Part], input_paths: Sequence[str], workers: Optional[int] = None, chunksize: int = 1) -> Iterator[Outcome]:
+    """
+    Solves every input with every given part of `day` on a pool of `workers` processes, one per core by default.
+    The tasks are handed out `chunksize` at a time, and the results are yielded in the order they complete.
+    An input that cannot be solved yields a `Failure` rather than stopping the batch.
+    """
+
+    # Fails fast on an unknown day or part, rather than once for every input
+    for part in parts:
+        load_part(day, part)
+    # END LOOP
+
+    tasks = [(part, input_path) for input_path in input_paths for part in parts]
+    chunks = [tasks[index:index + chunksize] for index in range(0, len(tasks), chunksize)]
+
+    with ProcessPoolExecutor(max_workers=workers or cpu_count(), initializer=silence) as executor:
+        futures = [executor.submit(solve_chunk, day, chunk) for chunk in chunks]
+
+        try:
+            for future in as_completed(futures):
+                yield from future.result()
+            # END LOOP
+        finally:
+            # Drops the pending work if the caller stops listening early
+            for future in futures:
+                future.cancel()
+            # END LOOP
+        # END TRY
+    # END WITH executor
+# END run_batch
@@ -0,0 +1,32 @@
+from typing import Iterator, List, Optional, Tuple
+
+from ..io import Source
+from . import part_1, part_2
+from .part_1 import Beacon, Sensor
+
+INPUT_PATH = part_1.INPUT_PATH
+
+CODEC = part_1.CODEC
+
+
+def parse(path: Source) -> List[Tuple[Sensor, Beacon]]:
+    return part_1.parse(path)
+# END parse
+
+
+def solve(sensors_and_beacons: List[Tuple[Sensor, Beacon]], y: int = 2000000, limit: int = 4000000) -> Iterator[Optional[int]]:
+    yield part_1.solve(sensors_and_beacons, y)
+    yield part_2.solve(sensors_and_beacons, limit)
+# END solve
+
+
+def solve_all(path: Source) -> List[Optional[int]]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
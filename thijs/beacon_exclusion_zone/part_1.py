@@ -1,10 +1,17 @@
 import re
 from dataclasses import dataclass
 from os import path
-from typing import Iterable, Optional, Set, Tuple
+from typing import Iterable, List, Optional, Set, Tuple
+
+from ..intervals import IntervalSet, merge_intervals
+from ..io import Buffer, Source, read_lines
+from ..sidecar import (Codec, pack_ints, pack_sections, unpack_ints,
+                       unpack_sections)
 
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
+SENSOR_PATTERN = re.compile(r"Sensor at x=(?P<sensor_x>-?\d+), y=(?P<sensor_y>-?\d+): closest beacon is at x=(?P<beacon_x>-?\d+), y=(?P<beacon_y>-?\d+)")
+
 Point = Tuple[int, int]
 Range = Tuple[int, int]
 Segment = Range
@@ -31,32 +38,22 @@ def manhattan_distance(a: Point, b: Point) -> int:
 # END manhattan_distance
 
 
-def read_sensors_and_beacons(path: str) -> Iterable[Tuple[Sensor, Beacon]]:
+def read_sensors_and_beacons(path: Source) -> Iterable[Tuple[Sensor, Beacon]]:
     """
     Reads the input data at the given `path` and yields the position of each `Sensor` and its closest `Beacon`.
     """
 
-    PATTERN = r"Sensor at x=(?P<sensor_x>-?\d+), y=(?P<sensor_y>-?\d+): closest beacon is at x=(?P<beacon_x>-?\d+), y=(?P<beacon_y>-?\d+)"
-
-    with open(path) as file:
-
-        lines = (line.rstrip("\n") for line in file)
+    for line in read_lines(path):
+        matches = SENSOR_PATTERN.match(line)
 
-        for line in lines:
-            matches = re.match(
-                pattern=PATTERN,
-                string=line
-            )
+        if matches is None:
+            raise RegexParseException(line)
+        # END IF
 
-            if matches is None:
-                raise RegexParseException(line)
-            # END IF
+        sensor_x, sensor_y, beacon_x, beacon_y = matches.groupdict().values()
 
-            sensor_x, sensor_y, beacon_x, beacon_y = matches.groupdict().values()
-
-            yield (int(sensor_x), int(sensor_y)), (int(beacon_x), int(beacon_y))
-        # END LOOP
-    # END WITH file
+        yield (int(sensor_x), int(sensor_y)), (int(beacon_x), int(beacon_y))
+    # END LOOP
 # END read_sensors_and_beacons
 
 
@@ -97,30 +94,7 @@ def calculate_segments(ranges: Iterable[Range]) -> Set[Segment]:
     Merges the given ranges into segments.
     """
 
-    segments: Set[Segment] = set()
-
-    for range in ranges:
-        range_start, range_end = range
-        new_segments = segments.copy()
-
-        for segment in segments:
-
-            if are_disjoint((range_start, range_end), segment):
-                continue
-            # END IF
-
-            new_segments.discard(segment)
-
-            segment_start, segment_end = segment
-            range_start = min(segment_start, range_start)
-            range_end = max(segment_end, range_end)
-        # END LOOP
-
-        new_segments.add((range_start, range_end))
-        segments = new_segments
-    # END LOOP
-
-    return segments
+    return set(merge_intervals(ranges))
 # END calculate_segments
 
 
@@ -134,22 +108,57 @@ def count_blocked_positions(segments: Iterable[Segment]) -> int:
 # END count_blocked_positions
 
 
-if __name__ == "__main__":
-    sensors_and_beacons = list(read_sensors_and_beacons(INPUT_PATH))
+def parse(path: Source) -> List[Tuple[Sensor, Beacon]]:
+    return list(read_sensors_and_beacons(path))
+# END parse
+
+
+def encode_parsed(sensors_and_beacons: List[Tuple[Sensor, Beacon]]) -> bytes:
+    coordinates = [
+        coordinate
+        for sensor, beacon in sensors_and_beacons
+        for coordinate in (*sensor, *beacon)
+    ]
+    return pack_sections([pack_ints(coordinates)])
+# END encode_parsed
+
+
+def decode_parsed(buffer: Buffer) -> List[Tuple[Sensor, Beacon]]:
+    (coordinates,) = unpack_sections(buffer)
+    values = iter(unpack_ints(coordinates))
+    return [
+        ((sensor_x, sensor_y), (beacon_x, beacon_y))
+        for sensor_x, sensor_y, beacon_x, beacon_y in zip(values, values, values, values)
+    ]
+# END decode_parsed
+
+
+CODEC = Codec(encode_parsed, decode_parsed)
+
+
+def solve(sensors_and_beacons: List[Tuple[Sensor, Beacon]], y: int = 2000000) -> int:
+    """
+    Counts the positions on axis `y` where no beacon can be present.
+    """
 
     _, beacons = zip(*sensors_and_beacons)
 
-    beacons_in_line = set(x for x, y in beacons if y == 2000000)
+    beacons_in_line = set(x for x, beacon_y in beacons if beacon_y == y)
 
     ranges = filter(None, (
-        calculate_exclusion_range(sensor, beacon, 2000000)
+        calculate_exclusion_range(sensor, beacon, y)
         for sensor, beacon
         in sensors_and_beacons
     ))
 
-    segments = calculate_segments(ranges)
+    segments = IntervalSet.from_intervals(ranges)
 
-    blocked_positions = count_blocked_positions(segments)
+    return segments.length - len(beacons_in_line)
+# END solve
+
+
+if __name__ == "__main__":
+    sensors_and_beacons = parse(INPUT_PATH)
 
-    print(blocked_positions - len(beacons_in_line))
+    print(solve(sensors_and_beacons))
 # END MAIN
@@ -3,8 +3,16 @@ from dataclasses import dataclass
 from os import path
 from typing import Iterable, List, Optional, Set, Tuple
 
+from ..intervals import IntervalSet, merge_intervals
+from ..io import Buffer, Source, read_lines
+from ..metrics import count
+from ..sidecar import (Codec, pack_ints, pack_sections, unpack_ints,
+                       unpack_sections)
+
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
+SENSOR_PATTERN = re.compile(r"Sensor at x=(?P<sensor_x>-?\d+), y=(?P<sensor_y>-?\d+): closest beacon is at x=(?P<beacon_x>-?\d+), y=(?P<beacon_y>-?\d+)")
+
 Point = Tuple[int, int]
 Range = Tuple[int, int]
 Segment = Range
@@ -31,32 +39,22 @@ def manhattan_distance(a: Point, b: Point) -> int:
 # END manhattan_distance
 
 
-def read_sensors_and_beacons(path: str) -> Iterable[Tuple[Sensor, Beacon]]:
+def read_sensors_and_beacons(path: Source) -> Iterable[Tuple[Sensor, Beacon]]:
     """
     Reads the input data at the given `path` and yields the position of each `Sensor` and its closest `Beacon`.
     """
 
-    PATTERN = r"Sensor at x=(?P<sensor_x>-?\d+), y=(?P<sensor_y>-?\d+): closest beacon is at x=(?P<beacon_x>-?\d+), y=(?P<beacon_y>-?\d+)"
-
-    with open(path) as file:
-
-        lines = (line.rstrip("\n") for line in file)
+    for line in read_lines(path):
+        matches = SENSOR_PATTERN.match(line)
 
-        for line in lines:
-            matches = re.match(
-                pattern=PATTERN,
-                string=line
-            )
-
-            if matches is None:
-                raise RegexParseException(line)
-            # END IF
+        if matches is None:
+            raise RegexParseException(line)
+        # END IF
 
-            sensor_x, sensor_y, beacon_x, beacon_y = matches.groupdict().values()
+        sensor_x, sensor_y, beacon_x, beacon_y = matches.groupdict().values()
 
-            yield (int(sensor_x), int(sensor_y)), (int(beacon_x), int(beacon_y))
-        # END LOOP
-    # END WITH file
+        yield (int(sensor_x), int(sensor_y)), (int(beacon_x), int(beacon_y))
+    # END LOOP
 # END read_sensors_and_beacons
 
 
@@ -97,30 +95,7 @@ def calculate_segments(ranges: Iterable[Range]) -> Set[Segment]:
     Merges the given ranges into segments.
     """
 
-    segments: Set[Segment] = set()
-
-    for range in ranges:
-        range_start, range_end = range
-        new_segments = segments.copy()
-
-        for segment in segments:
-
-            if are_disjoint((range_start, range_end), segment):
-                continue
-            # END IF
-
-            new_segments.discard(segment)
-
-            segment_start, segment_end = segment
-            range_start = min(segment_start, range_start)
-            range_end = max(segment_end, range_end)
-        # END LOOP
-
-        new_segments.add((range_start, range_end))
-        segments = new_segments
-    # END LOOP
-
-    return segments
+    return set(merge_intervals(ranges))
 # END calculate_segments
 
 
@@ -143,8 +118,10 @@ def calculate_tuning_frequency(beacon: Beacon):
 def find_missing_beacon(sensors_and_beacons: List[Tuple[Sensor, Beacon]], limit: int) -> Optional[Beacon]:
 
     beacon = None 
+    rows_scanned = 0
 
     for y in range(0, limit + 1):
+        rows_scanned += 1
 
         ranges = filter(None, (
             calculate_exclusion_range(sensor, beacon, y)
@@ -152,28 +129,66 @@ def find_missing_beacon(sensors_and_beacons: List[Tuple[Sensor, Beacon]], limit:
             in sensors_and_beacons
         ))
 
-        segments = calculate_segments(ranges)
+        segments = IntervalSet.from_intervals(ranges)
+        gap = next(segments.gaps(0, limit), None)
 
-        if len(segments) > 1:
-            a, _ = sorted(segments)
-            beacon = (a[1] + 1, y)
+        if gap is not None:
+            beacon = (gap[0], y)
             break
         # END IF
     # END LOOP
 
+    count("beacon.rows_scanned", rows_scanned)
+
     return beacon
 # END find_missing_beacon
 
 
-if __name__ == "__main__":
-    sensors_and_beacons = list(read_sensors_and_beacons(INPUT_PATH))
-    beacon = find_missing_beacon(sensors_and_beacons, 4000000)
+def parse(path: Source) -> List[Tuple[Sensor, Beacon]]:
+    return list(read_sensors_and_beacons(path))
+# END parse
+
+
+def encode_parsed(sensors_and_beacons: List[Tuple[Sensor, Beacon]]) -> bytes:
+    coordinates = [
+        coordinate
+        for sensor, beacon in sensors_and_beacons
+        for coordinate in (*sensor, *beacon)
+    ]
+    return pack_sections([pack_ints(coordinates)])
+# END encode_parsed
+
+
+def decode_parsed(buffer: Buffer) -> List[Tuple[Sensor, Beacon]]:
+    (coordinates,) = unpack_sections(buffer)
+    values = iter(unpack_ints(coordinates))
+    return [
+        ((sensor_x, sensor_y), (beacon_x, beacon_y))
+        for sensor_x, sensor_y, beacon_x, beacon_y in zip(values, values, values, values)
+    ]
+# END decode_parsed
+
+
+CODEC = Codec(encode_parsed, decode_parsed)
+
 
-    tuning_frequency = None
+def solve(sensors_and_beacons: List[Tuple[Sensor, Beacon]], limit: int = 4000000) -> Optional[int]:
+    """
+    Calculates the tuning frequency of the missing beacon, or returns `None` if no beacon is missing.
+    """
 
-    if beacon is not None:
-        tuning_frequency = calculate_tuning_frequency(beacon)
+    beacon = find_missing_beacon(sensors_and_beacons, limit)
+
+    if beacon is None:
+        return None
     # END IF
 
-    print(tuning_frequency)
+    return calculate_tuning_frequency(beacon)
+# END solve
+
+
+if __name__ == "__main__":
+    sensors_and_beacons = parse(INPUT_PATH)
+
+    print(solve(sensors_and_beacons))
 # END MAIN
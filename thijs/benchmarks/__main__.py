@@ -0,0 +1,119 @@
+import sys
+from argparse import ArgumentParser
+from typing import List, Optional
+
+from ..runner import list_days
+from .cases import CASES
+from .imports import (STARTUP_BUDGET, ImportReport, day_modules,
+                      measure_import, measure_startup)
+from .suite import SCALES, Measurement, run_suite, write_report
+
+
+def format_measurement(measurement: Measurement) -> str:
+    peak_memory = (
+        f"{measurement.peak_memory / 2 ** 20:>9.2f} MiB"
+        if measurement.peak_memory is not None
+        else f"{'-':>13}"
+    )
+
+    peak_rss = (
+        f"{measurement.peak_rss / 2 ** 20:>9.2f} MiB RSS"
+        if measurement.peak_rss is not None
+        else f"{'-':>17}"
+    )
+
+    return (
+        f"{measurement.day:<24} {measurement.part} {measurement.solver:<36} {measurement.engine:<10} "
+        f"{measurement.input:<12} x{measurement.scale:<5} "
+        f"parse {measurement.parse_median * 1000:>10.3f} ms  "
+        f"solve {measurement.solve_median * 1000:>10.3f} ms  "
+        f"{measurement.ops_per_second:>10.2f} ops/s  "
+        f"{peak_memory}  {peak_rss}"
+    )
+# END format_measurement
+
+
+def format_import_report(report: ImportReport) -> str:
+    over_budget = "  over budget" if report.over_budget else ""
+    slowest = ", ".join(f"{time.module} {time.self_time * 1000:.1f} ms" for time in report.slowest)
+
+    return (
+        f"{report.module:<48} import {report.import_time * 1000:>8.1f} ms  "
+        f"package {report.package_time * 1000:>7.1f} ms  "
+        f"wall {report.wall_time * 1000:>8.1f} ms{over_budget}\n"
+        f"    slowest: {slowest}"
+    )
+# END format_import_report
+
+
+def run_imports(days: List[str], repeat: int) -> int:
+    """
+    Reports the start up time of the command line and the import time of every day module, against their budgets.
+    Returns 1 if any of them is over budget.
+    """
+
+    startup_time = measure_startup(repeat)
+    over_budget = startup_time > STARTUP_BUDGET
+
+    print(f"{'command line start up':<48} wall {startup_time * 1000:>8.1f} ms{'  over budget' if over_budget else ''}", flush=True)
+
+    for module in day_modules(days):
+        report = measure_import(module, repeat)
+        over_budget = over_budget or report.over_budget
+
+        print(format_import_report(report), flush=True)
+    # END LOOP
+
+    return 1 if over_budget else 0
+# END run_imports
+
+
+def parse_scales(value: str) -> List[int]:
+    return [int(scale) for scale in value.split(",")]
+# END parse_scales
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(
+        prog="python -m thijs.benchmarks",
+        description="Times every solver on the bundled inputs and on scaled up copies of them."
+    )
+    parser.add_argument("days", nargs="*", metavar="day", help="the days to benchmark, all days if omitted")
+    parser.add_argument("-p", "--part", dest="parts", type=int, action="append", help="the parts to benchmark, all parts if omitted")
+    parser.add_argument("-e", "--engine", dest="engines", action="append", help="the engines to benchmark, every engine of a day side by side if omitted")
+    parser.add_argument("--scales", type=parse_scales, default=list(SCALES), help="comma separated input scales (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per measurement (default: %(default)s)")
+    parser.add_argument("--budget", type=float, default=10.0, help="seconds a single run may take before larger scales are skipped (default: %(default)s)")
+    parser.add_argument("--slow", action="store_true", help="include inputs that take minutes to solve")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the memory measurements, which run every solver once more in a fresh process")
+    parser.add_argument("--imports", action="store_true", help="report the start up and import times of the day modules against their budget, rather than time the solvers")
+    parser.add_argument("-o", "--output", default="benchmark.json", help="where to write the JSON report (default: %(default)s)")
+
+    arguments = parser.parse_args(argv)
+
+    if arguments.imports:
+        return run_imports(arguments.days or list_days(), arguments.repeat)
+    # END IF
+
+    cases = [
+        case for case in CASES
+        if (not arguments.days or case.day in arguments.days)
+        and (not arguments.parts or case.part in arguments.parts)
+    ]
+
+    measurements: List[Measurement] = []
+
+    for measurement in run_suite(cases, arguments.scales, arguments.repeat, arguments.budget, arguments.slow, arguments.memory, arguments.engines):
+        print(format_measurement(measurement), flush=True)
+        measurements.append(measurement)
+    # END LOOP
+
+    write_report(measurements, arguments.output)
+
+    return 0
+# END main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+# END MAIN
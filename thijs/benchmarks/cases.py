@@ -0,0 +1,216 @@
+from dataclasses import dataclass, field
+from os import makedirs, path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+InputName = str
+
+# The name of the input that is synthesized by `thijs.generators` at every scale, rather than copied from a bundled one
+GENERATED: InputName = "generated"
+Parameters = Dict[str, Any]
+Scaler = Callable[[str, str, int], None]
+
+
+def read_text(source: str) -> str:
+    with open(source) as file:
+        return file.read()
+    # END WITH file
+# END read_text
+
+
+def write_text(target: str, text: str):
+    with open(target, "w") as file:
+        file.write(text)
+    # END WITH file
+# END write_text
+
+
+def repeat_lines(source: str, target: str, factor: int, separator: str = "\n"):
+    """
+    Writes the content of `source` to `target` `factor` times, joined by the given `separator`.
+    """
+
+    text = read_text(source).rstrip("\n")
+    write_text(target, separator.join(text for _ in range(factor)))
+# END repeat_lines
+
+
+def repeat_blocks(source: str, target: str, factor: int):
+    """
+    Repeats an input made of blocks that are separated by an empty line.
+    """
+
+    repeat_lines(source, target, factor, separator="\n\n")
+# END repeat_blocks
+
+
+def repeat_pattern(source: str, target: str, factor: int):
+    """
+    Repeats an input that consists of a single line without a trailing newline.
+    """
+
+    write_text(target, read_text(source).strip("\n") * factor)
+# END repeat_pattern
+
+
+def tile_columns(source: str, target: str, factor: int, replacements: Optional[Dict[str, str]] = None):
+    """
+    Makes every row of a grid `factor` times wider by tiling it.
+    The given `replacements` are applied to every tile but the leftmost one, to keep markers unique.
+    """
+
+    rows = read_text(source).rstrip("\n").split("\n")
+    translation = str.maketrans(replacements or {})
+
+    write_text(target, "\n".join(
+        row + row.translate(translation) * (factor - 1)
+        for row in rows
+    ))
+# END tile_columns
+
+
+def tile_height_map(source: str, target: str, factor: int):
+    tile_columns(source, target, factor, replacements={"S": "a", "E": "z"})
+# END tile_height_map
+
+
+def stack_rock_paths(source: str, target: str, factor: int):
+    """
+    Stacks copies of the rock paths below each other, so the cave becomes `factor` times deeper.
+    """
+
+    rock_paths = read_text(source).rstrip("\n").split("\n")
+    depth = 2 + max(
+        int(point.split(",")[1])
+        for rock_path in rock_paths
+        for point in rock_path.split(" -> ")
+    )
+
+    def shift(rock_path: str, dy: int) -> str:
+        points = (point.split(",") for point in rock_path.split(" -> "))
+        return " -> ".join(f"{x},{int(y) + dy}" for x, y in points)
+    # END shift
+
+    write_text(target, "\n".join(
+        shift(rock_path, copy * depth)
+        for copy in range(factor)
+        for rock_path in rock_paths
+    ))
+# END stack_rock_paths
+
+
+def renumber_monkeys(source: str, target: str, factor: int):
+    """
+    Adds `factor - 1` copies of the group of monkeys, which only throw items within their own group.
+    """
+
+    blocks = read_text(source).strip("\n").split("\n\n")
+    n_monkeys = len(blocks)
+
+    def offset(line: str, copy: int) -> str:
+        if not line.lstrip().startswith("If"):
+            return line
+        # END IF
+
+        prefix, partner = line.rsplit(" ", 1)
+        return f"{prefix} {int(partner) + copy * n_monkeys}"
+    # END offset
+
+    write_text(target, "\n\n".join(
+        "\n".join(offset(line, copy) for line in block.split("\n"))
+        for copy in range(factor)
+        for block in blocks
+    ))
+# END renumber_monkeys
+
+
+def balance_moves(source: str, target: str, factor: int):
+    """
+    Repeats the moves of the crane, alternated with the moves that undo them, so no stack runs empty.
+    Expects `source` to be a directory holding a `crates` and a `moves` file.
+    """
+
+    makedirs(target, exist_ok=True)
+
+    write_text(path.join(target, "crates"), read_text(path.join(source, "crates")))
+
+    moves = read_text(path.join(source, "moves")).rstrip("\n").split("\n")
+
+    def undo(move: str) -> str:
+        _, quantity, _, source, _, target = move.split(" ")
+        return f"move {quantity} from {target} to {source}"
+    # END undo
+
+    undo_moves = [undo(move) for move in reversed(moves)]
+
+    write_text(path.join(target, "moves"), "\n".join(
+        "\n".join(undo_moves if copy % 2 else moves)
+        for copy in range(factor)
+    ))
+# END balance_moves
+
+
+@dataclass
+class Case:
+    day: str
+    part: int
+
+    # The function that does the heavy lifting in `solve`, used to label the results
+    solver: str
+
+    inputs: Tuple[InputName, ...] = ("data", "sample_data", GENERATED)
+
+    # Inputs that take too long for a regular run, only included on request
+    slow_inputs: Tuple[InputName, ...] = ()
+
+    scaler: Scaler = repeat_lines
+    parameters: Dict[InputName, Parameters] = field(default_factory=dict)
+# END Case
+
+
+CASES: List[Case] = [
+    Case("calorie_counting", 1, "find_largest_total_calories", scaler=repeat_blocks),
+    Case("calorie_counting", 2, "find_total_calories_for_top_elves", scaler=repeat_blocks),
+    Case("rock_paper_scissors", 1, "calculate_total_score"),
+    Case("rock_paper_scissors", 2, "calculate_total_score"),
+    Case("rucksack_reorganization", 1, "get_total_priority"),
+    Case("rucksack_reorganization", 2, "get_total_priority"),
+    Case("camp_cleanup", 1, "sections_are_subset"),
+    Case("camp_cleanup", 2, "sections_overlap"),
+    Case("supply_stacks", 1, "apply_moves", scaler=balance_moves),
+    Case("supply_stacks", 2, "apply_moves", scaler=balance_moves),
+    Case("tuning_trouble", 1, "SignalReader.read_packets", scaler=repeat_pattern),
+    Case("tuning_trouble", 2, "SignalReader.read_packets", scaler=repeat_pattern),
+    Case("no_space_left_on_device", 1, "Directory.tree"),
+    Case("no_space_left_on_device", 2, "Directory.tree"),
+    Case("treetop_tree_house", 1, "Tree.is_visible", scaler=tile_columns),
+    Case("treetop_tree_house", 2, "Tree.scenic_score", scaler=tile_columns),
+    Case("rope_bridge", 1, "track_bridge"),
+    Case("rope_bridge", 2, "track_bridge"),
+    Case("cathode_ray_tube", 1, "ClockCircuit.__iter__"),
+    Case("cathode_ray_tube", 2, "render_pixels"),
+    Case("monkey_in_the_middle", 1, "Game.play_round", scaler=renumber_monkeys),
+    Case("monkey_in_the_middle", 2, "Game.play_round", scaler=renumber_monkeys),
+    Case("hill_climbing_algorithm", 1, "shortest_path", scaler=tile_height_map),
+    Case("hill_climbing_algorithm", 2, "shortest_path", scaler=tile_height_map),
+    Case("distress_signal", 1, "is_ordered", scaler=repeat_blocks),
+    Case("distress_signal", 2, "is_ordered", scaler=repeat_blocks),
+    Case("regolith_reservoir", 1, "CaveSystem.simulate_sand", scaler=stack_rock_paths),
+    Case("regolith_reservoir", 2, "CaveSystem.simulate_sand", scaler=stack_rock_paths),
+    Case(
+        "beacon_exclusion_zone", 1, "calculate_segments",
+        parameters={"sample_data": {"y": 10}}
+    ),
+    Case(
+        "beacon_exclusion_zone", 2, "find_missing_beacon",
+        inputs=("sample_data",),
+        slow_inputs=("data", GENERATED),
+        parameters={"sample_data": {"limit": 20}}
+    ),
+    Case("proboscidea_volcanium", 1, "find_max_pressure_release"),
+    Case(
+        "proboscidea_volcanium", 2, "find_max_pressure_release",
+        inputs=("sample_data",),
+        slow_inputs=("data", GENERATED)
+    ),
+    Case("pyroclastic_flow", 1, "simulate_falling_rocks", scaler=repeat_pattern),
+]
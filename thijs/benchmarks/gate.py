@@ -0,0 +1,303 @@
+import json
+import sys
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+from os import makedirs, path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..runner import REFERENCE_ENGINE, Engine
+from .__main__ import parse_scales
+from .cases import CASES, Case, InputName
+from .suite import Measurement, run_suite
+
+BASELINES_PATH = path.join(path.dirname(__file__), "baselines")
+
+# The gate runs on the bundled sizes only, so it is quick enough to run before every merge
+GATE_SCALES = (1,)
+
+# The measured values that are compared against the baseline, by whether they are timings
+METRICS: Dict[str, bool] = {
+    "parse_median": True,
+    "solve_median": True,
+    "peak_memory": False,
+}
+
+# The input, scale and engine of a measurement
+BaselineKey = Tuple[InputName, int, Engine]
+Baselines = Dict[BaselineKey, dict]
+
+
+@dataclass
+class Tolerance:
+    # The relative increase over the baseline that is still accepted, for timings and for memory
+    time: float = 0.50
+    memory: float = 0.10
+
+    # The absolute increase below which a difference counts as noise, in seconds and in bytes
+    min_time: float = 0.005
+    min_memory: int = 64 * 2 ** 10
+# END Tolerance
+
+
+@dataclass
+class Comparison:
+    day: str
+    part: int
+    input: InputName
+    scale: int
+    metric: str
+
+    # The baseline is `None` for a measurement that has no baseline yet
+    baseline: Optional[float]
+    current: Optional[float]
+    regressed: bool
+
+    engine: Engine = REFERENCE_ENGINE
+
+    @property
+    def change(self) -> Optional[float]:
+        if not self.baseline or self.current is None:
+            return None
+        # END IF
+
+        return self.current / self.baseline - 1
+    # END change
+# END Comparison
+
+
+def baseline_path(day: str, part: int) -> str:
+    return path.join(BASELINES_PATH, f"{day}.part_{part}.json")
+# END baseline_path
+
+
+def load_baselines(day: str, part: int) -> Baselines:
+    """
+    Reads the baselines of the given `day` and `part`, keyed by input, scale and engine.
+    A part without a baseline file has no baselines, rather than failing the gate.
+    Entries without an engine belong to the reference engine.
+    """
+
+    try:
+        with open(baseline_path(day, part)) as file:
+            entries = json.load(file)
+        # END WITH file
+    except FileNotFoundError:
+        return {}
+    # END TRY
+
+    return {(entry["input"], entry["scale"], entry.get("engine", REFERENCE_ENGINE)): entry for entry in entries}
+# END load_baselines
+
+
+def round_metric(metric: str, value: Optional[float]) -> Optional[float]:
+    """
+    Rounds timings to the microsecond, which is well below the noise of a measurement.
+    """
+
+    if value is None or not METRICS[metric]:
+        return value
+    # END IF
+
+    return round(value, 6)
+# END round_metric
+
+
+def write_baselines(day: str, part: int, measurements: Iterable[Measurement]):
+    """
+    Replaces the baselines of the given `day` and `part`, keeping those of inputs and scales that were not measured.
+    """
+
+    baselines = load_baselines(day, part)
+
+    for measurement in measurements:
+        # The engine is left out for the reference engine, which the baselines had to themselves at first
+        engine = {"engine": measurement.engine} if measurement.engine != REFERENCE_ENGINE else {}
+
+        baselines[(measurement.input, measurement.scale, measurement.engine)] = {
+            "input": measurement.input,
+            "scale": measurement.scale,
+            **engine,
+            "answer": measurement.answer,
+            **{metric: round_metric(metric, getattr(measurement, metric)) for metric in METRICS}
+        }
+    # END LOOP
+
+    makedirs(BASELINES_PATH, exist_ok=True)
+
+    with open(baseline_path(day, part), "w") as file:
+        json.dump([baselines[key] for key in sorted(baselines)], file, indent=2)
+        file.write("\n")
+    # END WITH file
+# END write_baselines
+
+
+def is_regression(baseline: float, current: float, is_time: bool, tolerance: Tolerance) -> bool:
+    relative, minimum = (
+        (tolerance.time, tolerance.min_time)
+        if is_time
+        else (tolerance.memory, tolerance.min_memory)
+    )
+
+    return current > baseline * (1 + relative) and current - baseline > minimum
+# END is_regression
+
+
+def compare(measurement: Measurement, baseline: Optional[dict], tolerance: Tolerance) -> Iterable[Comparison]:
+    """
+    Compares every metric of `measurement` against its `baseline`.
+    A changed answer counts as a regression of its own, since the timings of a wrong solver mean little.
+    """
+
+    def comparison(metric: str, baseline_value: Optional[float], current: Optional[float], regressed: bool) -> Comparison:
+        return Comparison(
+            day=measurement.day,
+            part=measurement.part,
+            input=measurement.input,
+            scale=measurement.scale,
+            metric=metric,
+            engine=measurement.engine,
+            baseline=baseline_value,
+            current=current,
+            regressed=regressed
+        )
+    # END comparison
+
+    if baseline is None:
+        for metric in METRICS:
+            yield comparison(metric, None, getattr(measurement, metric), False)
+        # END LOOP
+        return
+    # END IF
+
+    if baseline["answer"] != measurement.answer:
+        yield comparison("answer", None, None, True)
+    # END IF
+
+    for metric, is_time in METRICS.items():
+        baseline_value = baseline.get(metric)
+        current = getattr(measurement, metric)
+
+        regressed = (
+            baseline_value is not None
+            and current is not None
+            and is_regression(baseline_value, current, is_time, tolerance)
+        )
+
+        yield comparison(metric, baseline_value, current, regressed)
+    # END LOOP
+# END compare
+
+
+def run_gate(cases: Sequence[Case], tolerance: Tolerance, scales: Sequence[int] = GATE_SCALES, repeat: int = 5, update: bool = False) -> Iterable[Comparison]:
+    """
+    Measures every case and compares it against the stored baselines, or replaces them if `update` is set.
+    """
+
+    for case in cases:
+        baselines = load_baselines(case.day, case.part)
+        measurements = list(run_suite([case], scales, repeat, budget=float("inf")))
+
+        for measurement in measurements:
+            yield from compare(measurement, baselines.get((measurement.input, measurement.scale, measurement.engine)), tolerance)
+        # END LOOP
+
+        if update:
+            write_baselines(case.day, case.part, measurements)
+        # END IF
+    # END LOOP
+# END run_gate
+
+
+def format_value(value: Optional[float], metric: str) -> str:
+    if value is None:
+        return f"{'-':>12}"
+    # END IF
+
+    if METRICS.get(metric, False):
+        return f"{value * 1000:>9.3f} ms"
+    # END IF
+
+    return f"{value / 2 ** 20:>8.2f} MiB"
+# END format_value
+
+
+def format_comparison(comparison: Comparison) -> str:
+    if comparison.metric == "answer":
+        status = "CHANGED"
+    elif comparison.baseline is None:
+        status = "new"
+    elif comparison.regressed:
+        status = "REGRESSED"
+    else:
+        status = "ok"
+    # END IF
+
+    change = f"{comparison.change:>+8.1%}" if comparison.change is not None else f"{'':>8}"
+    engine = f" [{comparison.engine}]" if comparison.engine != REFERENCE_ENGINE else ""
+
+    return (
+        f"{comparison.day:<24} {comparison.part}{engine} {comparison.input:<12} x{comparison.scale:<5} "
+        f"{comparison.metric:<13} {format_value(comparison.baseline, comparison.metric)} "
+        f"-> {format_value(comparison.current, comparison.metric)}  {change}  {status}"
+    )
+# END format_comparison
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(
+        prog="python -m thijs.benchmarks.gate",
+        description="Compares the benchmarks against the committed baselines and fails on a regression."
+    )
+    parser.add_argument("days", nargs="*", metavar="day", help="the days to check, all days if omitted")
+    parser.add_argument("-p", "--part", dest="parts", type=int, action="append", help="the parts to check, all parts if omitted")
+    parser.add_argument("--scales", type=parse_scales, default=list(GATE_SCALES), help="comma separated input scales (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per measurement (default: %(default)s)")
+    parser.add_argument("--tolerance", type=float, default=Tolerance.time, help="the accepted relative slowdown (default: %(default)s)")
+    parser.add_argument("--memory-tolerance", type=float, default=Tolerance.memory, help="the accepted relative growth of the peak memory (default: %(default)s)")
+    parser.add_argument("--min-time", type=float, default=Tolerance.min_time, help="seconds of slowdown that count as noise (default: %(default)s)")
+    parser.add_argument("--update", action="store_true", help="write the measurements as the new baselines, rather than fail on a regression")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per comparison")
+
+    arguments = parser.parse_args(argv)
+
+    cases = [
+        case for case in CASES
+        if (not arguments.days or case.day in arguments.days)
+        and (not arguments.parts or case.part in arguments.parts)
+    ]
+
+    tolerance = Tolerance(
+        time=arguments.tolerance,
+        memory=arguments.memory_tolerance,
+        min_time=arguments.min_time
+    )
+
+    n_regressions = 0
+
+    for comparison in run_gate(cases, tolerance, arguments.scales, arguments.repeat, arguments.update):
+        n_regressions += comparison.regressed
+
+        if arguments.json:
+            print(json.dumps(asdict(comparison)), flush=True)
+        else:
+            print(format_comparison(comparison), flush=True)
+        # END IF
+    # END LOOP
+
+    if arguments.update:
+        print(f"Updated the baselines in {BASELINES_PATH}", file=sys.stderr)
+        return 0
+    # END IF
+
+    if n_regressions:
+        print(f"{n_regressions} regressions against the baselines", file=sys.stderr)
+        return 1
+    # END IF
+
+    return 0
+# END main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+# END MAIN
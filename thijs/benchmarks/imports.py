@@ -0,0 +1,184 @@
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from os import environ, path
+from time import perf_counter
+from typing import Iterable, Iterator, List, Sequence
+
+from ..runner import COMBINED_MODULE, PACKAGE_PATH, list_modules, list_parts
+
+# Every line that `-X importtime` writes looks like `import time: <self us> | <cumulative us> | <module>`, with the
+# module indented by two spaces for every level it is nested below the import that was timed
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| (?P<indent>\s*)(?P<module>\S+)")
+
+# The seconds a fresh interpreter may take to import a single day module, and to start the command line
+IMPORT_BUDGET = 0.060
+STARTUP_BUDGET = 0.100
+
+# The command whose start up is timed, since it imports the runner and caches but no day
+STARTUP_COMMAND = ("-m", "thijs", "list")
+
+
+@dataclass
+class ImportTime:
+    module: str
+    depth: int
+
+    # In seconds, for the module on its own and including the modules it imported first
+    self_time: float
+    cumulative_time: float
+# END ImportTime
+
+
+@dataclass
+class ImportReport:
+    module: str
+
+    # The cumulative import time of the module, and the wall time of a fresh interpreter that imports it
+    import_time: float
+    wall_time: float
+
+    # The time spent in the modules of the package itself, rather than in the standard library
+    package_time: float
+
+    # Whether the import time exceeds the budget
+    over_budget: bool
+
+    # The modules with the largest import time of their own
+    slowest: List[ImportTime] = field(default_factory=list)
+# END ImportReport
+
+
+def parse_import_times(output: str) -> List[ImportTime]:
+    """
+    Reads the import times from the standard error of an interpreter that ran with `-X importtime`.
+    """
+
+    return [
+        ImportTime(
+            module=matches.group("module"),
+            depth=len(matches.group("indent")) // 2,
+            self_time=int(matches.group("self")) / 1e6,
+            cumulative_time=int(matches.group("cumulative")) / 1e6
+        )
+        for matches in map(IMPORT_TIME_PATTERN.match, output.splitlines())
+        if matches is not None
+    ]
+# END parse_import_times
+
+
+def import_subtree(times: List[ImportTime], module: str) -> List[ImportTime]:
+    """
+    Returns the times of `module` and of the modules it imported, which `-X importtime` lists right before it.
+    The modules the interpreter imports at start up are left out.
+    """
+
+    end = next(index for index, time in enumerate(times) if time.module == module and time.depth == 0)
+    start = end
+
+    while start > 0 and times[start - 1].depth > 0:
+        start -= 1
+    # END LOOP
+
+    return times[start:end + 1]
+# END import_subtree
+
+
+def run_interpreter(arguments: Sequence[str], write_bytecode: bool = False) -> subprocess.CompletedProcess:
+    """
+    Runs a fresh interpreter from the root of the repository, so the package is importable.
+    """
+
+    environment = dict(environ)
+
+    if write_bytecode:
+        environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    # END IF
+
+    return subprocess.run(
+        [sys.executable, *arguments],
+        cwd=path.dirname(PACKAGE_PATH),
+        env=environment,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True
+    )
+# END run_interpreter
+
+
+def time_interpreter(arguments: Sequence[str], repeat: int) -> float:
+    """
+    Returns the quickest wall time of `repeat` runs of a fresh interpreter with the given `arguments`.
+    A first run that is not timed writes the bytecode of every module, so the timed runs do not compile anything.
+    """
+
+    run_interpreter(arguments, write_bytecode=True)
+
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = perf_counter()
+        run_interpreter(arguments)
+        best = min(best, perf_counter() - start)
+    # END LOOP
+
+    return best
+# END time_interpreter
+
+
+def measure_import(module: str, repeat: int = 5, top: int = 5, budget: float = IMPORT_BUDGET) -> ImportReport:
+    """
+    Times the import of `module` in fresh interpreters, and lists the modules that took longest to import.
+    The import time is that of the quickest of `repeat` runs, since start up time is noisy.
+    """
+
+    wall_time = time_interpreter(["-c", f"import {module}"], repeat)
+    runs = [
+        import_subtree(parse_import_times(run_interpreter(["-X", "importtime", "-c", f"import {module}"]).stderr), module)
+        for _ in range(repeat)
+    ]
+
+    # The module is timed last, so its cumulative time covers everything it imported
+    times = min(runs, key=lambda run: run[-1].cumulative_time)
+    import_time = times[-1].cumulative_time
+    package = module.split(".")[0]
+
+    return ImportReport(
+        module=module,
+        import_time=import_time,
+        wall_time=wall_time,
+        package_time=sum(time.self_time for time in times if time.module.split(".")[0] == package),
+        over_budget=import_time > budget,
+        slowest=sorted(times, key=lambda time: time.self_time, reverse=True)[:top]
+    )
+# END measure_import
+
+
+def measure_startup(repeat: int = 5) -> float:
+    """
+    Returns the quickest wall time of the command line, listing the days, in a fresh interpreter.
+    """
+
+    return time_interpreter(STARTUP_COMMAND, repeat)
+# END measure_startup
+
+
+def day_modules(days: Iterable[str]) -> Iterator[str]:
+    """
+    Yields the name of every part module, and of the combined module, of the given `days`.
+    """
+
+    package = path.basename(PACKAGE_PATH)
+
+    for day in days:
+        for part in list_parts(day):
+            yield f"{package}.{day}.part_{part}"
+        # END LOOP
+
+        if COMBINED_MODULE in list_modules(path.join(PACKAGE_PATH, day)):
+            yield f"{package}.{day}.{COMBINED_MODULE}"
+        # END IF
+    # END LOOP
+# END day_modules
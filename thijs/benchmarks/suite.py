@@ -0,0 +1,259 @@
+import json
+import platform
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from math import log
+from os import devnull, path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from ..generators import DEFAULT_SIZES, generate
+from ..memory import MemoryReport, measure_memory_isolated
+from ..runner import (PACKAGE_PATH, REFERENCE_ENGINE, Engine, input_size,
+                      is_available, list_engine_parts, list_engines, load_part)
+from .cases import GENERATED, Case, InputName
+
+SCALES = (1, 10, 100, 1000)
+
+
+@dataclass
+class Measurement:
+    day: str
+    part: int
+    solver: str
+    input: InputName
+    scale: int
+    input_bytes: int
+    answer: str
+
+    # The number of timed runs, which is lower than requested when a run exceeds the time budget
+    repeat: int
+
+    parse_median: float
+    solve_median: float
+    solve_min: float
+    solve_max: float
+    ops_per_second: float
+
+    # The peak of the memory traced while parsing and solving, or `None` if it was not measured
+    peak_memory: Optional[int]
+
+    # The peak resident set size of a fresh process that parsed and solved the input once
+    peak_rss: Optional[int] = None
+
+    # The number of objects held by the parsed input, and of garbage collections per generation
+    n_objects: Optional[int] = None
+    gc_collections: Optional[List[int]] = None
+
+    # The engine that solved the input
+    engine: Engine = REFERENCE_ENGINE
+# END Measurement
+
+
+def find_input(case: Case, name: InputName) -> Optional[str]:
+    """
+    Returns the path of the bundled input with the given `name` for the day of `case`, if it exists.
+    The generated input has no source, so its name is returned as is.
+    """
+
+    if name == GENERATED:
+        return GENERATED
+    # END IF
+
+    if name == "data":
+        return load_part(case.day, case.part).INPUT_PATH
+    # END IF
+
+    candidate = path.join(PACKAGE_PATH, case.day, name)
+
+    return candidate if path.exists(candidate) else None
+# END find_input
+
+
+def prepare_input(case: Case, name: InputName, source: str, scale: int, directory: str) -> str:
+    """
+    Returns the path of the input `source` scaled up `scale` times, writing it to `directory` if needed.
+    The generated input is synthesized at `scale` times the size of the bundled data instead.
+    """
+
+    if scale == 1 and name != GENERATED:
+        return source
+    # END IF
+
+    target = path.join(directory, f"{case.day}.{name}.x{scale}")
+
+    if path.exists(target):
+        return target
+    # END IF
+
+    if name == GENERATED:
+        generate(case.day, target, DEFAULT_SIZES[case.day] * scale)
+    else:
+        case.scaler(source, target, scale)
+    # END IF
+
+    return target
+# END prepare_input
+
+
+def measure(case: Case, name: InputName, input_path: str, scale: int, repeat: int, budget: float, memory: bool = True, engine: Engine = REFERENCE_ENGINE) -> Measurement:
+    """
+    Times `repeat` runs of the parse and solve phases of `case` on the given input, with the given `engine`.
+    Stops repeating once a single run takes longer than `budget` seconds.
+    """
+
+    module = load_part(case.day, case.part, engine)
+    parameters = case.parameters.get(name, {})
+
+    parse_times: List[float] = []
+    solve_times: List[float] = []
+    answer = None
+    over_budget = False
+
+    # Some solvers narrate their progress, which would drown out the report
+    with open(devnull, "w") as sink, redirect_stdout(sink):
+        for _ in range(repeat):
+            start = perf_counter()
+            parsed = module.parse(input_path)
+            parsed_at = perf_counter()
+            answer = module.solve(parsed, **parameters)
+            solved_at = perf_counter()
+
+            parse_times.append(parsed_at - start)
+            solve_times.append(solved_at - parsed_at)
+
+            if solved_at - start > budget:
+                over_budget = True
+                break
+            # END IF
+        # END LOOP
+
+    # END WITH sink
+
+    report: Optional[MemoryReport] = None
+
+    if memory and not over_budget:
+        _, report = measure_memory_isolated(case.day, case.part, input_path, parameters, engine=engine)
+    # END IF
+
+    solve_median = median(solve_times)
+
+    return Measurement(
+        day=case.day,
+        part=case.part,
+        solver=case.solver,
+        input=name,
+        scale=scale,
+        input_bytes=input_size(input_path),
+        answer=str(answer),
+        repeat=len(solve_times),
+        parse_median=median(parse_times),
+        solve_median=solve_median,
+        solve_min=min(solve_times),
+        solve_max=max(solve_times),
+        ops_per_second=1 / solve_median if solve_median > 0 else float("inf"),
+        peak_memory=report.peak if report is not None else None,
+        peak_rss=report.peak_rss if report is not None else None,
+        n_objects=report.n_objects if report is not None else None,
+        gc_collections=report.gc_collections if report is not None else None,
+        engine=engine
+    )
+# END measure
+
+
+def project_run_time(measurements: Sequence[Measurement], scale: int) -> float:
+    """
+    Estimates the run time at the given `scale` from the growth observed over the previous `measurements`.
+    Assumes the run time grows at least linearly with the input size.
+    """
+
+    *_, last = measurements
+    run_time = last.parse_median + last.solve_median
+    exponent = 1.0
+
+    if len(measurements) > 1:
+        previous = measurements[-2]
+        previous_run_time = previous.parse_median + previous.solve_median
+
+        if previous_run_time > 0 and run_time > 0:
+            exponent = max(1.0, log(run_time / previous_run_time) / log(last.scale / previous.scale))
+        # END IF
+    # END IF
+
+    return run_time * (scale / last.scale) ** exponent
+# END project_run_time
+
+
+def case_engines(case: Case, engines: Optional[Sequence[Engine]] = None) -> List[Engine]:
+    """
+    Lists the available engines of the day of `case` that solve its part, limited to the given `engines` if any.
+    """
+
+    return [
+        engine
+        for engine in list_engines(case.day)
+        if (engines is None or engine in engines)
+        and case.part in list_engine_parts(case.day, engine)
+        and is_available(case.day, engine)
+    ]
+# END case_engines
+
+
+def run_suite(cases: Iterable[Case], scales: Sequence[int] = SCALES, repeat: int = 5, budget: float = 10.0, include_slow: bool = False, memory: bool = True, engines: Optional[Sequence[Engine]] = None) -> Iterator[Measurement]:
+    """
+    Measures every case on each of its inputs, at every given scale, with every engine of its day side by side.
+    A case is not measured at a larger scale once a run at that scale is expected to exceed the time `budget` in
+    seconds, for every engine on its own.
+    """
+
+    with TemporaryDirectory(prefix="thijs-benchmarks-") as directory:
+        for case in cases:
+            names = case.inputs + (case.slow_inputs if include_slow else ())
+            selected_engines = case_engines(case, engines)
+
+            for name in names:
+                source = find_input(case, name)
+
+                if source is None:
+                    continue
+                # END IF
+
+                measurements: Dict[Engine, List[Measurement]] = {engine: [] for engine in selected_engines}
+
+                for scale in sorted(scales):
+                    input_path = None
+
+                    for engine, engine_measurements in measurements.items():
+                        if engine_measurements and project_run_time(engine_measurements, scale) > budget:
+                            continue
+                        # END IF
+
+                        input_path = input_path or prepare_input(case, name, source, scale, directory)
+                        measurement = measure(case, name, input_path, scale, repeat, budget, memory, engine)
+
+                        engine_measurements.append(measurement)
+
+                        yield measurement
+                    # END LOOP
+                # END LOOP
+            # END LOOP
+        # END LOOP
+    # END WITH directory
+# END run_suite
+
+
+def write_report(measurements: Iterable[Measurement], report_path: str):
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "measurements": [asdict(measurement) for measurement in measurements]
+    }
+
+    with open(report_path, "w") as file:
+        json.dump(report, file, indent=2)
+    # END WITH file
+# END write_report
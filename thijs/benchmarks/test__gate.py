@@ -0,0 +1,90 @@
+import json
+from dataclasses import replace
+
+from pytest import fixture
+
+from . import gate
+from .gate import (Tolerance, baseline_path, compare, load_baselines, main,
+                   write_baselines)
+from .suite import Measurement
+
+
+def measurement(solve_median: float, peak_memory: int = 2 ** 20, answer: str = "42") -> Measurement:
+    return Measurement(
+        "day", 1, "solver", "data", 1, 0, answer, 1,
+        0.001, solve_median, solve_median, solve_median, 1 / solve_median, peak_memory
+    )
+# END measurement
+
+
+@fixture
+def baselines_path(tmpdir, monkeypatch) -> str:
+    baselines_path = str(tmpdir.join("baselines"))
+    monkeypatch.setattr(gate, "BASELINES_PATH", baselines_path)
+    return baselines_path
+# END baselines_path
+
+
+def test__baselines(baselines_path):
+    assert load_baselines("day", 1) == {}
+
+    write_baselines("day", 1, [measurement(0.1)])
+
+    baseline = load_baselines("day", 1)[("data", 1, "reference")]
+
+    assert baseline["solve_median"] == 0.1
+    assert baseline["answer"] == "42"
+    assert "engine" not in baseline
+
+    # Every engine has a baseline of its own
+    write_baselines("day", 1, [replace(measurement(0.01), engine="fast")])
+
+    baselines = load_baselines("day", 1)
+
+    assert baselines[("data", 1, "reference")]["solve_median"] == 0.1
+    assert baselines[("data", 1, "fast")]["solve_median"] == 0.01
+# END test__baselines
+
+
+def test__compare():
+    tolerance = Tolerance(time=0.5, memory=0.1, min_time=0.005, min_memory=1024)
+    baseline = {"answer": "42", "parse_median": 0.001, "solve_median": 0.1, "peak_memory": 2 ** 20}
+
+    def regressed(current: Measurement):
+        return {comparison.metric for comparison in compare(current, baseline, tolerance) if comparison.regressed}
+    # END regressed
+
+    assert regressed(measurement(0.14)) == set()
+    assert regressed(measurement(0.3)) == {"solve_median"}
+    assert regressed(measurement(0.1, peak_memory=2 * 2 ** 20)) == {"peak_memory"}
+    assert regressed(measurement(0.1, answer="43")) == {"answer"}
+
+    # Slowdowns below the noise floor pass, however large they are relative to the baseline
+    assert regressed(measurement(0.1)) == set()
+    assert not any(comparison.regressed for comparison in compare(measurement(0.004), {**baseline, "solve_median": 0.001}, tolerance))
+
+    # Without a baseline nothing can regress
+    assert not any(comparison.regressed for comparison in compare(measurement(1.0), None, tolerance))
+# END test__compare
+
+
+def test__gate_command(baselines_path, capsys):
+    assert main(["rope_bridge", "--part", "1", "--repeat", "1", "--update"]) == 0
+    assert "new" in capsys.readouterr().out
+
+    # A generous tolerance keeps the noise of a second run from failing the test
+    assert main(["rope_bridge", "--part", "1", "--repeat", "1", "--tolerance", "100"]) == 0
+    assert "REGRESSED" not in capsys.readouterr().out
+
+    # Pretends the solver used to be a hundred times faster
+    with open(baseline_path("rope_bridge", 1)) as file:
+        entries = json.load(file)
+    # END WITH file
+
+    with open(baseline_path("rope_bridge", 1), "w") as file:
+        json.dump([{**entry, "solve_median": entry["solve_median"] / 100} for entry in entries], file)
+    # END WITH file
+
+    assert main(["rope_bridge", "--part", "1", "--repeat", "1"]) == 1
+    assert "REGRESSED" in capsys.readouterr().out
+# END test__gate_command
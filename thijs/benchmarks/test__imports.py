@@ -0,0 +1,72 @@
+import subprocess
+import sys
+from os import path
+
+from .imports import (day_modules, import_subtree, measure_import,
+                      parse_import_times)
+
+REPOSITORY_PATH = path.dirname(path.dirname(path.dirname(__file__)))
+
+# The modules that only some commands need, which a plain run of the command line must not import
+HEAVY_MODULES = ("asyncio", "concurrent.futures", "cProfile", "gzip", "multiprocessing", "pstats", "queue", "tempfile", "tracemalloc")
+
+IMPORT_TIMES = """\
+import time: self [us] | cumulative | imported package
+import time:       455 |        455 |   posix
+import time:      1157 |       1612 | site
+import time:       120 |        120 |     re._constants
+import time:       300 |        420 |   re
+import time:       200 |        620 | thijs.day.part_1
+"""
+
+
+def test__parse_import_times():
+    times = parse_import_times(IMPORT_TIMES)
+
+    assert [(time.module, time.depth) for time in times] == [
+        ("posix", 1),
+        ("site", 0),
+        ("re._constants", 2),
+        ("re", 1),
+        ("thijs.day.part_1", 0)
+    ]
+    assert times[-1].self_time == 0.0002
+    assert times[-1].cumulative_time == 0.00062
+# END test__parse_import_times
+
+
+def test__import_subtree():
+    times = parse_import_times(IMPORT_TIMES)
+
+    assert [time.module for time in import_subtree(times, "thijs.day.part_1")] == ["re._constants", "re", "thijs.day.part_1"]
+# END test__import_subtree
+
+
+def test__day_modules():
+    assert list(day_modules(["pyroclastic_flow", "rope_bridge"])) == [
+        "thijs.pyroclastic_flow.part_1",
+        "thijs.rope_bridge.part_1",
+        "thijs.rope_bridge.part_2",
+        "thijs.rope_bridge.combined"
+    ]
+# END test__day_modules
+
+
+def test__measure_import():
+    report = measure_import("thijs.rock_paper_scissors.part_1", repeat=1, top=3)
+
+    assert report.import_time > report.package_time > 0
+    assert report.wall_time > 0
+    assert len(report.slowest) == 3
+    assert all(time.depth > 0 or time.module == report.module for time in report.slowest)
+# END test__measure_import
+
+
+def test__heavy_modules_are_imported_lazily():
+    modules = ["thijs.__main__", *day_modules(["proboscidea_volcanium", "regolith_reservoir"])]
+    script = f"import sys, {', '.join(modules)}; print(' '.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+
+    output = subprocess.run([sys.executable, "-c", script], cwd=REPOSITORY_PATH, capture_output=True, text=True, check=True)
+
+    assert output.stdout.split() == []
+# END test__heavy_modules_are_imported_lazily
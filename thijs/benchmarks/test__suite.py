@@ -0,0 +1,134 @@
+import json
+from os import path
+
+from ..runner import REFERENCE_ENGINE
+from .cases import CASES, GENERATED, Case, balance_moves, repeat_blocks, stack_rock_paths
+from .suite import Measurement, project_run_time, run_suite, write_report
+
+PACKAGE_PATH = path.dirname(path.dirname(__file__))
+
+
+def test__every_part_has_a_case():
+    from ..runner import list_days, list_parts
+
+    expected = {(day, part) for day in list_days() for part in list_parts(day)}
+
+    assert {(case.day, case.part) for case in CASES} == expected
+# END test__every_part_has_a_case
+
+
+def test__run_suite(tmpdir):
+    case = Case("calorie_counting", 1, "find_largest_total_calories", inputs=("data",), scaler=repeat_blocks)
+
+    measurements = list(run_suite([case], scales=[1, 10], repeat=2, engines=[REFERENCE_ENGINE]))
+
+    assert [measurement.scale for measurement in measurements] == [1, 10]
+    assert all(measurement.answer == "72070" for measurement in measurements)
+    assert measurements[1].input_bytes > 9 * measurements[0].input_bytes
+    assert all(measurement.peak_memory for measurement in measurements)
+    assert all(measurement.peak_rss > measurement.peak_memory for measurement in measurements)
+    assert measurements[1].n_objects > measurements[0].n_objects
+
+    report_path = str(tmpdir.join("benchmark.json"))
+    write_report(measurements, report_path)
+
+    with open(report_path) as file:
+        report = json.load(file)
+    # END WITH file
+
+    assert len(report["measurements"]) == 2
+    assert report["measurements"][0]["solver"] == "find_largest_total_calories"
+    assert report["measurements"][0]["peak_rss"] == measurements[0].peak_rss
+# END test__run_suite
+
+
+def test__run_suite_generated():
+    case = Case("rope_bridge", 1, "track_bridge", inputs=(GENERATED,))
+
+    measurements = list(run_suite([case], scales=[1, 10], repeat=1, memory=False))
+
+    assert [measurement.input for measurement in measurements] == [GENERATED, GENERATED]
+    assert measurements[1].input_bytes > 9 * measurements[0].input_bytes
+# END test__run_suite_generated
+
+
+def test__run_suite_budget():
+    case = Case("calorie_counting", 2, "find_total_calories_for_top_elves", inputs=("data",), scaler=repeat_blocks)
+
+    measurements = list(run_suite([case], scales=[1, 1000], repeat=3, budget=0, memory=False, engines=[REFERENCE_ENGINE]))
+
+    assert [measurement.scale for measurement in measurements] == [1]
+    assert measurements[0].repeat == 1
+    assert measurements[0].peak_memory is None
+# END test__run_suite_budget
+
+
+def test__run_suite_engines():
+    case = Case("calorie_counting", 2, "find_total_calories_for_top_elves", inputs=("data",), scaler=repeat_blocks)
+
+    measurements = list(run_suite([case], scales=[1, 10], repeat=1, memory=False, engines=["reference", "fast"]))
+
+    assert [(measurement.engine, measurement.scale) for measurement in measurements] == [
+        ("reference", 1),
+        ("fast", 1),
+        ("reference", 10),
+        ("fast", 10)
+    ]
+    assert measurements[0].answer == measurements[1].answer == "211805"
+    assert measurements[0].input_bytes == measurements[1].input_bytes
+# END test__run_suite_engines
+
+
+def test__balance_moves(tmpdir):
+    from ..supply_stacks.part_1 import parse, solve
+
+    source = path.join(PACKAGE_PATH, "supply_stacks")
+    target = str(tmpdir.join("supply_stacks"))
+
+    balance_moves(source, target, 2)
+
+    # The second half of the moves undoes the first half
+    assert solve(parse(target)) == "".join(stack[-1] for stack in parse(source)[0])
+# END test__balance_moves
+
+
+def test__stack_rock_paths(tmpdir):
+    from ..regolith_reservoir.part_1 import parse
+
+    source = path.join(PACKAGE_PATH, "regolith_reservoir", "sample_data")
+    target = str(tmpdir.join("sample_data"))
+
+    stack_rock_paths(source, target, 2)
+
+    segments = parse(target)
+
+    assert len(segments) == 2 * len(parse(source))
+    assert max(y for _, (_, y) in segments) == 9 + 11
+# END test__stack_rock_paths
+
+
+def test__project_run_time():
+    def measurement(scale: int, run_time: float) -> Measurement:
+        return Measurement(
+            "day", 1, "solver", "data", scale, 0, "", 1,
+            0.0, run_time, run_time, run_time, 1 / run_time, None
+        )
+    # END measurement
+
+    # Without a trend the run time is assumed to grow linearly
+    assert project_run_time([measurement(1, 1.0)], 10) == 10.0
+
+    # A quadratic trend is extrapolated
+    assert project_run_time([measurement(1, 1.0), measurement(10, 100.0)], 100) == 10000.0
+# END test__project_run_time
+
+
+def test__measure_throughput():
+    from ..calorie_counting.part_1 import INPUT_PATH
+    from .throughput import READERS, measure_throughput
+
+    throughputs = list(measure_throughput("calorie_counting", INPUT_PATH, repeat=1))
+
+    assert [throughput.reader for throughput in throughputs] == [*READERS, "parse"]
+    assert all(throughput.megabytes_per_second > 0 for throughput in throughputs)
+# END test__measure_throughput
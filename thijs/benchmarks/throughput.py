@@ -0,0 +1,135 @@
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from os import path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from ..generators import DEFAULT_SIZES, generate
+from ..io import iter_lines, read_lines
+from ..runner import load_part
+from .suite import input_size
+
+Reader = Callable[[str], Iterable]
+
+# Days whose input is read line by line, rather than at once or as a pair of files
+LINE_DAYS = [
+    "calorie_counting",
+    "rock_paper_scissors",
+    "rucksack_reorganization",
+    "camp_cleanup",
+    "no_space_left_on_device",
+    "treetop_tree_house",
+    "rope_bridge",
+    "cathode_ray_tube",
+    "hill_climbing_algorithm",
+    "distress_signal",
+    "regolith_reservoir",
+    "beacon_exclusion_zone",
+    "proboscidea_volcanium",
+]
+
+
+def open_lines(input_path: str) -> Iterator[str]:
+    """
+    The way the readers used to iterate over lines, kept as the baseline to compare against.
+    """
+
+    with open(input_path) as file:
+        yield from (line.rstrip("\n") for line in file)
+    # END WITH file
+# END open_lines
+
+
+READERS: Dict[str, Reader] = {
+    "open": open_lines,
+    "read_lines": read_lines,
+    "iter_lines": iter_lines,
+}
+
+
+@dataclass
+class Throughput:
+    day: str
+    reader: str
+    input_bytes: int
+    seconds: float
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.input_bytes / 2 ** 20 / self.seconds if self.seconds > 0 else float("inf")
+    # END megabytes_per_second
+# END Throughput
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    times: List[float] = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+    # END LOOP
+
+    return min(times)
+# END best_time
+
+
+def measure_throughput(day: str, input_path: str, repeat: int = 3) -> Iterator[Throughput]:
+    """
+    Times every line reader on `input_path`, followed by the `parse` of the first part of `day`.
+    """
+
+    input_bytes = input_size(input_path)
+
+    for name, reader in READERS.items():
+        seconds = best_time(lambda: sum(1 for _ in reader(input_path)), repeat)
+        yield Throughput(day, name, input_bytes, seconds)
+    # END LOOP
+
+    module = load_part(day, 1)
+    seconds = best_time(lambda: module.parse(input_path), repeat)
+
+    yield Throughput(day, "parse", input_bytes, seconds)
+# END measure_throughput
+
+
+def format_throughput(throughput: Throughput) -> str:
+    return (
+        f"{throughput.day:<24} {throughput.reader:<10} "
+        f"{throughput.input_bytes / 2 ** 20:>9.2f} MiB  "
+        f"{throughput.seconds * 1000:>10.3f} ms  "
+        f"{throughput.megabytes_per_second:>9.2f} MB/s"
+    )
+# END format_throughput
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(
+        prog="python -m thijs.benchmarks.throughput",
+        description="Measures how fast the line readers and parsers get through large generated inputs."
+    )
+    parser.add_argument("days", nargs="*", metavar="day", help="the days to measure, all line based days if omitted")
+    parser.add_argument("--scale", type=int, default=100, help="the size of the generated input relative to the bundled data (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per reader, of which the fastest counts (default: %(default)s)")
+
+    arguments = parser.parse_args(argv)
+
+    with TemporaryDirectory(prefix="thijs-throughput-") as directory:
+        for day in arguments.days or LINE_DAYS:
+            input_path = generate(day, path.join(directory, day), DEFAULT_SIZES[day] * arguments.scale)
+
+            for throughput in measure_throughput(day, input_path, arguments.repeat):
+                print(format_throughput(throughput), flush=True)
+            # END LOOP
+        # END LOOP
+    # END WITH directory
+
+    return 0
+# END main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+# END MAIN
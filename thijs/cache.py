@@ -0,0 +1,321 @@
+import json
+from contextlib import suppress
+from dataclasses import dataclass, field
+from hashlib import sha256
+from inspect import getsourcefile, ismodule
+from os import environ, getpid, makedirs, path, remove, replace, scandir, utime
+from sys import modules
+from types import ModuleType
+from typing import Any, Iterator, List, Optional, Set
+
+from .io import CHUNK_SIZE, map_file
+from .sidecar import Codec, Parsed, SidecarFormatException
+
+CACHE_DIR_ENV = "THIJS_CACHE_DIR"
+DEFAULT_CACHE_DIR = path.join(path.expanduser("~"), ".cache", "thijs")
+
+# The total size of the cached entries, beyond which the least recently used ones are evicted
+DEFAULT_MAX_BYTES = 16 * 2 ** 20
+DEFAULT_MAX_PARSED_BYTES = 256 * 2 ** 20
+
+Key = str
+Answer = Any
+
+
+@dataclass
+class CacheEntry:
+    key: Key
+    answer: Answer
+# END CacheEntry
+
+
+def default_cache_dir() -> str:
+    return environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+# END default_cache_dir
+
+
+def default_parsed_cache_dir() -> str:
+    return path.join(default_cache_dir(), "parsed")
+# END default_parsed_cache_dir
+
+
+def hash_file(digest, file_path: str):
+    with map_file(file_path) as buffer:
+        for offset in range(0, len(buffer), CHUNK_SIZE):
+            digest.update(buffer[offset:offset + CHUNK_SIZE])
+        # END LOOP
+    # END WITH buffer
+# END hash_file
+
+
+def hash_input(input_path: str) -> str:
+    """
+    Hashes the bytes of the input at `input_path`.
+    A directory, like the `crates` and `moves` of `supply_stacks`, is hashed by the names and contents of its files.
+    """
+
+    digest = sha256()
+
+    if not path.isdir(input_path):
+        hash_file(digest, input_path)
+        return digest.hexdigest()
+    # END IF
+
+    for entry in sorted(scandir(input_path), key=lambda entry: entry.name):
+        if entry.is_file():
+            digest.update(entry.name.encode() + b"\0")
+            hash_file(digest, entry.path)
+            digest.update(b"\0")
+        # END IF
+    # END LOOP
+
+    return digest.hexdigest()
+# END hash_input
+
+
+def find_source_modules(module: ModuleType) -> List[ModuleType]:
+    """
+    Finds `module` and every module of this package that it uses, directly or through one of those modules.
+    """
+
+    package = __package__
+    found: List[ModuleType] = []
+    seen: Set[str] = set()
+    pending = [module]
+
+    while pending:
+        current = pending.pop()
+
+        if current.__name__ in seen:
+            continue
+        # END IF
+
+        seen.add(current.__name__)
+        found.append(current)
+
+        for value in vars(current).values():
+            name = value.__name__ if ismodule(value) else getattr(value, "__module__", None)
+
+            if isinstance(name, str) and name.startswith(f"{package}.") and name in modules:
+                pending.append(modules[name])
+            # END IF
+        # END LOOP
+    # END LOOP
+
+    return sorted(found, key=lambda found_module: found_module.__name__)
+# END find_source_modules
+
+
+def hash_source(module: ModuleType) -> str:
+    """
+    Hashes the source of `module` and of the modules of this package it depends on, so any change to the solver shows.
+    """
+
+    digest = sha256()
+
+    for source_module in find_source_modules(module):
+        source_file = getsourcefile(source_module)
+
+        digest.update(source_module.__name__.encode() + b"\0")
+
+        if source_file is not None:
+            hash_file(digest, source_file)
+        # END IF
+
+        digest.update(b"\0")
+    # END LOOP
+
+    return digest.hexdigest()
+# END hash_source
+
+
+def make_key(day: str, part: int, input_hash: str, source_hash: str) -> Key:
+    return sha256(f"{day}\0{part}\0{input_hash}\0{source_hash}".encode()).hexdigest()
+# END make_key
+
+
+@dataclass
+class DiskCache:
+    """
+    Stores entries on disk as one file per key.
+    Reading an entry marks it as recently used, and the least recently used entries are evicted
+    once the entries together take up more than `max_bytes`.
+    """
+
+    directory: str = field(default_factory=default_cache_dir)
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    # Tells the entries of different caches apart, should they share a directory
+    suffix = ".entry"
+
+    def entry_path(self, key: Key) -> str:
+        return path.join(self.directory, key + self.suffix)
+    # END entry_path
+
+    def read(self, key: Key) -> Optional[str]:
+        """
+        Returns the path of the entry for `key` if it exists, and marks it as used.
+        """
+
+        entry_path = self.entry_path(key)
+
+        try:
+            # The modification time doubles as the time of last use
+            utime(entry_path)
+        except OSError:
+            return None
+        # END TRY
+
+        return entry_path
+    # END read
+
+    def write(self, key: Key, content: bytes):
+        makedirs(self.directory, exist_ok=True)
+
+        # Writes to a temporary file first, so a concurrent reader never sees half an entry
+        temporary_path = f"{self.entry_path(key)}.{getpid()}.tmp"
+
+        with open(temporary_path, "wb") as file:
+            file.write(content)
+        # END WITH file
+
+        replace(temporary_path, self.entry_path(key))
+
+        self.evict()
+    # END write
+
+    def entries(self) -> Iterator:
+        if not path.isdir(self.directory):
+            return iter(())
+        # END IF
+
+        return (
+            entry for entry in scandir(self.directory)
+            if entry.is_file() and entry.name.endswith(self.suffix)
+        )
+    # END entries
+
+    def size(self) -> int:
+        return sum(entry.stat().st_size for entry in self.entries())
+    # END size
+
+    def evict(self):
+        entries = sorted(self.entries(), key=lambda entry: entry.stat().st_mtime, reverse=True)
+        total = 0
+
+        for entry in entries:
+            total += entry.stat().st_size
+
+            if total > self.max_bytes:
+                # Another process may have evicted the entry already
+                with suppress(FileNotFoundError):
+                    remove(entry.path)
+                # END WITH suppress
+            # END IF
+        # END LOOP
+    # END evict
+
+    def clear(self):
+        for entry in list(self.entries()):
+            remove(entry.path)
+        # END LOOP
+    # END clear
+# END DiskCache
+
+
+@dataclass
+class ResultCache(DiskCache):
+    """
+    Stores answers as small JSON files.
+    """
+
+    suffix = ".json"
+
+    def get(self, key: Key) -> Optional[CacheEntry]:
+        entry_path = self.read(key)
+
+        if entry_path is None:
+            return None
+        # END IF
+
+        try:
+            with open(entry_path) as file:
+                answer = json.load(file)["answer"]
+            # END WITH file
+        except (OSError, ValueError, KeyError):
+            return None
+        # END TRY
+
+        return CacheEntry(key, answer)
+    # END get
+
+    def put(self, key: Key, answer: Answer):
+        """
+        Stores the `answer` under `key`, unless it cannot be represented as JSON.
+        """
+
+        try:
+            content = json.dumps({"answer": answer})
+        except (TypeError, ValueError):
+            return
+        # END TRY
+
+        self.write(key, content.encode())
+    # END put
+# END ResultCache
+
+
+@dataclass
+class ParsedCache(DiskCache):
+    """
+    Stores parsed inputs in the binary format of the `CODEC` of their part module, see `thijs.sidecar`.
+    """
+
+    directory: str = field(default_factory=default_parsed_cache_dir)
+    max_bytes: int = DEFAULT_MAX_PARSED_BYTES
+
+    suffix = ".bin"
+
+    def load(self, key: Key, codec: Codec) -> Optional[Parsed]:
+        """
+        Decodes the parsed input stored under `key` straight from a memory map of its entry.
+        Returns `None` if there is no entry, or if it cannot be decoded.
+        """
+
+        entry_path = self.read(key)
+
+        if entry_path is None:
+            return None
+        # END IF
+
+        try:
+            with map_file(entry_path) as buffer:
+
+                # Handled within the map, since the traceback keeps views on it alive, which would prevent closing it
+                try:
+                    return codec.decode(buffer)
+                except (ValueError, SidecarFormatException):
+                    pass
+                # END TRY
+            # END WITH buffer
+        except OSError:
+            pass
+        # END TRY
+
+        return None
+    # END load
+
+    def store(self, key: Key, codec: Codec, parsed: Parsed):
+        """
+        Stores the `parsed` input under `key`, unless the codec cannot represent it.
+        """
+
+        try:
+            content = codec.encode(parsed)
+        except SidecarFormatException:
+            return
+        # END TRY
+
+        self.write(key, content)
+    # END store
+# END ParsedCache
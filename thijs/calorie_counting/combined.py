@@ -0,0 +1,36 @@
+from typing import Iterator, List
+
+from ..io import Source
+from . import part_1
+from .part_1 import CaloriesPerElf
+
+INPUT_PATH = part_1.INPUT_PATH
+
+
+def parse(path: Source) -> CaloriesPerElf:
+    return part_1.parse(path)
+# END parse
+
+
+def solve(calories_per_elf: CaloriesPerElf, top_n: int = 3) -> Iterator[int]:
+    """
+    Yields the answers of both parts, summing the calories of every elf only once.
+    """
+
+    total_calories_per_elf = sorted(map(sum, calories_per_elf.values()))
+
+    yield total_calories_per_elf[-1]
+    yield sum(total_calories_per_elf[-top_n:])
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
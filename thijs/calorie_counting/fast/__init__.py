@@ -0,0 +1,2 @@
+# Streams the input in chunks of whole elves, keeping only the largest totals, so it suits inputs of any size
+MIN_INPUT_BYTES = 1
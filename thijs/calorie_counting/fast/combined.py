@@ -0,0 +1,26 @@
+from typing import Iterator, List
+
+from ...io import Source
+from . import part_2
+from .part_1 import TopTotals, sum_top_totals
+from .part_2 import TOP_N
+
+
+def parse(path: Source) -> TopTotals:
+    return part_2.parse(path)
+# END parse
+
+
+def solve(top_totals: TopTotals, top_n: int = TOP_N) -> Iterator[int]:
+    """
+    Yields the answers of both parts from the largest totals, which a single pass kept for part 2.
+    """
+
+    yield sum_top_totals(top_totals, 1)
+    yield sum_top_totals(top_totals, top_n)
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
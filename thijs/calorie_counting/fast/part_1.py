@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from heapq import nlargest
+from typing import Iterator, List
+
+from ...io import Source, iter_records
+
+# The elves are separated by an empty line
+ELF_SEPARATOR = b"\n\n"
+
+
+@dataclass
+class TopTotals:
+    # The largest totals of calories, in descending order
+    totals: List[int]
+
+    # The number of totals that were kept, which is the largest `top_n` they can answer
+    capacity: int
+# END TopTotals
+
+
+@dataclass
+class TopNException(Exception):
+    top_n: int
+    capacity: int
+# END TopNException
+
+
+def iter_total_calories(path: Source) -> Iterator[int]:
+    """
+    Yields the total calories of every elf, reading the input in chunks of whole elves.
+    An elf is summed in one go, since `int` parses the bytes of a line with the newlines around it.
+    """
+
+    for elf in iter_records(path, ELF_SEPARATOR):
+        items = elf.split()
+
+        # Runs of more than one empty line hold no elf
+        if items:
+            yield sum(map(int, items))
+        # END IF
+    # END LOOP
+# END iter_total_calories
+
+
+def read_top_totals(path: Source, top_n: int) -> TopTotals:
+    """
+    Keeps the `top_n` largest totals in a single pass, in a min-heap of at most `top_n` totals.
+    """
+
+    return TopTotals(nlargest(top_n, iter_total_calories(path)), top_n)
+# END read_top_totals
+
+
+def sum_top_totals(top_totals: TopTotals, top_n: int) -> int:
+    if top_n > top_totals.capacity:
+        raise TopNException(top_n, top_totals.capacity)
+    # END IF
+
+    return sum(top_totals.totals[:top_n])
+# END sum_top_totals
+
+
+def parse(path: Source) -> TopTotals:
+    return read_top_totals(path, top_n=1)
+# END parse
+
+
+def solve(top_totals: TopTotals) -> int:
+    return sum_top_totals(top_totals, top_n=1)
+# END solve
@@ -0,0 +1,15 @@
+from ...io import Source
+from .part_1 import TopTotals, read_top_totals, sum_top_totals
+
+# The number of elves whose totals are kept, and so the largest `top_n` that can be asked for
+TOP_N = 3
+
+
+def parse(path: Source) -> TopTotals:
+    return read_top_totals(path, TOP_N)
+# END parse
+
+
+def solve(top_totals: TopTotals, top_n: int = TOP_N) -> int:
+    return sum_top_totals(top_totals, top_n)
+# END solve
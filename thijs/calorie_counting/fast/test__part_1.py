@@ -0,0 +1,36 @@
+from pytest import fixture, raises
+
+from .part_1 import (TopNException, TopTotals, iter_total_calories, parse,
+                     read_top_totals, solve, sum_top_totals)
+
+
+@fixture
+def inventory(tmpdir) -> str:
+    input_path = tmpdir.join("inventory")
+    input_path.write("1000\n2000\n3000\n\n4000\n\n5000\n6000\n\n\n7000\n8000\n9000\n\n10000\n")
+    return str(input_path)
+# END inventory
+
+
+def test__iter_total_calories(inventory):
+    # The run of two empty lines holds no elf, and the trailing newline ends the last one
+    assert list(iter_total_calories(inventory)) == [6000, 4000, 11000, 24000, 10000]
+# END test__iter_total_calories
+
+
+def test__read_top_totals(inventory):
+    assert read_top_totals(inventory, 2) == TopTotals([24000, 11000], 2)
+    assert read_top_totals(inventory, 10).totals == [24000, 11000, 10000, 6000, 4000]
+# END test__read_top_totals
+
+
+def test__sum_top_totals():
+    with raises(TopNException):
+        sum_top_totals(TopTotals([24000], 1), 3)
+    # END WITH raises
+# END test__sum_top_totals
+
+
+def test__solve(inventory):
+    assert solve(parse(inventory)) == 24000
+# END test__solve
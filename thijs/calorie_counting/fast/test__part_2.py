@@ -0,0 +1,25 @@
+from os import path
+
+from ...generators import generate
+from .. import part_2 as reference
+from .part_2 import parse, solve
+
+SAMPLE_DATA = "1000\n2000\n3000\n\n4000\n\n5000\n6000\n\n7000\n8000\n9000\n\n10000"
+
+
+def test__solve(tmpdir):
+    input_path = tmpdir.join("sample_data")
+    input_path.write(SAMPLE_DATA)
+
+    assert solve(parse(str(input_path))) == 45000
+    assert solve(parse(str(input_path)), top_n=2) == 35000
+# END test__solve
+
+
+def test__solve_matches_reference(tmpdir):
+    input_path = generate("calorie_counting", str(tmpdir.join("generated")), size=2000, seed=4)
+
+    assert solve(parse(input_path)) == reference.solve(reference.parse(input_path))
+    assert solve(parse(reference.INPUT_PATH)) == 211805
+    assert path.getsize(input_path) > 2 ** 16
+# END test__solve_matches_reference
@@ -0,0 +1,199 @@
+import json
+from dataclasses import dataclass, field
+from heapq import heappush, heapreplace, nlargest
+from os import getpid, path, replace
+from typing import List, Union
+
+from ..io import CHUNK_SIZE, CRLF, ENCODING
+from .fast.part_1 import ELF_SEPARATOR, TopNException
+
+# The number of totals a leaderboard keeps unless told otherwise, which covers both parts
+DEFAULT_MAX_N = 3
+
+# Bumped whenever the layout of a checkpoint changes, so an older checkpoint is rejected rather than misread
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class InventoryTruncatedException(Exception):
+    path: str
+    size: int
+
+    # The number of bytes of the inventory that the leaderboard already ingested
+    offset: int
+# END InventoryTruncatedException
+
+
+@dataclass
+class CheckpointFormatException(Exception):
+    path: str
+# END CheckpointFormatException
+
+
+@dataclass
+class Leaderboard:
+    """
+    Keeps the largest totals of calories of an inventory that grows by appended elves, so the answers stay current
+    without reading the inventory again.
+    The text after the last empty line is held back, since the elf it holds may still be written, but it counts
+    towards the answers as it stands, just like the last elf of the inventory does when it is solved from scratch.
+    """
+
+    max_n: int = DEFAULT_MAX_N
+
+    # The largest totals of the elves that are complete, as a min-heap of at most `max_n` totals
+    totals: List[int] = field(default_factory=list)
+
+    # The text of the elf that may still be written, with a line that may be cut off
+    pending: bytearray = field(default_factory=bytearray)
+
+    # The number of bytes at the start of `pending` known to hold no separator, so an append is only searched once
+    searched: int = field(default=0, compare=False, repr=False)
+
+    # The number of elves that are complete, and the number of bytes that were ingested
+    n_elves: int = 0
+    offset: int = 0
+
+    def add_total(self, total: int):
+        if len(self.totals) < self.max_n:
+            heappush(self.totals, total)
+        elif total > self.totals[0]:
+            heapreplace(self.totals, total)
+        # END IF
+    # END add_total
+
+    def ingest(self, text: Union[str, bytes]):
+        """
+        Adds the `text` that was appended to the inventory, which may end, or start, halfway an elf or a line.
+        Only the appended bytes are searched for the end of an elf, so a long elf that arrives in small pieces still
+        takes linear time. Windows line endings are read as plain newlines, as `thijs.io` does.
+        """
+
+        if isinstance(text, str):
+            text = text.encode(ENCODING)
+        # END IF
+
+        self.offset += len(text)
+
+        # A carriage return at the end of `pending` stays there until the next append tells whether a newline follows it
+        start = max(0, len(self.pending) - 1)
+        self.pending += text
+
+        if b"\r" in text:
+            self.pending[start:] = self.pending[start:].replace(CRLF, b"\n")
+
+            # The carriage return that was searched before may have given way to the newline after it
+            self.searched = min(self.searched, start)
+        # END IF
+
+        # A separator may start in the last byte that was searched before
+        end = self.pending.rfind(ELF_SEPARATOR, max(0, self.searched - len(ELF_SEPARATOR) + 1))
+
+        if end == -1:
+            self.searched = len(self.pending)
+            return
+        # END IF
+
+        for elf in self.pending[:end].split(ELF_SEPARATOR):
+            items = elf.split()
+
+            # Runs of more than one empty line hold no elf
+            if items:
+                self.add_total(sum(map(int, items)))
+                self.n_elves += 1
+            # END IF
+        # END LOOP
+
+        # What is left comes after the last separator, so it holds none
+        del self.pending[:end + len(ELF_SEPARATOR)]
+        self.searched = len(self.pending)
+    # END ingest
+
+    def update(self, inventory_path: str):
+        """
+        Ingests whatever was appended to the inventory at `inventory_path` since the last update.
+        """
+
+        size = path.getsize(inventory_path)
+
+        if size < self.offset:
+            raise InventoryTruncatedException(inventory_path, size, self.offset)
+        # END IF
+
+        with open(inventory_path, "rb") as file:
+            file.seek(self.offset)
+
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                self.ingest(chunk)
+            # END LOOP
+        # END WITH file
+    # END update
+
+    def pending_total(self) -> int:
+        return sum(map(int, self.pending.split()))
+    # END pending_total
+
+    def top_totals(self, top_n: int) -> List[int]:
+        """
+        Returns the `top_n` largest totals in descending order, including the elf that may still be written.
+        """
+
+        if top_n > self.max_n:
+            raise TopNException(top_n, self.max_n)
+        # END IF
+
+        totals = self.totals + [self.pending_total()] if self.pending.split() else self.totals
+
+        return nlargest(top_n, totals)
+    # END top_totals
+
+    def top_n(self, top_n: int) -> int:
+        return sum(self.top_totals(top_n))
+    # END top_n
+
+    def save(self, checkpoint_path: str):
+        """
+        Writes the state to `checkpoint_path` as JSON, through a temporary file so a crash never leaves half a checkpoint.
+        """
+
+        state = {
+            "version": CHECKPOINT_VERSION,
+            "max_n": self.max_n,
+            "totals": self.totals,
+            "pending": self.pending.decode(ENCODING),
+            "n_elves": self.n_elves,
+            "offset": self.offset
+        }
+
+        temporary_path = f"{checkpoint_path}.{getpid()}.tmp"
+
+        with open(temporary_path, "w") as file:
+            json.dump(state, file)
+        # END WITH file
+
+        replace(temporary_path, checkpoint_path)
+    # END save
+
+    @classmethod
+    def load(cls, checkpoint_path: str) -> "Leaderboard":
+        with open(checkpoint_path) as file:
+            try:
+                state = json.load(file)
+            except ValueError:
+                raise CheckpointFormatException(checkpoint_path)
+            # END TRY
+        # END WITH file
+
+        if not isinstance(state, dict) or state.get("version") != CHECKPOINT_VERSION:
+            raise CheckpointFormatException(checkpoint_path)
+        # END IF
+
+        return cls(
+            max_n=state["max_n"],
+            totals=state["totals"],
+            pending=bytearray(state["pending"].encode(ENCODING)),
+            n_elves=state["n_elves"],
+            offset=state["offset"]
+        )
+    # END load
+# END Leaderboard
@@ -0,0 +1,4 @@
+from os import cpu_count
+
+# Splits the input over a pool of processes, which only pays off for large inputs and with more than one core
+MIN_INPUT_BYTES = 64 << 20 if (cpu_count() or 1) > 1 else None
@@ -0,0 +1,22 @@
+from typing import Iterator, List
+
+from ...io import Source
+from ..fast.part_1 import TopTotals, sum_top_totals
+from ..fast.part_2 import TOP_N
+from . import part_2
+
+
+def parse(path: Source) -> TopTotals:
+    return part_2.parse(path)
+# END parse
+
+
+def solve(top_totals: TopTotals, top_n: int = TOP_N) -> Iterator[int]:
+    yield sum_top_totals(top_totals, 1)
+    yield sum_top_totals(top_totals, top_n)
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
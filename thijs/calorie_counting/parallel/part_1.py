@@ -0,0 +1,189 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from heapq import nlargest
+from os import cpu_count
+from typing import Iterable, List, Optional, Tuple
+
+from ...io import (Buffer, Source, is_path, map_file, normalize_newlines,
+                  sniff_compression)
+from ..fast.part_1 import TopTotals, read_top_totals, sum_top_totals
+
+# The number of bytes a worker reads and sums at once, which bounds the memory of every worker
+CHUNK_BYTES = 16 << 20
+
+# A byte range of the input, from its start up to but excluding its end
+ByteRange = Tuple[int, int]
+
+
+@dataclass
+class ChunkSummary:
+    """
+    The totals of a chunk of the input, with the elves it cuts in two kept apart so they can be completed.
+    A sum is `None` if there are no items, which tells an elf of zero calories apart from no elf at all.
+    """
+
+    # The items before the first empty line, which belong to the last elf of the previous chunk
+    head: Optional[int]
+
+    # Whether the chunk holds an empty line, without which all its items belong to a single elf
+    has_separator: bool = False
+
+    # The largest totals of the elves that start and end within the chunk
+    totals: List[int] = field(default_factory=list)
+
+    # The items after the last empty line, which belong to the first elf of the next chunk
+    tail: Optional[int] = None
+# END ChunkSummary
+
+
+def add_items(first: Optional[int], second: Optional[int]) -> Optional[int]:
+    if first is None:
+        return second
+    # END IF
+
+    return first if second is None else first + second
+# END add_items
+
+
+def sum_items(elf: bytes) -> Optional[int]:
+    items = elf.split()
+    return sum(map(int, items)) if items else None
+# END sum_items
+
+
+def find_boundary(buffer: Buffer, offset: int, limit: int) -> int:
+    """
+    Returns the first place from `offset` on to cut the input at: the start of an empty line, so no elf is cut in two,
+    or the start of the next line if there is no empty line before `limit`.
+    """
+
+    separator = buffer.find(b"\n\n", offset, limit)
+
+    if separator != -1:
+        return separator + 1
+    # END IF
+
+    newline = buffer.find(b"\n", offset)
+
+    return len(buffer) if newline == -1 else newline + 1
+# END find_boundary
+
+
+def split_ranges(input_path: str, chunk_bytes: int = CHUNK_BYTES) -> List[ByteRange]:
+    """
+    Splits the file at `input_path` into byte ranges of about `chunk_bytes`, which all start at the start of a line.
+    """
+
+    boundaries = [0]
+
+    with map_file(input_path) as buffer:
+        size = len(buffer)
+
+        while size - boundaries[-1] > chunk_bytes:
+            offset = boundaries[-1] + chunk_bytes
+            boundaries.append(find_boundary(buffer, offset, offset + chunk_bytes))
+        # END LOOP
+    # END WITH buffer
+
+    boundaries.append(size)
+
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+# END split_ranges
+
+
+def summarize_chunk(input_path: str, byte_range: ByteRange, top_n: int) -> ChunkSummary:
+    """
+    Sums the elves in a byte range of the input, which starts at the start of a line.
+    A range never ends between the carriage return and the newline of a Windows line ending, since it ends on a newline.
+    """
+
+    start, end = byte_range
+
+    with open(input_path, "rb") as file:
+        file.seek(start)
+        chunk = normalize_newlines(file.read(end - start))
+    # END WITH file
+
+    # The chunk starts at the start of a line, so an empty line right at its start is a separator as well
+    head, *elves = (b"\n" + chunk).split(b"\n\n")
+
+    if not elves:
+        return ChunkSummary(sum_items(head))
+    # END IF
+
+    *complete, tail = elves
+    totals = (total for total in map(sum_items, complete) if total is not None)
+
+    return ChunkSummary(sum_items(head), True, nlargest(top_n, totals), sum_items(tail))
+# END summarize_chunk
+
+
+def merge_summaries(summaries: Iterable[ChunkSummary], top_n: int) -> TopTotals:
+    """
+    Completes the elves that were cut in two by joining the tail of every chunk to the head of the next, and keeps
+    the `top_n` largest totals of all chunks.
+    """
+
+    def iter_totals():
+        elf = None
+
+        for summary in summaries:
+            elf = add_items(elf, summary.head)
+
+            if summary.has_separator:
+                if elf is not None:
+                    yield elf
+                # END IF
+
+                yield from summary.totals
+                elf = summary.tail
+            # END IF
+        # END LOOP
+
+        if elf is not None:
+            yield elf
+        # END IF
+    # END iter_totals
+
+    return TopTotals(nlargest(top_n, iter_totals()), top_n)
+# END merge_summaries
+
+
+def is_compressed(input_path: str) -> bool:
+    with open(input_path, "rb") as file:
+        return sniff_compression(file) is not None
+    # END WITH file
+# END is_compressed
+
+
+def read_top_totals_parallel(path: Source, top_n: int, workers: Optional[int] = None, chunk_bytes: int = CHUNK_BYTES) -> TopTotals:
+    """
+    Keeps the `top_n` largest totals, summing chunks of the input on a pool of `workers` processes, one per core by
+    default. Streams and compressed files cannot be split up front, so they are read in a single pass instead.
+    """
+
+    if not is_path(path) or is_compressed(path):
+        return read_top_totals(path, top_n)
+    # END IF
+
+    ranges = split_ranges(path, chunk_bytes)
+
+    if len(ranges) <= 1:
+        return merge_summaries([summarize_chunk(path, byte_range, top_n) for byte_range in ranges], top_n)
+    # END IF
+
+    with ProcessPoolExecutor(max_workers=min(workers or cpu_count() or 1, len(ranges))) as executor:
+        summaries = executor.map(summarize_chunk, [path] * len(ranges), ranges, [top_n] * len(ranges))
+        return merge_summaries(summaries, top_n)
+    # END WITH executor
+# END read_top_totals_parallel
+
+
+def parse(path: Source) -> TopTotals:
+    return read_top_totals_parallel(path, top_n=1)
+# END parse
+
+
+def solve(top_totals: TopTotals) -> int:
+    return sum_top_totals(top_totals, top_n=1)
+# END solve
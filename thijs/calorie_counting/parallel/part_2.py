@@ -0,0 +1,14 @@
+from ...io import Source
+from ..fast.part_1 import TopTotals, sum_top_totals
+from ..fast.part_2 import TOP_N
+from .part_1 import read_top_totals_parallel
+
+
+def parse(path: Source) -> TopTotals:
+    return read_top_totals_parallel(path, TOP_N)
+# END parse
+
+
+def solve(top_totals: TopTotals, top_n: int = TOP_N) -> int:
+    return sum_top_totals(top_totals, top_n)
+# END solve
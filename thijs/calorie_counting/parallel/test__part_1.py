@@ -0,0 +1,120 @@
+from random import Random
+
+from pytest import fixture, mark
+
+from ...generators import generate
+from .. import part_1 as reference_part_1
+from .. import part_2 as reference
+from ..fast import part_1 as fast_part_1
+from ..fast.part_1 import iter_total_calories
+from .part_1 import (ChunkSummary, merge_summaries, read_top_totals_parallel,
+                     split_ranges, summarize_chunk)
+
+
+@fixture
+def inventory(tmpdir) -> str:
+    return generate("calorie_counting", str(tmpdir.join("inventory")), size=500, seed=2)
+# END inventory
+
+
+def test__split_ranges(inventory):
+    with open(inventory, "rb") as file:
+        text = file.read()
+    # END WITH file
+
+    ranges = split_ranges(inventory, chunk_bytes=100)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(text)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+    # Every chunk starts at an empty line, since no elf of the generated inventory is longer than a chunk, except
+    # within the last elf, which has no empty line after it
+    last_separator = text.rfind(b"\n\n")
+
+    assert all(text[start - 1:start] == b"\n" for start, _ in ranges[1:])
+    assert all(text[start:start + 1] == b"\n" for start, _ in ranges[1:] if start <= last_separator)
+# END test__split_ranges
+
+
+def test__split_ranges_without_separator(tmpdir):
+    input_path = tmpdir.join("single_elf")
+    input_path.write("\n".join(str(calories) for calories in range(1000, 1100)))
+
+    ranges = split_ranges(str(input_path), chunk_bytes=16)
+
+    # A single elf can only be cut at the start of a line
+    assert len(ranges) > 1
+    assert all(input_path.read_binary()[start - 1:start] == b"\n" for start, _ in ranges[1:])
+    assert merge_summaries([summarize_chunk(str(input_path), byte_range, 1) for byte_range in ranges], 1).totals == [sum(range(1000, 1100))]
+# END test__split_ranges_without_separator
+
+
+def test__summarize_chunk(tmpdir):
+    input_path = tmpdir.join("inventory")
+    input_path.write("100\n200\n\n300\n\n\n400\n500\n\n600")
+
+    assert summarize_chunk(str(input_path), (0, 8), 3) == ChunkSummary(300)
+    assert summarize_chunk(str(input_path), (8, 23), 3) == ChunkSummary(None, True, [300], 900)
+    assert summarize_chunk(str(input_path), (23, 27), 3) == ChunkSummary(None, True, [], 600)
+# END test__summarize_chunk
+
+
+def test__merge_summaries():
+    summaries = [
+        ChunkSummary(100),
+        ChunkSummary(200, True, [50, 40], 10),
+        ChunkSummary(5),
+        ChunkSummary(None, True, [], 0),
+    ]
+
+    # The elves are 300, 50, 40, 15 and one of zero calories
+    assert merge_summaries(summaries, 10).totals == [300, 50, 40, 15, 0]
+# END test__merge_summaries
+
+
+@mark.parametrize("seed", range(10))
+def test__read_top_totals_parallel_matches_reference(seed, tmpdir):
+    random = Random(seed)
+    input_path = tmpdir.join("inventory")
+
+    # Elves of random lengths, separated by one or more empty lines, with or without a trailing newline
+    elves = ["\n".join(str(random.randint(0, 9999)) for _ in range(random.randint(1, 20))) for _ in range(200)]
+    input_path.write("".join(elf + "\n" * random.randint(2, 4) for elf in elves).rstrip("\n" * random.randint(0, 1)))
+
+    expected = sorted(iter_total_calories(str(input_path)), reverse=True)[:3]
+    top_totals = read_top_totals_parallel(str(input_path), 3, chunk_bytes=random.randint(8, 256))
+
+    assert top_totals.totals == expected
+# END test__read_top_totals_parallel_matches_reference
+
+
+def test__read_top_totals_parallel_workers(inventory):
+    top_totals = read_top_totals_parallel(inventory, 3, workers=2, chunk_bytes=1024)
+
+    assert sum(top_totals.totals) == reference.solve(reference.parse(inventory))
+# END test__read_top_totals_parallel_workers
+
+
+def test__read_top_totals_parallel_stream(inventory):
+    with open(inventory, "rb") as file:
+        top_totals = read_top_totals_parallel(file, 3)
+    # END WITH file
+
+    assert sum(top_totals.totals) == reference.solve(reference.parse(inventory))
+# END test__read_top_totals_parallel_stream
+
+
+def test__read_top_totals_parallel_crlf(inventory, tmpdir):
+    with open(inventory, "rb") as file:
+        text = file.read()
+    # END WITH file
+
+    input_path = tmpdir.join("inventory_crlf")
+    input_path.write_binary(text.replace(b"\n", b"\r\n"))
+
+    expected = reference.solve(reference.parse(inventory))
+
+    assert reference.solve(reference.parse(str(input_path))) == expected
+    assert sum(read_top_totals_parallel(str(input_path), 3, chunk_bytes=1024).totals) == expected
+    assert fast_part_1.solve(fast_part_1.parse(str(input_path))) == reference_part_1.solve(reference_part_1.parse(inventory))
+# END test__read_top_totals_parallel_crlf
@@ -4,29 +4,29 @@ from typing import Dict, List
 from uuid import UUID
 from uuid import uuid4 as uuid
 
+from ..io import Source, iter_lines
+
 CaloriesPerElf = Dict[UUID, List[int]]
 
 INPUT_PATH = path.join(path.dirname(__file__), 'data')
 
 
-def read_calories_per_elf(path: str) -> CaloriesPerElf:
+def read_calories_per_elf(path: Source) -> CaloriesPerElf:
 
     calories_per_elf: CaloriesPerElf = defaultdict(list)
     elf_id = uuid()
 
-    with open(path) as file:
-        for line in file:
+    for line in iter_lines(path):
 
-            # An empty line indicates a new elf
-            if line == '\n':
-                elf_id = uuid()
-                continue
-            # END IF
+        # An empty line indicates a new elf
+        if line == b'':
+            elf_id = uuid()
+            continue
+        # END IF
 
-            calories = int(line)
-            calories_per_elf[elf_id].append(calories)
-        # END LOOP
-    # END WITH file
+        calories = int(line)
+        calories_per_elf[elf_id].append(calories)
+    # END LOOP
 
     return calories_per_elf
 # END read_calories_per_elf
@@ -38,9 +38,19 @@ def find_largest_total_calories(calories_per_elf: CaloriesPerElf):
 # END find_largest_total_calories
 
 
+def parse(path: Source) -> CaloriesPerElf:
+    return read_calories_per_elf(path)
+# END parse
+
+
+def solve(calories_per_elf: CaloriesPerElf) -> int:
+    return find_largest_total_calories(calories_per_elf)
+# END solve
+
+
 if __name__ == '__main__':
-    calories_per_elf = read_calories_per_elf(INPUT_PATH)
-    largest_total_calories = find_largest_total_calories(calories_per_elf)
+    calories_per_elf = parse(INPUT_PATH)
+    largest_total_calories = solve(calories_per_elf)
 
     print(largest_total_calories)
 # END MAIN
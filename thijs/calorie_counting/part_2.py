@@ -4,29 +4,29 @@ from typing import Dict, List
 from uuid import UUID
 from uuid import uuid4 as uuid
 
+from ..io import Source, iter_lines
+
 CaloriesPerElf = Dict[UUID, List[int]]
 
 INPUT_PATH = path.join(path.dirname(__file__), 'data')
 
 
-def read_calories_per_elf(path: str) -> CaloriesPerElf:
+def read_calories_per_elf(path: Source) -> CaloriesPerElf:
 
     calories_per_elf: CaloriesPerElf = defaultdict(list)
     elf_id = uuid()
 
-    with open(path) as file:
-        for line in file:
+    for line in iter_lines(path):
 
-            # An empty line indicates a new elf
-            if line == '\n':
-                elf_id = uuid()
-                continue
-            # END IF
+        # An empty line indicates a new elf
+        if line == b'':
+            elf_id = uuid()
+            continue
+        # END IF
 
-            calories = int(line)
-            calories_per_elf[elf_id].append(calories)
-        # END LOOP
-    # END WITH file
+        calories = int(line)
+        calories_per_elf[elf_id].append(calories)
+    # END LOOP
 
     return calories_per_elf
 # END read_calories_per_elf
@@ -40,13 +40,19 @@ def find_total_calories_for_top_elves(calories_per_elf: CaloriesPerElf, top_n: i
 # END find_total_calories_for_top_elves
 
 
-if __name__ == '__main__':
-    calories_per_elf = read_calories_per_elf(INPUT_PATH)
+def parse(path: Source) -> CaloriesPerElf:
+    return read_calories_per_elf(path)
+# END parse
+
 
-    total_calories_for_top_elves = find_total_calories_for_top_elves(
-        calories_per_elf,
-        top_n=3
-    )
+def solve(calories_per_elf: CaloriesPerElf, top_n: int = 3) -> int:
+    return find_total_calories_for_top_elves(calories_per_elf, top_n)
+# END solve
+
+
+if __name__ == '__main__':
+    calories_per_elf = parse(INPUT_PATH)
+    total_calories_for_top_elves = solve(calories_per_elf, top_n=3)
 
     print(total_calories_for_top_elves)
 # END MAIN
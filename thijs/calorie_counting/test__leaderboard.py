@@ -0,0 +1,214 @@
+from os import path
+
+from pytest import fixture, raises
+
+from ..__main__ import main
+from ..generators import generate
+from . import part_1, part_2
+from .fast.part_1 import TopNException
+from .leaderboard import (CheckpointFormatException,
+                          InventoryTruncatedException, Leaderboard)
+
+SAMPLE_DATA = "1000\n2000\n3000\n\n4000\n\n5000\n6000\n\n7000\n8000\n9000\n\n10000"
+
+
+@fixture
+def inventory(tmpdir) -> str:
+    return generate("calorie_counting", str(tmpdir.join("inventory")), size=500, seed=3)
+# END inventory
+
+
+def test__ingest():
+    leaderboard = Leaderboard()
+    leaderboard.ingest(SAMPLE_DATA)
+
+    assert leaderboard.top_n(1) == 24000
+    assert leaderboard.top_n(3) == 45000
+    assert leaderboard.top_totals(3) == [24000, 11000, 10000]
+    assert leaderboard.n_elves == 4
+    assert leaderboard.pending == b"10000"
+# END test__ingest
+
+
+def test__ingest_completes_pending_elf():
+    leaderboard = Leaderboard(max_n=2)
+
+    # The last line of the first text is cut off, and the elf it belongs to is completed by the second
+    leaderboard.ingest("1000\n\n20")
+    assert leaderboard.top_totals(2) == [1000, 20]
+
+    leaderboard.ingest("00\n3000\n")
+    assert leaderboard.top_totals(2) == [5000, 1000]
+
+    leaderboard.ingest("\n\n\n4000")
+    assert leaderboard.top_totals(2) == [5000, 4000]
+    assert leaderboard.n_elves == 2
+# END test__ingest_completes_pending_elf
+
+
+def test__ingest_in_any_pieces(inventory):
+    with open(inventory, "rb") as file:
+        text = file.read()
+    # END WITH file
+
+    expected = [part_1.solve(part_1.parse(inventory)), part_2.solve(part_2.parse(inventory))]
+
+    for piece_size in (1, 7, 4096):
+        leaderboard = Leaderboard()
+
+        for start in range(0, len(text), piece_size):
+            leaderboard.ingest(text[start:start + piece_size])
+        # END LOOP
+
+        assert [leaderboard.top_n(1), leaderboard.top_n(3)] == expected
+        assert leaderboard.offset == len(text)
+    # END LOOP
+# END test__ingest_in_any_pieces
+
+
+def test__ingest_crlf(inventory):
+    with open(inventory, "rb") as file:
+        text = file.read().replace(b"\n", b"\r\n")
+    # END WITH file
+
+    expected = [part_1.solve(part_1.parse(inventory)), part_2.solve(part_2.parse(inventory))]
+
+    # Every piece ends between a carriage return and its newline
+    ends = [position + 1 for position in range(len(text)) if text[position:position + 1] == b"\r"]
+    leaderboard = Leaderboard()
+
+    for start, end in zip([0] + ends, ends + [len(text)]):
+        leaderboard.ingest(text[start:end])
+    # END LOOP
+
+    assert [leaderboard.top_n(1), leaderboard.top_n(3)] == expected
+    assert leaderboard.offset == len(text)
+
+    leaderboard = Leaderboard()
+    leaderboard.ingest("1000\r\n2000\r\n\r\n4000\r\n\r\n5000\r")
+    leaderboard.ingest("\n")
+
+    assert leaderboard.top_totals(3) == [5000, 4000, 3000]
+    assert leaderboard.n_elves == 2
+# END test__ingest_crlf
+
+
+def test__ingest_long_elf_in_single_bytes():
+    text = b"1\n" * 100000
+
+    leaderboard = Leaderboard()
+
+    # Searching all that is pending on every byte would take quadratic time
+    for position in range(len(text)):
+        leaderboard.ingest(text[position:position + 1])
+    # END LOOP
+
+    assert leaderboard.top_n(1) == 100000
+    assert leaderboard.n_elves == 0
+
+    leaderboard.ingest(b"\n2")
+
+    assert leaderboard.top_totals(2) == [100000, 2]
+    assert leaderboard.n_elves == 1
+# END test__ingest_long_elf_in_single_bytes
+
+
+def test__top_n_beyond_max_n():
+    leaderboard = Leaderboard(max_n=3)
+    leaderboard.ingest(SAMPLE_DATA)
+
+    with raises(TopNException):
+        leaderboard.top_n(4)
+    # END WITH raises
+
+    assert Leaderboard().top_n(3) == 0
+# END test__top_n_beyond_max_n
+
+
+def test__update(inventory, tmpdir):
+    appended = str(tmpdir.join("appended"))
+    generate("calorie_counting", appended, size=500, seed=4)
+
+    leaderboard = Leaderboard()
+    leaderboard.update(inventory)
+
+    with open(appended, "rb") as source, open(inventory, "ab") as target:
+        target.write(b"\n\n" + source.read())
+    # END WITH source
+
+    leaderboard.update(inventory)
+
+    assert leaderboard.top_n(3) == part_2.solve(part_2.parse(inventory))
+
+    # Nothing was appended since
+    leaderboard.update(inventory)
+
+    assert leaderboard.top_n(1) == part_1.solve(part_1.parse(inventory))
+# END test__update
+
+
+def test__update_truncated(inventory):
+    leaderboard = Leaderboard()
+    leaderboard.update(inventory)
+
+    with open(inventory, "r+b") as file:
+        file.truncate(10)
+    # END WITH file
+
+    with raises(InventoryTruncatedException):
+        leaderboard.update(inventory)
+    # END WITH raises
+# END test__update_truncated
+
+
+def test__checkpoint(inventory, tmpdir):
+    checkpoint_path = str(tmpdir.join("leaderboard.json"))
+
+    leaderboard = Leaderboard(max_n=5)
+    leaderboard.ingest(SAMPLE_DATA)
+    leaderboard.save(checkpoint_path)
+
+    restored = Leaderboard.load(checkpoint_path)
+
+    assert restored == leaderboard
+
+    # The elf that was pending when the checkpoint was written is completed after it is restored
+    restored.ingest("0\n\n1")
+
+    assert restored.top_totals(5) == [100000, 24000, 11000, 6000, 4000]
+# END test__checkpoint
+
+
+def test__checkpoint_format(tmpdir):
+    checkpoint_path = tmpdir.join("leaderboard.json")
+
+    for content in ("not json", '{"version": 0}'):
+        checkpoint_path.write(content)
+
+        with raises(CheckpointFormatException):
+            Leaderboard.load(str(checkpoint_path))
+        # END WITH raises
+    # END LOOP
+# END test__checkpoint_format
+
+
+def test__leaderboard_command(inventory, tmpdir, capsys):
+    checkpoint_path = str(tmpdir.join("leaderboard.json"))
+
+    assert main(["leaderboard", inventory, "--checkpoint", checkpoint_path]) == 0
+
+    with open(inventory, "ab") as file:
+        file.write(b"\n\n1000000")
+    # END WITH file
+
+    # Only the appended elf is read, from the offset in the checkpoint
+    assert main(["leaderboard", inventory, "--checkpoint", checkpoint_path]) == 0
+    assert Leaderboard.load(checkpoint_path).offset == path.getsize(inventory)
+
+    lines = capsys.readouterr().out.splitlines()
+
+    assert lines[2:] == [
+        f"calorie_counting part 1: {part_1.solve(part_1.parse(inventory))}",
+        f"calorie_counting part 2: {part_2.solve(part_2.parse(inventory))}"
+    ]
+# END test__leaderboard_command
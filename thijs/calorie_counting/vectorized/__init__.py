@@ -0,0 +1,4 @@
+# Parses the whole input in bulk, which beats the streaming engine once the input is large enough to make up for the
+# import of NumPy, but holds several arrays about the size of the input in memory
+MIN_INPUT_BYTES = 8 << 20
+REQUIRES = ("numpy",)
@@ -0,0 +1,23 @@
+from typing import Iterator, List
+
+import numpy as np
+
+from ...io import Source
+from .part_1 import read_total_calories, sum_top_totals
+from .part_2 import TOP_N
+
+
+def parse(path: Source) -> np.ndarray:
+    return read_total_calories(path)
+# END parse
+
+
+def solve(total_calories: np.ndarray, top_n: int = TOP_N) -> Iterator[int]:
+    yield int(total_calories.max())
+    yield sum_top_totals(total_calories, top_n)
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
@@ -0,0 +1,113 @@
+from mmap import mmap
+
+import numpy as np
+
+from ...io import Source, open_source
+
+# The values of the bytes of the zero digit and of the newline
+ZERO = ord("0")
+NEWLINE = ord("\n")
+
+
+def find_invalid_byte(buffer: np.ndarray) -> int:
+    """
+    Returns the offset of the first byte in `buffer` other than a digit or a newline, or -1 if there is none.
+    Such a byte would otherwise wrap around to a digit and silently change the totals.
+    """
+
+    # Subtracting the zero digit wraps every byte below it around to above nine
+    is_valid = ((buffer - ZERO) < 10) | (buffer == NEWLINE)
+
+    return -1 if is_valid.all() else int(np.argmin(is_valid))
+# END find_invalid_byte
+
+
+def sum_total_calories(buffer: np.ndarray) -> np.ndarray:
+    """
+    Returns the total calories of every elf in `buffer`, the bytes of the input, parsing it at once rather than line by
+    line. The lines are found from the newlines, and their values built up from their last digit to their first, one
+    digit of every line at a time, so there are only as many passes as the longest line has digits. The totals of the
+    elves, which are separated by the empty lines, are then summed with a single `np.add.reduceat`.
+    """
+
+    newlines = np.flatnonzero(buffer == NEWLINE)
+
+    # The last line ends at the end of the input, and is empty if the input ends in a newline
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(buffer)]))
+
+    is_item = ends > starts
+
+    if not is_item.any():
+        return np.zeros(0, dtype=np.int64)
+    # END IF
+
+    item_starts = starts[is_item]
+    item_ends = ends[is_item]
+    calories = np.zeros(len(item_starts), dtype=np.int64)
+
+    for exponent in range(int((item_ends - item_starts).max())):
+        positions = item_ends - 1 - exponent
+        digits = np.where(positions >= item_starts, buffer[np.maximum(positions, 0)] - ZERO, 0)
+        calories += digits.astype(np.int64) * 10 ** exponent
+    # END LOOP
+
+    # An item starts a new elf if the line before it is empty, or if it is on the first line
+    starts_elf = np.concatenate(([True], ~is_item[:-1]))[is_item]
+
+    return np.add.reduceat(calories, np.flatnonzero(starts_elf))
+# END sum_total_calories
+
+
+def read_total_calories(path: Source) -> np.ndarray:
+    """
+    Returns the total calories of every elf in the input at `path`.
+    A file is read straight from its memory map, without copying it, while a stream is read into memory first.
+    Raises `ValueError` on any byte other than a digit or a newline.
+    """
+
+    with open_source(path) as opened:
+        if not isinstance(opened, (bytes, mmap)):
+            opened = b"".join(opened)
+        # END IF
+
+        buffer = np.frombuffer(opened, dtype=np.uint8)
+        invalid = find_invalid_byte(buffer)
+
+        if invalid < 0:
+            total_calories = sum_total_calories(buffer)
+        else:
+            error = ValueError(f"Invalid byte {bytes(buffer[invalid:invalid + 1])!r} at offset {invalid}")
+        # END IF
+
+        # The map cannot be closed while an array still points into it, so the error is only raised once it is closed
+        del buffer
+    # END WITH opened
+
+    if invalid >= 0:
+        raise error
+    # END IF
+
+    return total_calories
+# END read_total_calories
+
+
+def sum_top_totals(total_calories: np.ndarray, top_n: int) -> int:
+    """
+    Sums the `top_n` largest totals, which `np.partition` moves to the end without sorting the others.
+    """
+
+    top_n = min(top_n, len(total_calories))
+
+    return int(np.partition(total_calories, len(total_calories) - top_n)[-top_n:].sum()) if top_n else 0
+# END sum_top_totals
+
+
+def parse(path: Source) -> np.ndarray:
+    return read_total_calories(path)
+# END parse
+
+
+def solve(total_calories: np.ndarray) -> int:
+    return int(total_calories.max())
+# END solve
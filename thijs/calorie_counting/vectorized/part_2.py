@@ -0,0 +1,16 @@
+import numpy as np
+
+from ...io import Source
+from .part_1 import read_total_calories, sum_top_totals
+
+TOP_N = 3
+
+
+def parse(path: Source) -> np.ndarray:
+    return read_total_calories(path)
+# END parse
+
+
+def solve(total_calories: np.ndarray, top_n: int = TOP_N) -> int:
+    return sum_top_totals(total_calories, top_n)
+# END solve
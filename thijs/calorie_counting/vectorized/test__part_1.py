@@ -0,0 +1,62 @@
+from io import BytesIO
+
+from pytest import importorskip, mark, raises
+
+importorskip("numpy", reason="the vectorized engine needs NumPy, which is optional")
+
+from ...generators import generate  # noqa: E402
+from .. import part_1 as reference  # noqa: E402
+from .part_1 import parse, read_total_calories, solve, sum_top_totals  # noqa: E402
+
+
+@mark.parametrize("text, totals", [
+    ("1000\n2000\n3000\n\n4000\n\n5000\n6000", [6000, 4000, 11000]),
+    ("1000\n\n\n2000\n", [1000, 2000]),
+    ("\n7\n0\n\n10000000", [7, 10000000]),
+    ("0", [0]),
+    ("\n\n", []),
+    ("", []),
+    ("1000\r\n2000\r\n\r\n3000\r\n", [3000, 3000]),
+])
+def test__read_total_calories(text, totals, tmpdir):
+    input_path = tmpdir.join("inventory")
+    input_path.write(text)
+
+    assert read_total_calories(str(input_path)).tolist() == totals
+# END test__read_total_calories
+
+
+@mark.parametrize("text", ["12\n3x\n", "1 2", "1\r2", "-1", "1\n\t\n2"])
+def test__read_total_calories_invalid_byte(text, tmpdir):
+    input_path = tmpdir.join("inventory")
+    input_path.write(text)
+
+    with raises(ValueError):
+        read_total_calories(str(input_path))
+    # END WITH raises
+# END test__read_total_calories_invalid_byte
+
+
+def test__read_total_calories_stream():
+    assert read_total_calories(BytesIO(b"1\n2\n\n4")).tolist() == [3, 4]
+# END test__read_total_calories_stream
+
+
+def test__sum_top_totals(tmpdir):
+    input_path = tmpdir.join("inventory")
+    input_path.write("1\n\n5\n\n3\n\n4")
+
+    total_calories = read_total_calories(str(input_path))
+
+    assert sum_top_totals(total_calories, 1) == 5
+    assert sum_top_totals(total_calories, 3) == 12
+    assert sum_top_totals(total_calories, 10) == 13
+# END test__sum_top_totals
+
+
+def test__solve_matches_reference(tmpdir):
+    input_path = generate("calorie_counting", str(tmpdir.join("generated")), size=2000, seed=6)
+
+    assert solve(parse(input_path)) == reference.solve(reference.parse(input_path))
+    assert solve(parse(reference.INPUT_PATH)) == 72070
+# END test__solve_matches_reference
@@ -1,45 +1,54 @@
 from os import path
-from typing import Iterable, Set, Tuple
+from typing import Iterable, List, Tuple
 
-INPUT_PATH = path.join(path.dirname(__file__), 'data')
+from ..intervals import Interval, interval_contains
+from ..io import Source, read_lines
 
-Pair = Tuple[Set[int], Set[int]]
+INPUT_PATH = path.join(path.dirname(__file__), 'data')
 
+Pair = Tuple[Interval, Interval]
 
-def read_pairs(path: str) -> Iterable[Pair]:
 
-    with open(path) as file:
-        pairs = (line.rstrip('\n') for line in file)
+def read_pairs(path: Source) -> Iterable[Pair]:
 
-        for pair in pairs:
+    for pair in read_lines(path):
 
-            a, b = pair.split(',')
+        a, b = pair.split(',')
 
-            lower_a, upper_a = a.split('-')
-            lower_b, upper_b = b.split('-')
+        lower_a, upper_a = a.split('-')
+        lower_b, upper_b = b.split('-')
 
-            yield (
-                set(range(int(lower_a), int(upper_a) + 1)),
-                set(range(int(lower_b), int(upper_b) + 1))
-            )
-        # END LOOP
-    # END WITH file
+        yield (
+            (int(lower_a), int(upper_a)),
+            (int(lower_b), int(upper_b))
+        )
+    # END LOOP
 # END read_pairs
 
 
 def sections_are_subset(pair: Pair) -> bool:
     a, b = pair
-    return a.issubset(b) or b.issubset(a)
+    return interval_contains(a, b) or interval_contains(b, a)
 # END sections_are_subset
 
 
-if __name__ == "__main__":
-    pairs = read_pairs(INPUT_PATH)
+def parse(path: Source) -> List[Pair]:
+    return list(read_pairs(path))
+# END parse
+
 
+def solve(pairs: List[Pair]) -> int:
     is_subset = [
         pair for pair in pairs
         if sections_are_subset(pair)
     ]
 
-    print(len(is_subset))
+    return len(is_subset)
+# END solve
+
+
+if __name__ == "__main__":
+    pairs = parse(INPUT_PATH)
+
+    print(solve(pairs))
 # END MAIN
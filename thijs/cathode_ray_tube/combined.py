@@ -0,0 +1,43 @@
+from math import prod
+from typing import Iterator, List, Union
+
+from ..io import Source
+from . import part_1, part_2
+from .part_1 import ClockCircuit, Instruction
+
+INPUT_PATH = part_1.INPUT_PATH
+
+
+def parse(path: Source) -> List[Instruction]:
+    return part_1.parse(path)
+# END parse
+
+
+def solve(instructions: List[Instruction], display_width: int = 40) -> Iterator[Union[int, str]]:
+    """
+    Yields the answers of both parts, running the clock circuit only once.
+    """
+
+    signal = list(ClockCircuit(instructions))
+
+    yield sum(prod(signal[cycle]) for cycle in range(19, len(signal), 40))
+
+    display_output = part_2.render_pixels(signal, display_width)
+
+    yield "\n".join(
+        display_output[i:i + display_width]
+        for i in range(0, len(display_output), display_width)
+    )
+# END solve
+
+
+def solve_all(path: Source) -> List[Union[int, str]]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from math import prod
 from os import path
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
+
+from ..io import Source, read_lines
 
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
@@ -10,18 +12,15 @@ Arg = Optional[int]
 Instruction = Tuple[Command, Arg]
 
 
-def read_instructions(path: str) -> Iterable[Instruction]:
-    with open(path) as file:
-        instructions = (line.rstrip("\n") for line in file)
-        for instruction in instructions:
-            tokens = instruction.split()
-            if tokens[0] == 'noop':
-                yield (tokens[0], None)
-            elif tokens[0] == 'addx':
-                yield (tokens[0], int(tokens[1]))
-            # END IF
-        # END LOOP
-    # END with
+def read_instructions(path: Source) -> Iterable[Instruction]:
+    for instruction in read_lines(path):
+        tokens = instruction.split()
+        if tokens[0] == 'noop':
+            yield (tokens[0], None)
+        elif tokens[0] == 'addx':
+            yield (tokens[0], int(tokens[1]))
+        # END IF
+    # END LOOP
 # END read_instructions
 
 
@@ -74,13 +73,23 @@ class ClockCircuit:
 # END ClockCircuit
 
 
-if __name__ == "__main__":
-    instructions = read_instructions(INPUT_PATH)
+def parse(path: Source) -> List[Instruction]:
+    return list(read_instructions(path))
+# END parse
+
 
+def solve(instructions: List[Instruction]) -> int:
     clock_circuit = ClockCircuit(instructions)
 
     signal = [x for x in clock_circuit]
     signal_strength = [prod(signal[cycle]) for cycle in range(19, len(signal), 40)]
 
-    print(sum(signal_strength))
+    return sum(signal_strength)
+# END solve
+
+
+if __name__ == "__main__":
+    instructions = parse(INPUT_PATH)
+
+    print(solve(instructions))
 # END MAIN
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from os import path
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
+
+from ..io import Source, read_lines
 
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
@@ -10,18 +12,15 @@ Instruction = Tuple[Command, Arg]
 Signal = Tuple[int, int]
 
 
-def read_instructions(path: str) -> Iterable[Instruction]:
-    with open(path) as file:
-        instructions = (line.rstrip("\n") for line in file)
-        for instruction in instructions:
-            tokens = instruction.split()
-            if tokens[0] == 'noop':
-                yield (tokens[0], None)
-            elif tokens[0] == 'addx':
-                yield (tokens[0], int(tokens[1]))
-            # END IF
-        # END LOOP
-    # END with
+def read_instructions(path: Source) -> Iterable[Instruction]:
+    for instruction in read_lines(path):
+        tokens = instruction.split()
+        if tokens[0] == 'noop':
+            yield (tokens[0], None)
+        elif tokens[0] == 'addx':
+            yield (tokens[0], int(tokens[1]))
+        # END IF
+    # END LOOP
 # END read_instructions
 
 
@@ -85,15 +84,25 @@ def render_pixels(signals: Iterable[Signal], display_width: int = 40) -> str:
 # END render_pixels
 
 
-if __name__ == "__main__":
-    instructions = read_instructions(INPUT_PATH)
+def parse(path: Source) -> List[Instruction]:
+    return list(read_instructions(path))
+# END parse
+
 
+def solve(instructions: List[Instruction], display_width: int = 40) -> str:
     clock_circuit = ClockCircuit(instructions)
 
-    display_width = 40
     display_output = render_pixels(clock_circuit, display_width)
 
-    for i in range(0, len(display_output), display_width):
-        print(display_output[i:i + display_width])
-    # END LOOP
+    return "\n".join(
+        display_output[i:i + display_width]
+        for i in range(0, len(display_output), display_width)
+    )
+# END solve
+
+
+if __name__ == "__main__":
+    instructions = parse(INPUT_PATH)
+
+    print(solve(instructions))
 # END MAIN
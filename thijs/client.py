@@ -0,0 +1,130 @@
+import json
+import socket
+import sys
+from argparse import ArgumentParser
+from os import environ, getuid, path
+from tempfile import gettempdir
+from typing import Any, Dict, List, Optional
+
+# This module only imports the standard library, so a query does not pay for importing the solvers it asks for
+
+Message = Dict[str, Any]
+
+SOCKET_ENV = "THIJS_SOCKET"
+
+COMMANDS = ("solve", "ping", "stats", "shutdown")
+
+
+class DaemonException(Exception):
+    """
+    Raised with the error the daemon answered a request with, like an unknown day or a missing input.
+    """
+
+    def __init__(self, error: str):
+        super().__init__(error)
+        self.error = error
+    # END __init__
+# END DaemonException
+
+
+def default_socket_path() -> str:
+    """
+    Returns the socket in `$THIJS_SOCKET`, or one per user in the temporary directory.
+    """
+
+    return environ.get(SOCKET_ENV) or path.join(gettempdir(), f"thijs-{getuid()}.sock")
+# END default_socket_path
+
+
+def send(request: Message, socket_path: Optional[str] = None, timeout: Optional[float] = None) -> Message:
+    """
+    Sends a single `request` to the daemon listening on `socket_path` and returns its response.
+    Requests and responses are JSON objects on a line of their own.
+    """
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.settimeout(timeout)
+        connection.connect(socket_path or default_socket_path())
+        connection.sendall(json.dumps(request).encode() + b"\n")
+
+        with connection.makefile("rb") as stream:
+            line = stream.readline()
+        # END WITH stream
+    # END WITH connection
+
+    if not line:
+        raise DaemonException("The daemon closed the connection without a response")
+    # END IF
+
+    response = json.loads(line)
+
+    if not response.get("ok"):
+        raise DaemonException(response.get("error", "Unknown error"))
+    # END IF
+
+    return response
+# END send
+
+
+def query(day: str, part: Optional[int] = None, input_path: Optional[str] = None, socket_path: Optional[str] = None) -> List[Message]:
+    """
+    Asks the daemon to solve `part` of `day`, or all its parts, and returns the results as dictionaries.
+    The `input_path` is made absolute, since the daemon may run from another directory.
+    """
+
+    request: Message = {"day": day, "part": part, "input": None if input_path is None else path.abspath(input_path)}
+
+    return send(request, socket_path)["results"]
+# END query
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(prog="python -m thijs.client", description="Asks a running solver daemon for answers.")
+    parser.add_argument("day", nargs="?", help="the day to solve")
+    parser.add_argument("-p", "--part", type=int, help="the part to solve, all parts if omitted")
+    parser.add_argument("-i", "--input", help="the input path, defaults to the bundled data")
+    parser.add_argument("-s", "--socket", help="the socket the daemon listens on, defaults to $THIJS_SOCKET or a per-user socket")
+    parser.add_argument("-c", "--command", choices=COMMANDS, default="solve", help="what to ask the daemon (default: %(default)s)")
+    parser.add_argument("--json", action="store_true", help="print one JSON object per result")
+
+    arguments = parser.parse_args(argv)
+
+    if arguments.command == "solve" and arguments.day is None:
+        parser.error("a day is required to solve")
+    # END IF
+
+    try:
+        if arguments.command != "solve":
+            print(json.dumps(send({"command": arguments.command}, arguments.socket)))
+            return 0
+        # END IF
+
+        results = query(arguments.day, arguments.part, arguments.input, arguments.socket)
+    except (DaemonException, OSError) as exception:
+        print(f"{type(exception).__name__}: {exception}", file=sys.stderr)
+        return 1
+    # END TRY
+
+    for result in results:
+        if arguments.json:
+            print(json.dumps(result))
+        else:
+            answer = str(result["answer"])
+
+            # Multi-line answers, like rendered displays, start on a line of their own
+            if "\n" in answer:
+                answer = "\n" + answer
+            # END IF
+
+            cached = " (cached)" if result["cached"] else ""
+            print(f"{result['day']} part {result['part']}: {answer}{cached}")
+        # END IF
+    # END LOOP
+
+    return 0
+# END main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+# END MAIN
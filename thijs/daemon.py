@@ -0,0 +1,368 @@
+import asyncio
+import json
+import signal
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from math import inf
+from os import makedirs, path, remove, scandir, stat
+from time import perf_counter
+from typing import Any, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from .batch import silence
+from .client import Message, default_socket_path
+from .runner import (Answer, Day, Part, Result, UnknownDayException,
+                     UnknownPartException, list_days, list_parts,
+                     load_combined, load_part, silenced)
+
+Key = TypeVar("Key", bound=Hashable)
+Value = TypeVar("Value")
+
+# A day, with a part or `None` for all parts at once
+Target = Tuple[Day, Optional[Part]]
+
+# Identifies the contents of an input by the paths, modification times and sizes of its files, which is cheaper
+# than hashing them on every request
+InputKey = Tuple[Day, Optional[Part], Tuple[Tuple[str, int, int], ...]]
+
+# The number of answers kept in memory
+DEFAULT_MAX_ANSWERS = 4096
+
+# Targets are parsed and solved on the process pool until a solve took no longer than this many seconds, and from then
+# on in the daemon, where the answer does not have to come back from another process
+HEAVY_SOLVE_TIME = 0.05
+
+
+@dataclass
+class LRUCache(Generic[Key, Value]):
+    """
+    Holds at most `max_size` values in memory, evicting the least recently used first.
+    """
+
+    max_size: int
+    values: "OrderedDict[Key, Value]" = field(default_factory=OrderedDict)
+
+    def get(self, key: Key) -> Optional[Value]:
+        if key not in self.values:
+            return None
+        # END IF
+
+        self.values.move_to_end(key)
+        return self.values[key]
+    # END get
+
+    def put(self, key: Key, value: Value):
+        self.values[key] = value
+        self.values.move_to_end(key)
+
+        while len(self.values) > self.max_size:
+            self.values.popitem(last=False)
+        # END LOOP
+    # END put
+
+    def __len__(self) -> int:
+        return len(self.values)
+    # END __len__
+# END LRUCache
+
+
+def input_signature(input_path: str) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Returns the path, modification time and size of the file at `input_path`, or of every file in the directory.
+    Raises `FileNotFoundError` if there is no such input.
+    """
+
+    if not path.isdir(input_path):
+        status = stat(input_path)
+        return ((path.realpath(input_path), status.st_mtime_ns, status.st_size),)
+    # END IF
+
+    return tuple(sorted(
+        (path.realpath(entry.path), entry.stat().st_mtime_ns, entry.stat().st_size)
+        for entry in scandir(input_path)
+        if entry.is_file()
+    ))
+# END input_signature
+
+
+def load_target(day: Day, part: Optional[Part]):
+    return load_part(day, part) if part is not None else load_combined(day)
+# END load_target
+
+
+def solve_parsed(day: Day, part: Optional[Part], parsed: Any) -> List[Tuple[Answer, float]]:
+    """
+    Solves `part` of `day`, or all its parts through the combined module, and times every answer.
+    Runs in the daemon as well as in its workers, which import the module on first use.
+    """
+
+    module = load_target(day, part)
+    timed: List[Tuple[Answer, float]] = []
+
+    start = perf_counter()
+
+    if part is not None:
+        answer = module.solve(parsed)
+        return [(answer, perf_counter() - start)]
+    # END IF
+
+    # The answers of a combined module are generated one part at a time, so every part is timed on its own
+    for answer in module.solve(parsed):
+        solved_at = perf_counter()
+        timed.append((answer, solved_at - start))
+        start = solved_at
+    # END LOOP
+
+    return timed
+# END solve_parsed
+
+
+def parse_and_solve(day: Day, part: Optional[Part], input_path: str) -> Tuple[float, List[Tuple[Answer, float]]]:
+    """
+    Parses the input at `input_path` and solves it as by `solve_parsed`, returning the parse time with the answers.
+    Runs in the workers, so only the answers are sent back, rather than the parsed input sent out.
+    """
+
+    start = perf_counter()
+    parsed = load_target(day, part).parse(input_path)
+    parse_time = perf_counter() - start
+
+    return parse_time, solve_parsed(day, part, parsed)
+# END parse_and_solve
+
+
+def describe(exception: Exception) -> str:
+    if isinstance(exception, UnknownDayException):
+        return f"Unknown day: {exception.day}"
+    # END IF
+
+    if isinstance(exception, UnknownPartException):
+        return f"Unknown part {exception.part} for {exception.day}"
+    # END IF
+
+    return f"{type(exception).__name__}: {exception}"
+# END describe
+
+
+@dataclass
+class Daemon:
+    """
+    Serves answers over a Unix socket from a single long-lived process, so every request skips the startup of the
+    interpreter and the import of the solvers.
+    Answers are kept in memory, and targets run on a pool of processes unless they turned out to be quick.
+    """
+
+    socket_path: str = field(default_factory=default_socket_path)
+    workers: Optional[int] = None
+
+    max_answers: int = DEFAULT_MAX_ANSWERS
+    heavy_solve_time: float = HEAVY_SOLVE_TIME
+
+    answers: LRUCache = field(init=False)
+
+    # The last time taken to solve every target, which decides where it is solved next
+    solve_times: Dict[Target, float] = field(default_factory=dict, init=False)
+
+    executor: Optional[ProcessPoolExecutor] = field(default=None, init=False)
+    stopping: Optional[asyncio.Event] = field(default=None, init=False)
+
+    def __post_init__(self):
+        self.answers = LRUCache(self.max_answers)
+    # END __post_init__
+
+    def warm(self):
+        """
+        Imports the modules of every day up front, so not even the first request for a day pays for its import.
+        """
+
+        for day in list_days():
+            for part in list_parts(day):
+                load_part(day, part)
+            # END LOOP
+
+            load_combined(day)
+        # END LOOP
+    # END warm
+
+    def is_heavy(self, target: Target) -> bool:
+        """
+        Tells whether `target` should run on the process pool, which every target does until it was solved once, since
+        a solve on a thread of the daemon holds the interpreter lock and stalls the requests of every other client.
+        """
+
+        return self.executor is not None and self.solve_times.get(target, inf) > self.heavy_solve_time
+    # END is_heavy
+
+    async def solve(self, day: Day, part: Optional[Part], input_path: Optional[str]) -> List[Result]:
+        """
+        Solves `part` of `day`, or all its parts from a single parse if the day has a combined module.
+        """
+
+        module = load_target(day, part)
+
+        if module is None:
+            results: List[Result] = []
+
+            for day_part in list_parts(day):
+                results.extend(await self.solve(day, day_part, input_path))
+            # END LOOP
+
+            return results
+        # END IF
+
+        if input_path is None:
+            input_path = module.INPUT_PATH
+        # END IF
+
+        target = (day, part)
+        parts = [part] if part is not None else list_parts(day)
+
+        start = perf_counter()
+        key: InputKey = (day, part, input_signature(input_path))
+
+        answers = self.answers.get(key)
+
+        if answers is not None:
+            lookup_time = perf_counter() - start
+
+            return [
+                Result(day, result_part, input_path, answer, lookup_time, 0.0, cached=True)
+                for result_part, answer in zip(parts, answers)
+            ]
+        # END IF
+
+        if self.is_heavy(target):
+            loop = asyncio.get_running_loop()
+            parse_time, timed = await loop.run_in_executor(self.executor, parse_and_solve, day, part, input_path)
+        else:
+            # Parses and solves on a thread, so the daemon keeps accepting requests in the meantime
+            parsed = await asyncio.to_thread(module.parse, input_path)
+            parse_time = perf_counter() - start
+            timed = await asyncio.to_thread(solve_parsed, day, part, parsed)
+        # END IF
+
+        self.solve_times[target] = sum(solve_time for _, solve_time in timed)
+        self.answers.put(key, [answer for answer, _ in timed])
+
+        return [
+            Result(
+                day=day,
+                part=result_part,
+                input_path=input_path,
+                answer=answer,
+                parse_time=parse_time if index == 0 else 0.0,
+                solve_time=solve_time,
+                shared_parse=index > 0
+            )
+            for index, (result_part, (answer, solve_time)) in enumerate(zip(parts, timed))
+        ]
+    # END solve
+
+    async def respond(self, request: Message) -> Message:
+        command = request.get("command", "solve")
+
+        if command == "ping":
+            return {"ok": True}
+        # END IF
+
+        if command == "stats":
+            return {"ok": True, "answers": len(self.answers), "solve_times": {
+                f"{day} part {part or 'all'}": solve_time for (day, part), solve_time in self.solve_times.items()
+            }}
+        # END IF
+
+        if command == "shutdown":
+            self.stopping.set()
+            return {"ok": True}
+        # END IF
+
+        if command != "solve":
+            return {"ok": False, "error": f"Unknown command: {command}"}
+        # END IF
+
+        if "day" not in request:
+            return {"ok": False, "error": "A request to solve needs a day"}
+        # END IF
+
+        try:
+            results = await self.solve(request["day"], request.get("part"), request.get("input"))
+        except Exception as exception:
+            return {"ok": False, "error": describe(exception)}
+        # END TRY
+
+        return {"ok": True, "results": [asdict(result) for result in results]}
+    # END respond
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Answers every request on a connection in turn, until the client hangs up.
+        """
+
+        try:
+            while line := await reader.readline():
+                try:
+                    response = await self.respond(json.loads(line))
+                except ValueError as exception:
+                    response = {"ok": False, "error": f"Malformed request: {exception}"}
+                # END TRY
+
+                writer.write(json.dumps(response, default=str).encode() + b"\n")
+                await writer.drain()
+            # END LOOP
+        except (ConnectionError, asyncio.CancelledError):
+            # The client hung up halfway, or the daemon is shutting down
+            pass
+        finally:
+            writer.close()
+        # END TRY
+    # END handle
+
+    async def serve(self):
+        self.stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, self.stopping.set)
+        # END LOOP
+
+        server = await asyncio.start_unix_server(self.handle, path=self.socket_path)
+
+        try:
+            async with server:
+                await self.stopping.wait()
+            # END WITH server
+        finally:
+            for signal_number in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signal_number)
+            # END LOOP
+
+            if path.exists(self.socket_path):
+                remove(self.socket_path)
+            # END IF
+        # END TRY
+    # END serve
+
+    def run(self):
+        """
+        Imports every day, starts the workers and serves requests until a shutdown request or signal.
+        """
+
+        self.warm()
+        makedirs(path.dirname(path.abspath(self.socket_path)), exist_ok=True)
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=silence) as executor:
+            # Starts the workers before any thread exists, so they are forked with the imports already done
+            executor.submit(list_days).result()
+            self.executor = executor
+
+            try:
+                # Silenced once for the whole daemon, since the solves on its threads would race to swap standard output
+                with silenced():
+                    asyncio.run(self.serve())
+                # END WITH silenced
+            finally:
+                self.executor = None
+            # END TRY
+        # END WITH executor
+    # END run
+# END Daemon
@@ -0,0 +1,303 @@
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from math import ceil
+from os import devnull, listdir, path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from .generators import DEFAULT_SIZES, generate
+from .runner import (REFERENCE_ENGINE, Answer, Day, Engine, Part,
+                     UnknownDayException, list_parts, load_combined, load_part)
+
+# Solves the input at the given path
+Solver = Callable[[str], Answer]
+
+# Decides whether a reduced input still shows the difference
+Predicate = Callable[[List[str]], bool]
+
+# The sizes of the generated inputs, as fractions of the size of the bundled data
+SIZE_FACTORS = (0.01, 0.1, 1.0)
+
+# The number of reduced inputs tried while shrinking a single mismatch
+MAX_SHRINK_ATTEMPTS = 2000
+
+
+@dataclass
+class Mismatch:
+    size: int
+    seed: int
+
+    # The smallest input found that still shows the difference, or the generated one if it could not be shrunk
+    input_text: str
+
+    expected: Answer
+
+    # The answer of the candidate, or a description of the exception it raised
+    actual: Answer
+# END Mismatch
+
+
+@dataclass
+class SizeReport:
+    size: int
+    n_inputs: int
+
+    # The total time, in seconds, both solvers took to parse and solve all inputs of this size
+    reference_time: float
+    candidate_time: float
+
+    mismatches: List[Mismatch] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_time / self.candidate_time if self.candidate_time > 0 else float("inf")
+    # END speedup
+# END SizeReport
+
+
+def part_solver(day: Day, part: Part, engine: Engine = REFERENCE_ENGINE) -> Solver:
+    """
+    Returns the solver of a part, which parses and solves through the part module of the given `engine`.
+    """
+
+    module = load_part(day, part, engine)
+
+    def solve(input_path: str) -> Answer:
+        return module.solve(module.parse(input_path))
+    # END solve
+
+    return solve
+# END part_solver
+
+
+def day_solver(day: Day, engine: Engine = REFERENCE_ENGINE) -> Solver:
+    """
+    Returns the solver of a day, which solves every part on its own and returns the answers in part order.
+    """
+
+    solvers = [part_solver(day, part, engine) for part in list_parts(day)]
+
+    def solve(input_path: str) -> List[Answer]:
+        return [solver(input_path) for solver in solvers]
+    # END solve
+
+    return solve
+# END day_solver
+
+
+def combined_solver(day: Day, part: Optional[Part] = None, engine: Engine = REFERENCE_ENGINE) -> Solver:
+    """
+    Returns the solver of the combined module of a day, with the answers of all parts, or the answer of `part` only.
+    """
+
+    module = load_combined(day, engine)
+
+    if module is None:
+        raise UnknownDayException(day)
+    # END IF
+
+    index = list_parts(day).index(part) if part is not None else None
+
+    def solve(input_path: str) -> Answer:
+        answers = module.solve_all(input_path)
+        return answers if index is None else answers[index]
+    # END solve
+
+    return solve
+# END combined_solver
+
+
+def engine_solver(day: Day, engine: Engine, part: Optional[Part] = None) -> Solver:
+    """
+    Returns the solver of `engine` for `part`, or for all parts of the day through its combined module if it has one.
+    """
+
+    if part is not None:
+        return part_solver(day, part, engine)
+    # END IF
+
+    if load_combined(day, engine) is not None:
+        return combined_solver(day, engine=engine)
+    # END IF
+
+    return day_solver(day, engine)
+# END engine_solver
+
+
+def default_sizes(day: Day, factors: Sequence[float] = SIZE_FACTORS) -> List[int]:
+    base = DEFAULT_SIZES[day]
+    return sorted({max(2, round(base * factor)) for factor in factors})
+# END default_sizes
+
+
+def timed(solver: Solver, input_path: str) -> Tuple[Answer, float]:
+    start = perf_counter()
+    answer = solver(input_path)
+    return answer, perf_counter() - start
+# END timed
+
+
+def describe(exception: Exception) -> str:
+    return f"{type(exception).__name__}: {exception}"
+# END describe
+
+
+def split_units(text: str) -> Tuple[List[str], str]:
+    """
+    Splits an input into the units it is shrunk by: its lines, or the characters of an input of a single line.
+    Returns the units with the separator that joins them back together.
+    """
+
+    lines = text.split("\n")
+    return (lines, "\n") if len(lines) > 1 else (list(text), "")
+# END split_units
+
+
+def shrink(units: List[str], is_failing: Predicate, max_attempts: int = MAX_SHRINK_ATTEMPTS) -> List[str]:
+    """
+    Removes as many units as possible while `is_failing` still holds, by delta debugging.
+    Chunks of units are removed from large to small, down to single units, so the result is minimal in the sense
+    that removing any one unit makes the failure go away, unless `max_attempts` ran out first.
+    """
+
+    granularity = 2
+    attempts = 0
+
+    while len(units) > 1 and attempts < max_attempts:
+        chunk_size = ceil(len(units) / granularity)
+        reduced = False
+
+        for start in range(0, len(units), chunk_size):
+            candidate = units[:start] + units[start + chunk_size:]
+            attempts += 1
+
+            if candidate and is_failing(candidate):
+                units = candidate
+                granularity = max(granularity - 1, 2)
+                reduced = True
+                break
+            # END IF
+
+            if attempts >= max_attempts:
+                break
+            # END IF
+        # END LOOP
+
+        if not reduced:
+            if chunk_size == 1:
+                break
+            # END IF
+
+            granularity = min(len(units), granularity * 2)
+        # END IF
+    # END LOOP
+
+    return units
+# END shrink
+
+
+def differs(reference: Solver, candidate: Solver, input_path: str) -> bool:
+    """
+    Returns whether the candidate gets a different answer than the reference, or fails where the reference does not.
+    Inputs the reference fails on are not valid, so they never count as a difference.
+    """
+
+    try:
+        expected = reference(input_path)
+    except Exception:
+        return False
+    # END TRY
+
+    try:
+        return candidate(input_path) != expected
+    except Exception:
+        return True
+    # END TRY
+# END differs
+
+
+def read_input(input_path: str) -> str:
+    if not path.isdir(input_path):
+        with open(input_path) as file:
+            return file.read()
+        # END WITH file
+    # END IF
+
+    texts: List[str] = []
+
+    for name in sorted(listdir(input_path)):
+        with open(path.join(input_path, name)) as file:
+            texts.append(f"==> {name} <==\n{file.read()}")
+        # END WITH file
+    # END LOOP
+
+    return "\n".join(texts)
+# END read_input
+
+
+def shrink_input(reference: Solver, candidate: Solver, input_path: str, directory: str) -> str:
+    """
+    Returns the smallest text found, starting from the file at `input_path`, on which the solvers still differ.
+    Inputs that are a directory of files are returned unshrunk, as the text of each file in turn.
+    """
+
+    if path.isdir(input_path):
+        return read_input(input_path)
+    # END IF
+
+    units, separator = split_units(read_input(input_path))
+    reduced_path = path.join(directory, "reduced")
+
+    def is_failing(candidate_units: List[str]) -> bool:
+        with open(reduced_path, "w") as file:
+            file.write(separator.join(candidate_units))
+        # END WITH file
+
+        return differs(reference, candidate, reduced_path)
+    # END is_failing
+
+    return separator.join(shrink(units, is_failing))
+# END shrink_input
+
+
+def run_differential(reference: Solver, candidate: Solver, day: Day, sizes: Sequence[int], seeds: int = 5) -> Iterator[SizeReport]:
+    """
+    Runs both solvers on `seeds` generated inputs of every size of `day`, from small to large, and compares the answers.
+    Yields a report per size with the time both solvers took, and every mismatch with its input shrunk as far as
+    possible, so the smallest sizes report the simplest reproductions first.
+    """
+
+    with TemporaryDirectory(prefix="thijs-differential-") as directory:
+        input_path = path.join(directory, "generated")
+
+        for size in sorted(sizes):
+            report = SizeReport(size=size, n_inputs=seeds, reference_time=0.0, candidate_time=0.0)
+
+            for seed in range(seeds):
+                generate(day, input_path, size, seed)
+
+                # Some solvers narrate their progress, which would drown out the report
+                with open(devnull, "w") as sink, redirect_stdout(sink):
+                    expected, reference_time = timed(reference, input_path)
+
+                    try:
+                        actual, candidate_time = timed(candidate, input_path)
+                    except Exception as exception:
+                        actual, candidate_time = describe(exception), 0.0
+                    # END TRY
+
+                    report.reference_time += reference_time
+                    report.candidate_time += candidate_time
+
+                    if actual != expected:
+                        input_text = shrink_input(reference, candidate, input_path, directory)
+                        report.mismatches.append(Mismatch(size, seed, input_text, expected, actual))
+                    # END IF
+                # END WITH sink
+            # END LOOP
+
+            yield report
+        # END LOOP
+    # END WITH directory
+# END run_differential
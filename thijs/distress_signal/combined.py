@@ -0,0 +1,40 @@
+from typing import Iterator, List
+
+from ..io import Source
+from . import part_1, part_2
+from .part_2 import Packet
+
+INPUT_PATH = part_2.INPUT_PATH
+
+# The packets are parsed as a flat list, from which part 1 takes its pairs
+CODEC = part_2.CODEC
+
+
+def parse(path: Source) -> List[Packet]:
+    return part_2.parse(path)
+# END parse
+
+
+def solve(packets: List[Packet]) -> Iterator[int]:
+    pairs = zip(packets[0::2], packets[1::2])
+
+    yield sum(
+        index
+        for index, (left, right) in enumerate(pairs, start=1)
+        if part_1.is_ordered(left, right)
+    )
+
+    yield part_2.solve(packets)
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
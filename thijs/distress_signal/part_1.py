@@ -4,6 +4,10 @@ from itertools import zip_longest
 from os import path
 from typing import Iterable, List, Tuple, TypeVar, Union, Optional
 
+from ..io import Buffer, Source, read_lines
+from ..sidecar import (Codec, pack_nested, pack_sections, unpack_nested,
+                       unpack_sections)
+
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
 
@@ -61,26 +65,49 @@ class Pair:
 # END Pair
 
 
-def read_pairs(path: str) -> Iterable[Pair]:
-    with open(path) as file:
-        lines = (line.rstrip("\n") for line in file)
-        packets = (json.loads(line) for line in lines if line != "")
+def read_pairs(path: Source) -> Iterable[Pair]:
+    packets = (json.loads(line) for line in read_lines(path) if line != "")
 
-        for index, (left, right) in enumerate(grouper(2, packets)):
-            yield Pair(index=index + 1, left=left, right=right)
-        # END LOOP
-    # END WITH file
+    for index, (left, right) in enumerate(grouper(2, packets)):
+        yield Pair(index=index + 1, left=left, right=right)
+    # END LOOP
 # END read_pairs
 
 
-if __name__ == "__main__":
-    pairs = read_pairs(INPUT_PATH)
+def parse(path: Source) -> List[Pair]:
+    return list(read_pairs(path))
+# END parse
+
+
+def encode_parsed(pairs: List[Pair]) -> bytes:
+    return pack_sections([pack_nested([packet for pair in pairs for packet in (pair.left, pair.right)])])
+# END encode_parsed
+
+
+def decode_parsed(buffer: Buffer) -> List[Pair]:
+    (packets,) = unpack_sections(buffer)
+    packets = iter(unpack_nested(packets))
+    return [
+        Pair(index=index + 1, left=left, right=right)
+        for index, (left, right) in enumerate(zip(packets, packets))
+    ]
+# END decode_parsed
 
-    result = sum(
-        pair.index 
-        for pair in pairs 
+
+CODEC = Codec(encode_parsed, decode_parsed)
+
+
+def solve(pairs: List[Pair]) -> int:
+    return sum(
+        pair.index
+        for pair in pairs
         if is_ordered(pair.left, pair.right)
     )
+# END solve
+
+
+if __name__ == "__main__":
+    pairs = parse(INPUT_PATH)
 
-    print(result)
+    print(solve(pairs))
 # END MAIN
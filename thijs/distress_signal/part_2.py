@@ -1,7 +1,10 @@
 import json
-
 from os import path
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional
+
+from ..io import Buffer, Source, read_lines
+from ..sidecar import (Codec, pack_nested, pack_sections, unpack_nested,
+                       unpack_sections)
 
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
@@ -48,22 +51,43 @@ def is_ordered(left: Packet, right: Packet) -> Optional[bool]:
 # END is_ordered
 
 
-def read_packets(path: str) -> Iterable[Packet]:
-    with open(path) as file:
-        lines = (line.rstrip("\n") for line in file)
-        packets = (Packet(json.loads(line)) for line in lines if line != "")
-        yield from packets
-    # END WITH file
+def read_packets(path: Source) -> Iterable[Packet]:
+    packets = (Packet(json.loads(line)) for line in read_lines(path) if line != "")
+    yield from packets
 # END read_pairs
 
 
-if __name__ == "__main__":
-    packets = read_packets(INPUT_PATH)
+def parse(path: Source) -> List[Packet]:
+    return list(read_packets(path))
+# END parse
+
+
+def encode_parsed(packets: List[Packet]) -> bytes:
+    return pack_sections([pack_nested(packets)])
+# END encode_parsed
+
+
+def decode_parsed(buffer: Buffer) -> List[Packet]:
+    (packets,) = unpack_sections(buffer)
+    return [Packet(packet) for packet in unpack_nested(packets)]
+# END decode_parsed
 
+
+CODEC = Codec(encode_parsed, decode_parsed)
+
+
+def solve(packets: List[Packet]) -> int:
     divider_a = Packet([[2]])
     divider_b = Packet([[6]])
 
     sorted_packets = sorted([*packets, divider_a, divider_b])
 
-    print((sorted_packets.index(divider_a) + 1) * (sorted_packets.index(divider_b) + 1))
+    return (sorted_packets.index(divider_a) + 1) * (sorted_packets.index(divider_b) + 1)
+# END solve
+
+
+if __name__ == "__main__":
+    packets = parse(INPUT_PATH)
+
+    print(solve(packets))
 # END MAIN
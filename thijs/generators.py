@@ -0,0 +1,585 @@
+import string
+from dataclasses import dataclass
+from itertools import islice
+from math import isqrt
+from os import makedirs, path
+from random import Random
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+Day = str
+Generator = Callable[[str, int, Random], None]
+TextGenerator = Callable[[int, Random], Iterator[str]]
+
+BUFFER_SIZE = 1 << 20
+CHUNK_SIZE = 1 << 16
+
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97]
+
+# The sizes that correspond to the bundled `data` of each day, in the unit of its generator
+DEFAULT_SIZES: Dict[Day, int] = {
+    "calorie_counting": 266,
+    "rock_paper_scissors": 2500,
+    "rucksack_reorganization": 300,
+    "camp_cleanup": 1000,
+    "supply_stacks": 501,
+    "tuning_trouble": 4096,
+    "no_space_left_on_device": 206,
+    "treetop_tree_house": 9801,
+    "rope_bridge": 2000,
+    "cathode_ray_tube": 146,
+    "monkey_in_the_middle": 8,
+    "hill_climbing_algorithm": 3321,
+    "distress_signal": 150,
+    "regolith_reservoir": 153,
+    "beacon_exclusion_zone": 32,
+    "proboscidea_volcanium": 60,
+    "pyroclastic_flow": 10091,
+}
+
+
+@dataclass
+class UnknownGeneratorException(Exception):
+    day: Day
+# END UnknownGeneratorException
+
+
+def write_lines(target: str, lines: Iterable[str]):
+    """
+    Streams the given `lines` to `target`, separated by newlines and without a trailing newline like the bundled inputs.
+    """
+
+    lines = iter(lines)
+
+    with open(target, "w", buffering=BUFFER_SIZE) as file:
+        for line in islice(lines, 1):
+            file.write(line)
+        # END LOOP
+
+        file.writelines("\n" + line for line in lines)
+    # END WITH file
+# END write_lines
+
+
+def write_chunks(target: str, chunks: Iterable[str]):
+    with open(target, "w", buffering=BUFFER_SIZE) as file:
+        file.writelines(chunks)
+    # END WITH file
+# END write_chunks
+
+
+def to_lines(generator: TextGenerator) -> Generator:
+    def generate(target: str, size: int, random: Random):
+        write_lines(target, generator(size, random))
+    # END generate
+    return generate
+# END to_lines
+
+
+def to_chunks(generator: TextGenerator) -> Generator:
+    def generate(target: str, size: int, random: Random):
+        write_chunks(target, generator(size, random))
+    # END generate
+    return generate
+# END to_chunks
+
+
+def random_chunks(size: int, alphabet: str, random: Random) -> Iterator[str]:
+    for offset in range(0, size, CHUNK_SIZE):
+        yield "".join(random.choices(alphabet, k=min(CHUNK_SIZE, size - offset)))
+    # END LOOP
+# END random_chunks
+
+
+def generate_calories(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates the inventories of `size` elves.
+    """
+
+    for elf in range(size):
+        if elf > 0:
+            yield ""
+        # END IF
+
+        for _ in range(random.randint(1, 15)):
+            yield str(random.randint(1000, 70000))
+        # END LOOP
+    # END LOOP
+# END generate_calories
+
+
+def generate_rounds(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates a strategy guide of `size` rounds.
+    """
+
+    for _ in range(size):
+        yield f"{random.choice('ABC')} {random.choice('XYZ')}"
+    # END LOOP
+# END generate_rounds
+
+
+def generate_rucksacks(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates `size` rucksacks, rounded up to whole groups of three.
+    The compartments of each rucksack share exactly one item, and so do the rucksacks of a group.
+    """
+
+    letters = string.ascii_letters
+
+    for _ in range(-(-size // 3)):
+        badge = random.choice(letters)
+
+        others = [letter for letter in letters if letter != badge]
+        random.shuffle(others)
+
+        # Every letter is missing from one of the rucksacks, so only the badge is common to all three
+        for missing in (set(others[index::3]) for index in range(3)):
+            allowed = [letter for letter in others if letter not in missing]
+            random.shuffle(allowed)
+
+            shared, *pool = allowed
+            left_pool, right_pool = pool[:len(pool) // 2], pool[len(pool) // 2:]
+
+            n_items = random.randint(4, 16)
+
+            left = [badge, shared, *random.choices(left_pool, k=n_items - 2)]
+            right = [shared, *random.choices(right_pool, k=n_items - 1)]
+
+            random.shuffle(left)
+            random.shuffle(right)
+
+            yield "".join(left + right)
+        # END LOOP
+    # END LOOP
+# END generate_rucksacks
+
+
+def generate_pairs(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates `size` pairs of section assignments.
+    """
+
+    def assignment() -> str:
+        lower, upper = sorted((random.randint(1, 99), random.randint(1, 99)))
+        return f"{lower}-{upper}"
+    # END assignment
+
+    for _ in range(size):
+        yield f"{assignment()},{assignment()}"
+    # END LOOP
+# END generate_pairs
+
+
+def generate_supply_stacks(target: str, size: int, random: Random):
+    """
+    Writes a `crates` and a `moves` file with `size` moves to the directory `target`.
+    No move takes more crates than its source holds, and no stack is empty after the last move.
+    """
+
+    n_stacks = 9
+
+    # At least two crates per stack, so a stack can always be found that does not run empty
+    heights = [random.randint(2, 8) for _ in range(n_stacks)]
+    max_height = max(heights)
+
+    def level(index: int) -> str:
+        return " ".join(
+            f"[{random.choice(string.ascii_uppercase)}]"
+            if height >= max_height - index
+            else "   "
+            for height in heights
+        )
+    # END level
+
+    makedirs(target, exist_ok=True)
+
+    write_lines(path.join(target, "crates"), [level(index) for index in range(max_height)])
+
+    def moves() -> Iterator[str]:
+        for index in range(size):
+            remaining = size - index
+            empty = [stack for stack, height in enumerate(heights) if height == 0]
+
+            if len(empty) >= remaining:
+                # Refills an empty stack from the largest one
+                source = max(range(n_stacks), key=heights.__getitem__)
+                destination = empty[0]
+                quantity = 1
+            else:
+                # A move may only empty its source if there are moves left to refill it
+                may_empty = len(empty) + 1 < remaining
+
+                sources = [
+                    stack for stack, height in enumerate(heights)
+                    if height > (0 if may_empty else 1)
+                ]
+
+                source = random.choice(sources)
+                destination = random.choice([stack for stack in range(n_stacks) if stack != source])
+                quantity = random.randint(1, heights[source] if may_empty else heights[source] - 1)
+            # END IF
+
+            heights[source] -= quantity
+            heights[destination] += quantity
+
+            yield f"move {quantity} from {source + 1} to {destination + 1}"
+        # END LOOP
+    # END moves
+
+    write_lines(path.join(target, "moves"), moves())
+# END generate_supply_stacks
+
+
+def generate_signal(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates a signal of `size` characters that only ends in 14 different characters,
+    so the start of a packet or message is found near the very end.
+    """
+
+    marker = random.sample(string.ascii_lowercase, 14)
+    alphabet = "".join(letter for letter in string.ascii_lowercase if letter not in marker)[:3]
+
+    yield from random_chunks(max(0, size - len(marker)), alphabet, random)
+    yield "".join(marker)
+# END generate_signal
+
+
+def generate_terminal_output(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates the terminal output of browsing a file system with `size` directories, including the root.
+    """
+
+    def name() -> str:
+        return "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 8)))
+    # END name
+
+    def split(budget: int) -> List[int]:
+        """
+        Divides the directories in `budget` over a random number of subdirectories.
+        """
+
+        if budget == 0:
+            return []
+        # END IF
+
+        n_children = random.randint(1, min(4, budget))
+        cuts = sorted(random.sample(range(1, budget), n_children - 1)) if n_children > 1 else []
+        return [end - start for start, end in zip([0, *cuts], [*cuts, budget])]
+    # END split
+
+    def listing(children: List[str]) -> Iterator[str]:
+        yield "$ ls"
+
+        for child in children:
+            yield f"dir {child}"
+        # END LOOP
+
+        for index in range(random.randint(0, 5)):
+            yield f"{random.randint(1000, 300000)} {name()}{index}.{random.choice(['txt', 'dat', 'log', 'bin'])}"
+        # END LOOP
+    # END listing
+
+    yield "$ cd /"
+
+    # Every entry is the name of a directory to visit with its budget, or `None` to return to its parent
+    pending: List[Optional[tuple]] = [("/", size)]
+
+    while pending:
+        entry = pending.pop()
+
+        if entry is None:
+            yield "$ cd .."
+            continue
+        # END IF
+
+        directory, budget = entry
+
+        if directory != "/":
+            yield f"$ cd {directory}"
+            pending.append(None)
+        # END IF
+
+        budgets = split(budget - 1)
+        children = [f"{name()}{index}" for index in range(len(budgets))]
+
+        yield from listing(children)
+
+        pending.extend(reversed(list(zip(children, budgets))))
+    # END LOOP
+# END generate_terminal_output
+
+
+def generate_forest(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates a square forest of about `size` trees.
+    """
+
+    side = max(1, isqrt(size))
+
+    for _ in range(side):
+        yield "".join(random.choices(string.digits, k=side))
+    # END LOOP
+# END generate_forest
+
+
+def generate_rope_moves(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates `size` moves of the head of the rope.
+    """
+
+    for _ in range(size):
+        yield f"{random.choice('UDLR')} {random.randint(1, 19)}"
+    # END LOOP
+# END generate_rope_moves
+
+
+def generate_instructions(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates `size` instructions for the clock circuit.
+    """
+
+    for _ in range(size):
+        if random.random() < 0.4:
+            yield "noop"
+        else:
+            yield f"addx {random.choice([-1, 1]) * random.randint(1, 20)}"
+        # END IF
+    # END LOOP
+# END generate_instructions
+
+
+def generate_monkeys(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates the notes on `size` monkeys, at least two.
+    """
+
+    n_monkeys = max(2, size)
+
+    for index in range(n_monkeys):
+        if index > 0:
+            yield ""
+        # END IF
+
+        items = ", ".join(str(random.randint(50, 99)) for _ in range(random.randint(1, 8)))
+
+        operation = random.choice([
+            f"* {random.randint(2, 19)}",
+            f"+ {random.randint(1, 8)}",
+            f"+ {random.randint(1, 8)}",
+            "* old" if random.random() < 0.2 else f"* {random.randint(2, 19)}"
+        ])
+
+        partners = random.sample([other for other in range(n_monkeys) if other != index], 2) if n_monkeys > 2 else [1 - index] * 2
+
+        yield f"Monkey {index}:"
+        yield f"  Starting items: {items}"
+        yield f"  Operation: new = old {operation}"
+        yield f"  Test: divisible by {PRIMES[index % len(PRIMES)]}"
+        yield f"    If true: throw to monkey {partners[0]}"
+        yield f"    If false: throw to monkey {partners[1]}"
+    # END LOOP
+# END generate_monkeys
+
+
+def generate_height_map(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates a height map of about `size` squares, twice as wide as it is high.
+    The elevation rises from `a` on the left to `z` on the right, with random pits,
+    and the row of `S` and `E` is kept free of pits so a path always exists.
+    """
+
+    rows = max(1, isqrt(size // 2))
+    width = max(26, size // rows)
+    path_row = random.randrange(rows)
+
+    elevations = [string.ascii_lowercase[x * 26 // width] for x in range(width)]
+
+    for y in range(rows):
+        row = list(elevations)
+
+        if y == path_row:
+            row[0], row[-1] = "S", "E"
+        else:
+            for x, elevation in enumerate(row):
+                if random.random() < 0.3:
+                    row[x] = string.ascii_lowercase[max(0, ord(elevation) - ord("a") - random.randint(1, 3))]
+                # END IF
+            # END LOOP
+        # END IF
+
+        yield "".join(row)
+    # END LOOP
+# END generate_height_map
+
+
+def generate_packets(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates `size` pairs of packets.
+    """
+
+    def packet(depth: int = 0) -> str:
+        items = (
+            packet(depth + 1) if depth < 4 and random.random() < 0.3 else str(random.randint(0, 10))
+            for _ in range(random.randint(0, 5))
+        )
+        return f"[{','.join(items)}]"
+    # END packet
+
+    for index in range(size):
+        if index > 0:
+            yield ""
+        # END IF
+
+        yield packet()
+        yield packet()
+    # END LOOP
+# END generate_packets
+
+
+def generate_rock_paths(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates `size` rock paths, in a cave that grows with the number of paths.
+    """
+
+    depth = 10 + isqrt(144 * size)
+
+    for _ in range(size):
+        x = 500 + random.randint(-depth // 2, depth // 2)
+        y = random.randint(2, depth)
+
+        points = [(x, y)]
+
+        for index in range(random.randint(1, 5)):
+            step = random.choice([-1, 1]) * random.randint(1, 8)
+
+            if index % 2:
+                y = max(1, y + step)
+            else:
+                x += step
+            # END IF
+
+            points.append((x, y))
+        # END LOOP
+
+        yield " -> ".join(f"{x},{y}" for x, y in points)
+    # END LOOP
+# END generate_rock_paths
+
+
+def generate_sensors(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates `size` sensors, each with a beacon up to a million positions away.
+    """
+
+    for _ in range(size):
+        sensor_x = random.randint(0, 4000000)
+        sensor_y = random.randint(0, 4000000)
+
+        distance = random.randint(1, 1000000)
+        dx = random.randint(0, distance)
+        dy = distance - dx
+
+        beacon_x = sensor_x + random.choice([-1, 1]) * dx
+        beacon_y = sensor_y + random.choice([-1, 1]) * dy
+
+        yield f"Sensor at x={sensor_x}, y={sensor_y}: closest beacon is at x={beacon_x}, y={beacon_y}"
+    # END LOOP
+# END generate_sensors
+
+
+def valve_label(index: int) -> str:
+    """
+    Labels the valves `AA`, `AB`, ... `ZZ`, followed by `BAA`, `BAB`, ...
+    """
+
+    letters = []
+
+    while index > 0 or len(letters) < 2:
+        index, letter = divmod(index, 26)
+        letters.append(string.ascii_uppercase[letter])
+    # END LOOP
+
+    return "".join(reversed(letters))
+# END valve_label
+
+
+def generate_valves(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates a tunnel system of `size` valves, at least two, starting at `AA`.
+    At most 15 valves have a flow rate, so the search for the best order to open them stays feasible.
+    The valves are connected in a ring, with shortcuts of a random stride between every eighth valve.
+    """
+
+    n_valves = max(2, size)
+    stride = 8 * random.randint(1, max(1, n_valves // 16))
+
+    flow_rates = {
+        index: random.randint(2, 25)
+        for index in random.sample(range(1, n_valves), min(15, n_valves // 4))
+    }
+
+    for index in range(n_valves):
+        shortcuts = [
+            index + offset for offset in (-stride, stride)
+            if index % 8 == 0 and 0 <= index + offset < n_valves
+        ]
+
+        neighbors = sorted({(index - 1) % n_valves, (index + 1) % n_valves, *shortcuts} - {index})
+
+        labels = ", ".join(valve_label(neighbor) for neighbor in neighbors)
+        tunnels = "tunnels lead to valves" if len(neighbors) > 1 else "tunnel leads to valve"
+
+        yield f"Valve {valve_label(index)} has flow rate={flow_rates.get(index, 0)}; {tunnels} {labels}"
+    # END LOOP
+# END generate_valves
+
+
+def generate_jet_pattern(size: int, random: Random) -> Iterator[str]:
+    """
+    Generates a jet pattern of `size` pushes.
+    """
+
+    yield from random_chunks(size, "<>", random)
+# END generate_jet_pattern
+
+
+GENERATORS: Dict[Day, Generator] = {
+    "calorie_counting": to_lines(generate_calories),
+    "rock_paper_scissors": to_lines(generate_rounds),
+    "rucksack_reorganization": to_lines(generate_rucksacks),
+    "camp_cleanup": to_lines(generate_pairs),
+    "supply_stacks": generate_supply_stacks,
+    "tuning_trouble": to_chunks(generate_signal),
+    "no_space_left_on_device": to_lines(generate_terminal_output),
+    "treetop_tree_house": to_lines(generate_forest),
+    "rope_bridge": to_lines(generate_rope_moves),
+    "cathode_ray_tube": to_lines(generate_instructions),
+    "monkey_in_the_middle": to_lines(generate_monkeys),
+    "hill_climbing_algorithm": to_lines(generate_height_map),
+    "distress_signal": to_lines(generate_packets),
+    "regolith_reservoir": to_lines(generate_rock_paths),
+    "beacon_exclusion_zone": to_lines(generate_sensors),
+    "proboscidea_volcanium": to_lines(generate_valves),
+    "pyroclastic_flow": to_chunks(generate_jet_pattern),
+}
+
+
+def generate(day: Day, target: str, size: Optional[int] = None, seed: int = 0) -> str:
+    """
+    Writes a synthetic input for the given `day` to `target` and returns its path.
+    The same `seed` and `size` always produce the same input. The `size` defaults to that of the bundled data.
+    For `supply_stacks`, `target` is a directory that receives a `crates` and a `moves` file.
+    """
+
+    if day not in GENERATORS:
+        raise UnknownGeneratorException(day)
+    # END IF
+
+    if size is None:
+        size = DEFAULT_SIZES[day]
+    # END IF
+
+    GENERATORS[day](target, size, Random(seed))
+
+    return target
+# END generate
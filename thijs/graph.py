@@ -0,0 +1,345 @@
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from typing import (Callable, Dict, Generic, Hashable, Iterable, List,
+                    Optional, Sequence, Tuple, TypeVar)
+
+from .metrics import count, enabled
+
+Label = TypeVar("Label", bound=Hashable)
+Node = int
+Weight = int
+Edge = Tuple[Node, Node]
+WeightedEdge = Tuple[Node, Node, Weight]
+NodePredicate = Callable[[Node], bool]
+
+# The distance to, and the parent of, a node that cannot be reached
+UNREACHABLE = -1
+
+
+@dataclass
+class Interner(Generic[Label]):
+    """
+    Numbers labels densely in the order they are first seen, so they can index flat arrays.
+    """
+
+    labels: List[Label] = field(default_factory=list)
+    ids: Dict[Label, Node] = field(default_factory=dict)
+
+    def intern(self, label: Label) -> Node:
+        node = self.ids.get(label)
+
+        if node is None:
+            node = self.ids[label] = len(self.labels)
+            self.labels.append(label)
+        # END IF
+
+        return node
+    # END intern
+
+    def __getitem__(self, label: Label) -> Node:
+        return self.ids[label]
+    # END __getitem__
+
+    def __contains__(self, label: Label) -> bool:
+        return label in self.ids
+    # END __contains__
+
+    def __len__(self) -> int:
+        return len(self.labels)
+    # END __len__
+
+    def lookup(self, nodes: Sequence[Node]) -> List[Label]:
+        return [self.labels[node] for node in nodes]
+    # END lookup
+# END Interner
+
+
+@dataclass
+class CSRGraph:
+    """
+    A directed graph in compressed sparse row form.
+    The edges leaving node `n` are at positions `offsets[n]` up to `offsets[n + 1]` of `targets` and `weights`.
+    """
+
+    offsets: array
+    targets: array
+    weights: array
+
+    @classmethod
+    def from_edges(cls, n_nodes: int, edges: Iterable[Edge]) -> "CSRGraph":
+        return cls.from_weighted_edges(n_nodes, ((source, target, 1) for source, target in edges))
+    # END from_edges
+
+    @classmethod
+    def from_weighted_edges(cls, n_nodes: int, edges: Iterable[WeightedEdge]) -> "CSRGraph":
+        """
+        Sorts the given `edges` into rows by their source, keeping the order of the edges within a row.
+        """
+
+        edges = list(edges)
+
+        counts = [0] * (n_nodes + 1)
+
+        for source, _, _ in edges:
+            counts[source + 1] += 1
+        # END LOOP
+
+        for node in range(n_nodes):
+            counts[node + 1] += counts[node]
+        # END LOOP
+
+        offsets = array("q", counts)
+        targets = array("q", bytes(8 * len(edges)))
+        weights = array("q", bytes(8 * len(edges)))
+
+        # Fills every row from its start, using the counts as the next free position of each row
+        for source, target, weight in edges:
+            position = counts[source]
+            targets[position] = target
+            weights[position] = weight
+            counts[source] += 1
+        # END LOOP
+
+        return cls(offsets, targets, weights)
+    # END from_weighted_edges
+
+    @classmethod
+    def from_adjacency(cls, rows: Iterable[Iterable[Node]]) -> "CSRGraph":
+        """
+        Creates an unweighted graph from the targets of the edges leaving every node, in the order of the nodes.
+        Unlike `from_edges`, this never holds the edges as tuples, so it suits graphs that are built on the fly.
+        """
+
+        offsets = array("q", [0])
+        targets = array("q")
+
+        for row in rows:
+            targets.extend(row)
+            offsets.append(len(targets))
+        # END LOOP
+
+        return cls(offsets, targets, array("q", [1]) * len(targets))
+    # END from_adjacency
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.offsets) - 1
+    # END n_nodes
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.targets)
+    # END n_edges
+
+    def neighbors(self, node: Node) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+    # END neighbors
+# END CSRGraph
+
+
+@dataclass
+class SearchResult:
+    """
+    The distances from the sources of a search and the node each node was reached from.
+    Both are `UNREACHABLE` for the nodes the search did not reach.
+    """
+
+    distances: array
+    parents: array
+
+    # The first node that matched the target predicate of the search, if any
+    target: Optional[Node] = None
+
+    def path(self, target: Node) -> List[Node]:
+        """
+        Returns the nodes from a source up to and including `target`, or an empty list if it was not reached.
+        """
+
+        if self.distances[target] == UNREACHABLE:
+            return []
+        # END IF
+
+        path = [target]
+
+        while self.parents[path[-1]] != UNREACHABLE:
+            path.append(self.parents[path[-1]])
+        # END LOOP
+
+        path.reverse()
+        return path
+    # END path
+# END SearchResult
+
+
+def unreached(n_nodes: int) -> array:
+    return array("q", [UNREACHABLE]) * n_nodes
+# END unreached
+
+
+def count_reached(name: str, search: SearchResult) -> SearchResult:
+    """
+    Counts the searches named `name` and the nodes they reached, if metrics are being recorded.
+    """
+
+    if enabled():
+        count(f"{name}.searches")
+        count(f"{name}.nodes_reached", len(search.distances) - search.distances.count(UNREACHABLE))
+    # END IF
+
+    return search
+# END count_reached
+
+
+def bfs(graph: CSRGraph, sources: Iterable[Node], is_target: Optional[NodePredicate] = None) -> SearchResult:
+    """
+    Searches breadth first from all `sources` at once, ignoring the weights of the edges.
+    Stops at the first node that matches `is_target`, or once every reachable node is found.
+    """
+
+    offsets, targets = graph.offsets, graph.targets
+
+    distances = unreached(graph.n_nodes)
+    parents = unreached(graph.n_nodes)
+    queue = deque()
+
+    for source in sources:
+        if distances[source] != UNREACHABLE:
+            continue
+        # END IF
+
+        distances[source] = 0
+
+        if is_target is not None and is_target(source):
+            return count_reached("bfs", SearchResult(distances, parents, source))
+        # END IF
+
+        queue.append(source)
+    # END LOOP
+
+    while queue:
+        node = queue.popleft()
+        distance = distances[node] + 1
+
+        for position in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[position]
+
+            if distances[neighbor] != UNREACHABLE:
+                continue
+            # END IF
+
+            distances[neighbor] = distance
+            parents[neighbor] = node
+
+            if is_target is not None and is_target(neighbor):
+                return count_reached("bfs", SearchResult(distances, parents, neighbor))
+            # END IF
+
+            queue.append(neighbor)
+        # END LOOP
+    # END LOOP
+
+    return count_reached("bfs", SearchResult(distances, parents))
+# END bfs
+
+
+def dijkstra(graph: CSRGraph, sources: Iterable[Node], is_target: Optional[NodePredicate] = None) -> SearchResult:
+    """
+    Finds the shortest distances from any of the `sources` over edges with non-negative weights.
+    Stops once the node closest to the sources that matches `is_target` is settled.
+    """
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    distances = unreached(graph.n_nodes)
+    parents = unreached(graph.n_nodes)
+    settled = bytearray(graph.n_nodes)
+    heap: List[Tuple[Weight, Node]] = []
+
+    for source in sources:
+        distances[source] = 0
+        heappush(heap, (0, source))
+    # END LOOP
+
+    while heap:
+        distance, node = heappop(heap)
+
+        if settled[node]:
+            continue
+        # END IF
+
+        settled[node] = 1
+
+        if is_target is not None and is_target(node):
+            return count_reached("dijkstra", SearchResult(distances, parents, node))
+        # END IF
+
+        for position in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[position]
+            candidate = distance + weights[position]
+
+            if distances[neighbor] == UNREACHABLE or candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                parents[neighbor] = node
+                heappush(heap, (candidate, neighbor))
+            # END IF
+        # END LOOP
+    # END LOOP
+
+    return count_reached("dijkstra", SearchResult(distances, parents))
+# END dijkstra
+
+
+def all_pairs_bfs(graph: CSRGraph) -> List[array]:
+    """
+    Returns the matrix of hop counts between every pair of nodes, by a breadth first search from every node.
+    Takes O(V * (V + E)) time, which beats Floyd-Warshall on sparse graphs.
+    """
+
+    return [bfs(graph, [node]).distances for node in range(graph.n_nodes)]
+# END all_pairs_bfs
+
+
+def floyd_warshall(graph: CSRGraph) -> List[array]:
+    """
+    Returns the matrix of weighted distances between every pair of nodes, in O(V^3) time.
+    """
+
+    n_nodes = graph.n_nodes
+    infinity = float("inf")
+
+    distances: List[List[float]] = [[infinity] * n_nodes for _ in range(n_nodes)]
+
+    for node in range(n_nodes):
+        distances[node][node] = 0
+
+        for position in range(graph.offsets[node], graph.offsets[node + 1]):
+            target = graph.targets[position]
+            distances[node][target] = min(distances[node][target], graph.weights[position])
+        # END LOOP
+    # END LOOP
+
+    for via in range(n_nodes):
+        via_row = distances[via]
+
+        for row in distances:
+            to_via = row[via]
+
+            if to_via == infinity:
+                continue
+            # END IF
+
+            for target, via_to_target in enumerate(via_row):
+                if to_via + via_to_target < row[target]:
+                    row[target] = to_via + via_to_target
+                # END IF
+            # END LOOP
+        # END LOOP
+    # END LOOP
+
+    return [
+        array("q", (UNREACHABLE if distance == infinity else int(distance) for distance in row))
+        for row in distances
+    ]
+# END floyd_warshall
@@ -0,0 +1,262 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+Point = Tuple[int, int]
+Cell = int
+
+# The offsets of the four orthogonal neighbors of a cell, followed by those of the four diagonal ones
+ORTHOGONAL: Tuple[Point, ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+DIAGONAL: Tuple[Point, ...] = ((1, -1), (1, 1), (-1, 1), (-1, -1))
+
+# The number of cells beyond which `make_grid` falls back to a sparse grid
+MAX_DENSE_CELLS = 1 << 28
+
+
+@dataclass
+class GridShapeException(Exception):
+    width: int
+    height: int
+    size: int
+# END GridShapeException
+
+
+@dataclass
+class Grid:
+    """
+    A rectangle of cells that hold a value from 0 to 255, stored row by row in a single bytearray.
+    Points are `(x, y)` pairs, shifted by the `origin`, so a grid can cover any rectangle.
+    """
+
+    width: int
+    height: int
+    origin: Point = (0, 0)
+    fill: Cell = 0
+
+    cells: Optional[bytearray] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.cells is None:
+            self.cells = bytearray([self.fill]) * (self.width * self.height)
+        elif len(self.cells) != self.width * self.height:
+            raise GridShapeException(self.width, self.height, len(self.cells))
+        # END IF
+    # END __post_init__
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[bytes], table: Optional[bytes] = None, origin: Point = (0, 0)) -> "Grid":
+        """
+        Creates a grid from rows of equal length, like the lines of a puzzle input.
+        Every byte is mapped through `table` if given, as by `bytes.translate`.
+        """
+
+        rows = [bytes(row) for row in rows]
+        width = len(rows[0]) if rows else 0
+        cells = bytearray(b"".join(rows))
+
+        if len(cells) != width * len(rows):
+            raise GridShapeException(width, len(rows), len(cells))
+        # END IF
+
+        if table is not None:
+            cells = cells.translate(table)
+        # END IF
+
+        return cls(width, len(rows), origin, cells=cells)
+    # END from_rows
+
+    def __len__(self) -> int:
+        """
+        Returns the number of rows, like the first dimension of an array.
+        """
+
+        return self.height
+    # END __len__
+
+    def in_bounds(self, point: Point) -> bool:
+        x, y = point
+        origin_x, origin_y = self.origin
+
+        return 0 <= x - origin_x < self.width and 0 <= y - origin_y < self.height
+    # END in_bounds
+
+    def index(self, point: Point) -> int:
+        """
+        Returns the position of the cell at `point` in `cells`, without checking the bounds.
+        """
+
+        x, y = point
+        origin_x, origin_y = self.origin
+
+        return (y - origin_y) * self.width + x - origin_x
+    # END index
+
+    def point(self, index: int) -> Point:
+        y, x = divmod(index, self.width)
+        origin_x, origin_y = self.origin
+
+        return (x + origin_x, y + origin_y)
+    # END point
+
+    def __getitem__(self, point: Point) -> Cell:
+        if not self.in_bounds(point):
+            raise IndexError(point)
+        # END IF
+
+        return self.cells[self.index(point)]
+    # END __getitem__
+
+    def __setitem__(self, point: Point, value: Cell):
+        if not self.in_bounds(point):
+            raise IndexError(point)
+        # END IF
+
+        self.cells[self.index(point)] = value
+    # END __setitem__
+
+    def get(self, point: Point, default: Optional[Cell] = None) -> Optional[Cell]:
+        if not self.in_bounds(point):
+            return default
+        # END IF
+
+        return self.cells[self.index(point)]
+    # END get
+
+    def row(self, y: int) -> memoryview:
+        """
+        Returns the row at `y` as a view on the cells, which follows any change to the grid.
+        """
+
+        start = (y - self.origin[1]) * self.width
+
+        if not 0 <= start < len(self.cells):
+            raise IndexError(y)
+        # END IF
+
+        return memoryview(self.cells)[start:start + self.width]
+    # END row
+
+    def column(self, x: int) -> memoryview:
+        """
+        Returns the column at `x` as a strided view on the cells, without copying them.
+        """
+
+        start = x - self.origin[0]
+
+        if not 0 <= start < self.width:
+            raise IndexError(x)
+        # END IF
+
+        return memoryview(self.cells)[start::self.width]
+    # END column
+
+    def neighbors(self, point: Point, diagonal: bool = False) -> Iterator[Point]:
+        """
+        Yields the points next to `point` that lie within the grid, orthogonally and optionally diagonally.
+        """
+
+        x, y = point
+        offsets = ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL
+
+        for dx, dy in offsets:
+            neighbor = (x + dx, y + dy)
+
+            if self.in_bounds(neighbor):
+                yield neighbor
+            # END IF
+        # END LOOP
+    # END neighbors
+
+    def points(self) -> Iterator[Point]:
+        origin_x, origin_y = self.origin
+
+        for y in range(origin_y, origin_y + self.height):
+            for x in range(origin_x, origin_x + self.width):
+                yield (x, y)
+            # END LOOP
+        # END LOOP
+    # END points
+
+    def count(self, value: Cell) -> int:
+        return self.cells.count(value)
+    # END count
+
+    def add_rows(self, n_rows: int):
+        """
+        Grows the grid by `n_rows` rows of the fill value at the bottom.
+        Views on the grid must be released first, since the cells cannot move while they are exported.
+        """
+
+        self.cells.extend(bytes([self.fill]) * (n_rows * self.width))
+        self.height += n_rows
+    # END add_rows
+# END Grid
+
+
+@dataclass
+class SparseGrid:
+    """
+    A grid that only stores the cells that differ from the fill value, for areas too large to hold densely.
+    Has no bounds, so every point is in it.
+    """
+
+    fill: Cell = 0
+    cells: Dict[Point, Cell] = field(default_factory=dict)
+
+    def in_bounds(self, point: Point) -> bool:
+        return True
+    # END in_bounds
+
+    def __getitem__(self, point: Point) -> Cell:
+        return self.cells.get(point, self.fill)
+    # END __getitem__
+
+    def __setitem__(self, point: Point, value: Cell):
+        if value == self.fill:
+            self.cells.pop(point, None)
+        else:
+            self.cells[point] = value
+        # END IF
+    # END __setitem__
+
+    def get(self, point: Point, default: Optional[Cell] = None) -> Optional[Cell]:
+        """
+        Returns the cell at `point`, which is the fill value if it is not stored, as for indexing the grid.
+        Every point is within the bounds, so `default` is never returned, just like `Grid.get` within its bounds.
+        """
+
+        return self.cells.get(point, self.fill)
+    # END get
+
+    def neighbors(self, point: Point, diagonal: bool = False) -> Iterator[Point]:
+        x, y = point
+        offsets = ORTHOGONAL + DIAGONAL if diagonal else ORTHOGONAL
+
+        for dx, dy in offsets:
+            yield (x + dx, y + dy)
+        # END LOOP
+    # END neighbors
+
+    def count(self, value: Cell) -> int:
+        """
+        Counts the stored cells that hold `value`, which cannot be the fill value.
+        """
+
+        return sum(1 for cell in self.cells.values() if cell == value)
+    # END count
+# END SparseGrid
+
+
+AnyGrid = Union[Grid, SparseGrid]
+
+
+def make_grid(width: int, height: int, origin: Point = (0, 0), fill: Cell = 0, max_cells: int = MAX_DENSE_CELLS) -> AnyGrid:
+    """
+    Creates a dense grid of the given size, or a sparse one if it would hold more than `max_cells` cells.
+    """
+
+    if width * height > max_cells:
+        return SparseGrid(fill)
+    # END IF
+
+    return Grid(width, height, origin, fill)
+# END make_grid
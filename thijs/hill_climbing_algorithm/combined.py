@@ -0,0 +1,49 @@
+from typing import Iterator, List
+
+from ..graph import UNREACHABLE, bfs
+from ..io import Source
+from . import part_2
+from .part_2 import LOWEST, Graph
+
+INPUT_PATH = part_2.INPUT_PATH
+
+CODEC = part_2.CODEC
+
+
+def parse(path: Source) -> Graph:
+    return part_2.parse(path)
+# END parse
+
+
+def solve(graph: Graph) -> Iterator[int]:
+    """
+    Yields the answers of both parts from a single search down from the end.
+    Neighbors are mutual, so the edges that part 2 climbs down are exactly those that part 1 climbs up, reversed.
+    The distance from the end to the start is therefore the length of the path of part 1.
+    """
+
+    distances = bfs(graph.edges, [graph.end]).distances
+
+    yield distances[graph.start]
+
+    yield min(
+        (
+            distance
+            for distance, elevation in zip(distances, graph.elevations)
+            if elevation == LOWEST and distance != UNREACHABLE
+        ),
+        default=UNREACHABLE
+    )
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
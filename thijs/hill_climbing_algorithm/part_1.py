@@ -1,98 +1,67 @@
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import dataclass
 from os import path
-from typing import Callable, Deque, Dict, List, Set, Tuple
-from uuid import uuid4
+from typing import Callable, List
+
+from ..graph import CSRGraph, Node, bfs
+from ..grid import Grid
+from ..io import Buffer, Source, iter_lines
+from ..sidecar import (Codec, pack_ints, pack_sections, unpack_ints,
+                       unpack_sections)
 
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
-Label = str
-Elevation = str
+# The byte of the letter of the elevation
+Elevation = int
 Weight = int
-Edge = Tuple[Label, Weight]
 WeightFunction = Callable[[Elevation, Elevation], Weight]
 WeightPredicate = Callable[[Weight], bool]
-Path = List[Label]
-
+Path = List[Node]
 
-@dataclass
-class Node:
-    elevation: Elevation
-    label: Label = field(default_factory=lambda: str(uuid4()))
-# END Node
+# The start and end markers, which stand for the lowest and the highest elevation
+START = ord("S")
+END = ord("E")
+ELEVATIONS = bytes(range(256)).replace(b"S", b"a").replace(b"E", b"z")
 
-TargetPredicate = Callable[[Node], bool]
 
 @dataclass
 class Graph:
-    weight_function: WeightFunction
+    """
+    The cells of the height map as nodes, numbered by their position, with an edge to every neighbor that can be
+    stepped to. The edges are indexed once, when the input is parsed, so every search runs on flat arrays.
+    """
 
-    nodes: Dict[Label, Node] = field(default_factory=dict)
+    # The elevation of every node
+    elevations: bytes
 
-    edges: Dict[Label, Set[Edge]] = field(
-        default_factory=lambda: defaultdict(set)
-    )
+    edges: CSRGraph
 
-    def add_node(self, node: Node):
-        self.nodes[node.label] = node
-    # END add_node
-
-    def add_edge(self, source: Label, target: Label):
-        weight = self.weight_function(
-            self.nodes[source].elevation,
-            self.nodes[target].elevation
-        )
-        edge = (target, weight)
-        self.edges[source].add(edge)
-    # add_edge
+    start: Node
+    end: Node
 # END Graph
 
+TargetPredicate = Callable[[Graph, Node], bool]
 
-def init_graph(path: str, graph: Graph):
-    with open(path) as file:
-        rows = (line.rstrip("\n") for line in file)
-
-        def create_node(elevation: Elevation):
-            node = None
-            if elevation == "S":
-                node = Node("a", "S")
-            elif elevation == "E":
-                node = Node("z", "E")
-            else:
-                node = Node(elevation)
-            # END IF
-            return node
-        # END create_node
-
-        previous = None
 
-        for row in rows:
-            current = [create_node(elevation) for elevation in row]
+def init_graph(path: Source, weight_predicate: WeightPredicate) -> Graph:
+    height_map = Grid.from_rows(iter_lines(path))
+    elevations = bytes(height_map.cells.translate(ELEVATIONS))
 
-            for index, node in enumerate(current):
-                graph.add_node(node)
-
-                if index > 0:
-                    graph.add_edge(node.label, current[index - 1].label)
-                    graph.add_edge(current[index - 1].label, node.label)
-                # END IF
-
-                if previous is not None:
-                    graph.add_edge(node.label, previous[index].label)
-                    graph.add_edge(previous[index].label, node.label)
-                # END IF
-            # END LOOP
-
-            previous = current
-        # END LOOP
-    # END WITH file
+    edges = CSRGraph.from_adjacency(
+        [
+            target
+            for target in map(height_map.index, height_map.neighbors(height_map.point(source)))
+            if weight_predicate(weight_function(elevations[source], elevations[target]))
+        ]
+        for source in range(len(elevations))
+    )
 
-    return graph
+    return Graph(elevations, edges, height_map.cells.index(START), height_map.cells.index(END))
 # END init_graph
 
 
 def weight_function(source: Elevation, target: Elevation):
-    return ord(target) - ord(source)
+    return target - source
 # END weight_function
 
 
@@ -100,55 +69,71 @@ def weight_predicate(weight: Weight):
     return weight <= 1
 # END weight_predicate
 
-def target_predicate(node: Node):
-    return node.label == 'E'
+def target_predicate(graph: Graph, node: Node):
+    return node == graph.end
 # END target_predicate
 
 
-def shortest_path(graph: Graph, source: Label, target_predicate: TargetPredicate, weight_predicate: WeightPredicate) -> Path:
+def shortest_path(graph: Graph, source: Node, target_predicate: TargetPredicate) -> Path:
+    """
+    Finds the shortest path from `source` to a node that matches `target_predicate`, over the edges of the graph.
+    Returns an empty path if no such node can be reached.
+    """
 
-    seen: Set[Label] = set()
-    paths: Deque[Path] = deque([[source]])
+    # The source itself is not a candidate, like in the puzzle where the start never matches
+    search = bfs(graph.edges, [source], lambda node: node != source and target_predicate(graph, node))
 
-    while len(paths) > 0:
+    if search.target is None:
+        return []
+    # END IF
 
-        path = paths.popleft()
-        current_node = path[-1]
+    return search.path(search.target)
+# END shortest_path
 
-        if current_node in seen:
-            continue
-        # END IF
 
-        edges = [
-            label
-            for label, weight in graph.edges[current_node]
-            if label not in seen and weight_predicate(weight)
-        ]
+def parse(path: Source) -> Graph:
+    return init_graph(path, weight_predicate)
+# END parse
 
-        for label in edges:
-            branch = list(path)
-            branch.append(label)
 
-            if target_predicate(graph.nodes[label]):
-                return branch
-            # END IF
+def encode_parsed(graph: Graph) -> bytes:
+    """
+    Packs the elevations of the nodes, the start and end, and the edges as they are indexed.
+    """
 
-            paths.append(branch)
-        # END LOOP
+    return pack_sections([
+        graph.elevations,
+        pack_ints([graph.start, graph.end]),
+        graph.edges.offsets.tobytes(),
+        graph.edges.targets.tobytes()
+    ])
+# END encode_parsed
 
-        seen.add(current_node)
-    # END LOOP
 
-    return []
-# END shortest_path
+def decode_parsed(buffer: Buffer) -> Graph:
+    elevations, markers, offsets, targets = unpack_sections(buffer)
 
+    start, end = unpack_ints(markers)
+    targets = unpack_ints(targets)
 
-if __name__ == "__main__":
-    graph = Graph(weight_function=weight_function)
+    # Every step takes one move, so the weights of the edges are not stored
+    edges = CSRGraph(unpack_ints(offsets), targets, array("q", [1]) * len(targets))
+
+    return Graph(bytes(elevations), edges, start, end)
+# END decode_parsed
 
-    init_graph(INPUT_PATH, graph)
 
-    result = shortest_path(graph, "S", target_predicate, weight_predicate)
+CODEC = Codec(encode_parsed, decode_parsed)
+
+
+def solve(graph: Graph) -> int:
+    result = shortest_path(graph, graph.start, target_predicate)
+    return len(result) - 1
+# END solve
+
+
+if __name__ == "__main__":
+    graph = parse(INPUT_PATH)
 
-    print(len(result) - 1)
+    print(solve(graph))
 # END MAIN
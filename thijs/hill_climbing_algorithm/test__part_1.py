@@ -1,18 +1,15 @@
 from os import path
 
-from .part_1 import (Graph, init_graph, shortest_path, weight_function, target_predicate,
-                     weight_predicate)
+from .part_1 import parse, shortest_path, target_predicate
 
 INPUT_PATH = path.join(path.dirname(__file__), "sample_data")
 
 
 def test__shortest_path():
 
-    graph = Graph(weight_function)
+    graph = parse(INPUT_PATH)
 
-    init_graph(INPUT_PATH, graph)
-
-    result = shortest_path(graph, "S", target_predicate, weight_predicate)
+    result = shortest_path(graph, graph.start, target_predicate)
 
     assert len(result) - 1 == 31
 # END test__shortest_path
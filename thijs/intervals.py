@@ -0,0 +1,222 @@
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# An inclusive range of integers, from its start up to and including its end
+Interval = Tuple[int, int]
+
+
+@dataclass
+class IntervalException(Exception):
+    interval: Interval
+# END IntervalException
+
+
+def interval_length(interval: Interval) -> int:
+    start, end = interval
+    return 1 + end - start
+# END interval_length
+
+
+def interval_contains(a: Interval, b: Interval) -> bool:
+    """
+    Returns `True` if interval `a` covers all of interval `b`.
+    """
+
+    a_start, a_end = a
+    b_start, b_end = b
+
+    return a_start <= b_start and b_end <= a_end
+# END interval_contains
+
+
+def interval_overlaps(a: Interval, b: Interval) -> bool:
+    """
+    Returns `True` if intervals `a` and `b` share at least one integer.
+    """
+
+    a_start, a_end = a
+    b_start, b_end = b
+
+    return a_start <= b_end and b_start <= a_end
+# END interval_overlaps
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """
+    Sorts the given `intervals` and merges those that overlap or touch, in O(n log n) time.
+    """
+
+    merged: List[Interval] = []
+
+    for start, end in sorted(intervals):
+        if start > end:
+            raise IntervalException((start, end))
+        # END IF
+
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+            # END IF
+        else:
+            merged.append((start, end))
+        # END IF
+    # END LOOP
+
+    return merged
+# END merge_intervals
+
+
+@dataclass
+class IntervalSet:
+    """
+    A set of integers stored as sorted, disjoint intervals, with no two intervals touching.
+    Iterates over its intervals, so `len` is the number of intervals and `length` the number of integers covered.
+    """
+
+    intervals: List[Interval] = field(default_factory=list)
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Interval]) -> "IntervalSet":
+        return cls(merge_intervals(intervals))
+    # END from_intervals
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(self.intervals)
+    # END __iter__
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+    # END __len__
+
+    def __contains__(self, value: int) -> bool:
+        return self.find(value) is not None
+    # END __contains__
+
+    def find(self, value: int) -> Optional[Interval]:
+        """
+        Returns the interval that holds `value`, or `None` if it is not covered.
+        """
+
+        position = bisect_right(self.intervals, (value, float("inf"))) - 1
+
+        if position < 0 or self.intervals[position][1] < value:
+            return None
+        # END IF
+
+        return self.intervals[position]
+    # END find
+
+    @property
+    def length(self) -> int:
+        return sum(interval_length(interval) for interval in self.intervals)
+    # END length
+
+    def add(self, interval: Interval):
+        self.update([interval])
+    # END add
+
+    def update(self, intervals: Iterable[Interval]):
+        """
+        Adds all given `intervals` at once, which costs a single merge rather than one per interval.
+        """
+
+        self.intervals = merge_intervals([*self.intervals, *intervals])
+    # END update
+
+    def contains(self, interval: Interval) -> bool:
+        """
+        Returns `True` if every integer of `interval` is in the set.
+        """
+
+        start, _ = interval
+        holder = self.find(start)
+
+        return holder is not None and interval_contains(holder, interval)
+    # END contains
+
+    def overlaps(self, interval: Interval) -> bool:
+        """
+        Returns `True` if any integer of `interval` is in the set.
+        """
+
+        start, end = interval
+        position = bisect_right(self.intervals, (end, float("inf"))) - 1
+
+        return position >= 0 and self.intervals[position][1] >= start
+    # END overlaps
+
+    def issubset(self, other: "IntervalSet") -> bool:
+        return all(other.contains(interval) for interval in self.intervals)
+    # END issubset
+
+    def isdisjoint(self, other: "IntervalSet") -> bool:
+        return not self.intersection(other).intervals
+    # END isdisjoint
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet.from_intervals([*self.intervals, *other.intervals])
+    # END union
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        Intersects both sets by walking their intervals side by side, in linear time.
+        Intersections that touch are merged as they are found, so the result keeps the invariant of the set even if
+        either set was built from intervals that touch.
+        """
+
+        result: List[Interval] = []
+        a, b = self.intervals, other.intervals
+        i = j = 0
+
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            end = min(a[i][1], b[j][1])
+
+            if start <= end:
+                if result and start <= result[-1][1] + 1:
+                    result[-1] = (result[-1][0], max(end, result[-1][1]))
+                else:
+                    result.append((start, end))
+                # END IF
+            # END IF
+
+            # Moves past whichever interval ends first, since it cannot overlap anything further on
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+            # END IF
+        # END LOOP
+
+        return IntervalSet(result)
+    # END intersection
+
+    def gaps(self, start: int, end: int) -> Iterator[Interval]:
+        """
+        Yields the intervals between `start` and `end`, inclusive, that are not in the set.
+        """
+
+        position = start
+
+        for interval_start, interval_end in self.intervals:
+            if interval_end < position:
+                continue
+            # END IF
+
+            if interval_start > end:
+                break
+            # END IF
+
+            if interval_start > position:
+                yield (position, interval_start - 1)
+            # END IF
+
+            position = interval_end + 1
+        # END LOOP
+
+        if position <= end:
+            yield (position, end)
+        # END IF
+    # END gaps
+# END IntervalSet
@@ -0,0 +1,470 @@
+import atexit
+from contextlib import contextmanager
+from dataclasses import dataclass
+from io import TextIOBase
+from mmap import ACCESS_READ, mmap
+from os import PathLike, fstat
+from typing import IO, Any, Dict, Iterator, Optional, Union
+
+# The modules that only compressed inputs need, gzip, zstandard, queue and threading, are imported on first use, since
+# every run imports this module but few read a compressed input
+
+Buffer = Union[bytes, mmap]
+Blocks = Iterator[bytes]
+
+# An input is either the path of a file or a stream that is already open, in binary or text mode
+Source = Union[str, PathLike, IO]
+
+# The number of bytes that is decoded and split at once
+CHUNK_SIZE = 1 << 20
+
+ENCODING = "utf-8"
+
+# Windows line endings are read as plain newlines, as `open` does in text mode
+CRLF = b"\r\n"
+
+# The leading bytes of the compressed formats that are decompressed transparently
+COMPRESSIONS: Dict[str, bytes] = {
+    "gzip": b"\x1f\x8b",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+
+# The number of decompressed blocks the background thread may read ahead of the readers
+READ_AHEAD = 4
+
+# The number of seconds to wait for a background thread to stop, which it cannot while blocked reading its stream
+STOP_TIMEOUT = 1.0
+
+# The background readers that are still running, as threads by the events that stop them
+background_readers: Dict[Any, Any] = {}
+
+
+@dataclass
+class DecompressorUnavailableException(Exception):
+    compression: str
+# END DecompressorUnavailableException
+
+
+@contextmanager
+def map_file(path: str) -> Iterator[Buffer]:
+    """
+    Maps the file at `path` into memory, read only.
+    Empty files cannot be mapped, so those yield an empty bytes object instead.
+    """
+
+    with open(path, "rb") as file:
+        if fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        # END IF
+
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+            yield buffer
+        # END WITH buffer
+    # END WITH file
+# END map_file
+
+
+def is_path(source: Source) -> bool:
+    return isinstance(source, (str, PathLike))
+# END is_path
+
+
+def source_name(source: Source) -> str:
+    """
+    Returns the path of `source`, or the name of the stream, like `<stdin>`.
+    """
+
+    if is_path(source):
+        return str(source)
+    # END IF
+
+    return str(getattr(source, "name", "<stream>"))
+# END source_name
+
+
+def sniff_compression(stream: IO) -> Optional[str]:
+    """
+    Returns the compression of `stream` by its leading bytes, without consuming them, or `None` if it is not compressed.
+    Streams that can neither peek nor seek, like raw pipes, are taken to be uncompressed.
+    """
+
+    size = max(len(magic) for magic in COMPRESSIONS.values())
+
+    if hasattr(stream, "peek"):
+        head = stream.peek(size)[:size]
+    elif stream.seekable():
+        position = stream.tell()
+        head = stream.read(size)
+        stream.seek(position)
+    else:
+        return None
+    # END IF
+
+    for compression, magic in COMPRESSIONS.items():
+        if head.startswith(magic):
+            return compression
+        # END IF
+    # END LOOP
+
+    return None
+# END sniff_compression
+
+
+def decompress(stream: IO, compression: str) -> IO:
+    if compression == "gzip":
+        import gzip
+
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    # END IF
+
+    try:
+        import zstandard
+    except ImportError:
+        # Only zstd compressed inputs need the optional zstandard package, gzip is in the standard library
+        raise DecompressorUnavailableException(compression) from None
+    # END TRY
+
+    return zstandard.ZstdDecompressor().stream_reader(stream)
+# END decompress
+
+
+def normalize_newlines(data: Buffer) -> Buffer:
+    """
+    Replaces the Windows line endings in `data` with plain newlines, copying it only if it holds any.
+    """
+
+    if data.find(b"\r") < 0:
+        return data
+    # END IF
+
+    return data[:].replace(CRLF, b"\n")
+# END normalize_newlines
+
+
+def normalize_blocks(blocks: Blocks) -> Blocks:
+    """
+    Replaces the Windows line endings in `blocks`, holding back a carriage return at the end of a block in case the
+    newline that completes it starts the next block.
+    """
+
+    held = b""
+
+    for block in blocks:
+        if held:
+            block = held + block
+            held = b""
+        # END IF
+
+        if block.endswith(b"\r"):
+            held = b"\r"
+            block = block[:-1]
+        # END IF
+
+        if block:
+            yield normalize_newlines(block)
+        # END IF
+    # END LOOP
+
+    if held:
+        yield held
+    # END IF
+# END normalize_blocks
+
+
+def iter_blocks(stream: IO, block_size: int = CHUNK_SIZE) -> Blocks:
+    """
+    Reads `stream` in blocks of `block_size` bytes, encoding the blocks of a text stream that has no binary buffer.
+    """
+
+    while block := stream.read(block_size):
+        yield block.encode(ENCODING) if isinstance(block, str) else block
+    # END LOOP
+# END iter_blocks
+
+
+def iter_blocks_in_background(stream: IO, block_size: int = CHUNK_SIZE, read_ahead: int = READ_AHEAD) -> Blocks:
+    """
+    Reads `stream` in blocks on a background thread, so decompressing the input overlaps with parsing it.
+    The thread holds at most `read_ahead` blocks that were not consumed yet, which bounds the memory it uses.
+    A consumer that stops early waits at most `STOP_TIMEOUT` seconds for the thread, which stops once its read returns.
+    """
+
+    from queue import Full, Queue
+    from threading import Event, Thread
+
+    blocks: Queue = Queue(maxsize=read_ahead)
+    stopped = Event()
+
+    def put(item):
+        # Gives up once the consumer has stopped, rather than wait forever on a full queue
+        while not stopped.is_set():
+            try:
+                blocks.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+            # END TRY
+        # END LOOP
+    # END put
+
+    def produce():
+        try:
+            for block in iter_blocks(stream, block_size):
+                if stopped.is_set():
+                    return
+                # END IF
+
+                put(block)
+            # END LOOP
+
+            # An empty block marks the end of the stream
+            put(b"")
+        except Exception as exception:
+            put(exception)
+        # END TRY
+    # END produce
+
+    thread = Thread(target=produce, name="thijs-reader", daemon=True)
+    background_readers[thread] = stopped
+    thread.start()
+
+    try:
+        while True:
+            item = blocks.get()
+
+            if isinstance(item, Exception):
+                raise item
+            # END IF
+
+            if not item:
+                return
+            # END IF
+
+            yield item
+        # END LOOP
+    finally:
+        stopped.set()
+
+        # A read from a pipe or a slow decompressor cannot be interrupted, not even by closing the stream, which waits
+        # for the read as well. The thread is left to finish it in the background then, and is stopped at exit at latest
+        thread.join(STOP_TIMEOUT)
+
+        if not thread.is_alive():
+            background_readers.pop(thread, None)
+        # END IF
+    # END TRY
+# END iter_blocks_in_background
+
+
+@atexit.register
+def stop_background_readers(timeout: float = STOP_TIMEOUT):
+    """
+    Stops the readers of inputs that were abandoned halfway, like on an error in the parser.
+    A reader that is still busy with its stream at exit would otherwise hold the lock of that stream, which the
+    interpreter needs to shut down.
+    """
+
+    for thread, stopped in list(background_readers.items()):
+        stopped.set()
+        thread.join(timeout)
+
+        if not thread.is_alive():
+            background_readers.pop(thread, None)
+        # END IF
+    # END LOOP
+# END stop_background_readers
+
+
+@contextmanager
+def open_source(source: Source, block_size: int = CHUNK_SIZE) -> Iterator[Union[Buffer, Blocks]]:
+    """
+    Opens `source` for reading. An uncompressed file is mapped into memory, as by `map_file`.
+    Any other source yields an iterator over its blocks, which are decompressed on a background thread if needed.
+    Windows line endings are replaced with plain newlines either way, which copies a mapped file that has any.
+    """
+
+    if is_path(source):
+        with open(source, "rb") as file:
+            compression = sniff_compression(file)
+
+            if compression is None:
+                with map_file(source) as buffer:
+                    yield normalize_newlines(buffer)
+                # END WITH buffer
+                return
+            # END IF
+
+            blocks = iter_blocks_in_background(decompress(file, compression), block_size)
+
+            try:
+                yield normalize_blocks(blocks)
+            finally:
+                blocks.close()
+            # END TRY
+        # END WITH file
+        return
+    # END IF
+
+    stream = source
+
+    # Text streams are read through their binary buffer, so they can be sniffed and split like any other
+    if isinstance(stream, TextIOBase):
+        stream = getattr(stream, "buffer", stream)
+    # END IF
+
+    compression = None if isinstance(stream, TextIOBase) else sniff_compression(stream)
+
+    if compression is None:
+        yield normalize_blocks(iter_blocks(stream, block_size))
+        return
+    # END IF
+
+    blocks = iter_blocks_in_background(decompress(stream, compression), block_size)
+
+    try:
+        yield normalize_blocks(blocks)
+    finally:
+        blocks.close()
+    # END TRY
+# END open_source
+
+
+def iter_chunks(buffer: Buffer, separator: bytes, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Cuts `buffer` into chunks of about `chunk_size` bytes that end on a `separator`, which is dropped.
+    A chunk is only larger than `chunk_size` if a single record is.
+    A separator at the very end of the buffer does not start another record, like a trailing newline.
+    """
+
+    start = 0
+    size = len(buffer)
+
+    while start < size:
+        if start + chunk_size >= size:
+            stop = size
+        else:
+            stop = buffer.rfind(separator, start, start + chunk_size)
+
+            if stop < 0:
+                stop = buffer.find(separator, start + chunk_size)
+            # END IF
+
+            if stop < 0:
+                stop = size
+            # END IF
+        # END IF
+
+        chunk = buffer[start:stop]
+
+        if stop == size and chunk.endswith(separator):
+            chunk = chunk[:-len(separator)]
+        # END IF
+
+        yield chunk
+
+        start = stop + len(separator)
+    # END LOOP
+# END iter_chunks
+
+
+def split_blocks(blocks: Blocks, separator: bytes) -> Iterator[bytes]:
+    """
+    Regroups the `blocks` of a stream into chunks that end on a `separator`, like `iter_chunks` does for a buffer.
+    Only the records that are not complete yet are held back, so a stream is split while it is still being read.
+    """
+
+    pending = bytearray()
+
+    # The position up to which `pending` is known to hold no separator
+    searched = 0
+
+    for block in blocks:
+        pending += block
+        stop = pending.rfind(separator, max(0, searched - len(separator) + 1))
+
+        if stop < 0:
+            searched = len(pending)
+            continue
+        # END IF
+
+        yield bytes(pending[:stop])
+
+        del pending[:stop + len(separator)]
+        searched = 0
+    # END LOOP
+
+    if pending:
+        yield bytes(pending)
+    # END IF
+# END split_blocks
+
+
+def iter_source_chunks(opened: Union[Buffer, Blocks], separator: bytes, chunk_size: int) -> Iterator[bytes]:
+    if isinstance(opened, (bytes, mmap)):
+        return iter_chunks(opened, separator, chunk_size)
+    # END IF
+
+    return split_blocks(opened, separator)
+# END iter_source_chunks
+
+
+def iter_records(source: Source, separator: bytes = b"\n", chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Iterates over the records in `source` as bytes, without their `separator`.
+    """
+
+    with open_source(source, chunk_size) as opened:
+        for chunk in iter_source_chunks(opened, separator, chunk_size):
+            yield from chunk.split(separator)
+        # END LOOP
+    # END WITH opened
+# END iter_records
+
+
+def iter_lines(source: Source, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Iterates over the lines in `source` as bytes, without their newline.
+    """
+
+    return iter_records(source, b"\n", chunk_size)
+# END iter_lines
+
+
+def read_records(source: Source, separator: str = "\n", chunk_size: int = CHUNK_SIZE, encoding: str = ENCODING) -> Iterator[str]:
+    """
+    Iterates over the records in `source` as text, without their `separator`.
+    Every chunk is decoded in one go, rather than line by line.
+    """
+
+    with open_source(source, chunk_size) as opened:
+        for chunk in iter_source_chunks(opened, separator.encode(encoding), chunk_size):
+            yield from chunk.decode(encoding).split(separator)
+        # END LOOP
+    # END WITH opened
+# END read_records
+
+
+def read_lines(source: Source, chunk_size: int = CHUNK_SIZE, encoding: str = ENCODING) -> Iterator[str]:
+    """
+    Iterates over the lines in `source` as text, without their newline.
+    """
+
+    return read_records(source, "\n", chunk_size, encoding)
+# END read_lines
+
+
+def read_bytes(source: Source) -> bytes:
+    with open_source(source) as opened:
+        if isinstance(opened, (bytes, mmap)):
+            return opened[:]
+        # END IF
+
+        return b"".join(opened)
+    # END WITH opened
+# END read_bytes
+
+
+def read_text(source: Source, encoding: str = ENCODING) -> str:
+    return read_bytes(source).decode(encoding)
+# END read_text
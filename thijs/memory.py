@@ -0,0 +1,190 @@
+import gc
+import sys
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from typing import List, Optional, Tuple
+
+from .batch import silence
+from .profiling import relative_location
+from .runner import (REFERENCE_ENGINE, Answer, Day, Engine, Part, load_part,
+                     resolve_engine, silenced)
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows, where the resident set size is not reported
+    resource = None
+# END TRY
+
+# The unit of `ru_maxrss`, which is reported in bytes on macOS and in kibibytes elsewhere
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass
+class AllocationSite:
+    # Formatted like `file:line`, relative to the package for its own modules
+    location: str
+    size: int
+    count: int
+# END AllocationSite
+
+
+@dataclass
+class MemoryReport:
+    # The peaks of the memory traced while parsing, and while solving with the parsed input still held
+    parse_peak: int
+    solve_peak: int
+
+    # The peak resident set size of the whole process, or `None` if the platform does not report it
+    peak_rss: Optional[int]
+
+    # The lines that allocated the most memory still held by the parsed input
+    allocation_sites: List[AllocationSite] = field(default_factory=list)
+
+    # The number of objects held by the parsed input, in total and for the most common types
+    n_objects: int = 0
+    object_counts: List[Tuple[str, int]] = field(default_factory=list)
+
+    # The number of collections the garbage collector ran while parsing and solving, per generation
+    gc_collections: List[int] = field(default_factory=list)
+
+    @property
+    def peak(self) -> int:
+        return max(self.parse_peak, self.solve_peak)
+    # END peak
+# END MemoryReport
+
+
+def peak_rss() -> Optional[int]:
+    if resource is None:
+        return None
+    # END IF
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT
+# END peak_rss
+
+
+def count_objects() -> Counter:
+    """
+    Counts the objects tracked by the garbage collector by the name of their type.
+    """
+
+    return Counter(type(instance).__qualname__ for instance in gc.get_objects())
+# END count_objects
+
+
+def count_collections() -> List[int]:
+    return [stats["collections"] for stats in gc.get_stats()]
+# END count_collections
+
+
+def measure_memory(day: Day, part: Part, input_path: Optional[str] = None, parameters: Optional[dict] = None, top: int = 10, engine: Engine = REFERENCE_ENGINE) -> Tuple[Answer, MemoryReport]:
+    """
+    Parses and solves the input of the given `day` and `part` while tracing the memory they allocate.
+    The allocation sites and the objects by type are taken once the input is parsed, since the structures a solver
+    builds while solving are gone by the time it returns.
+    """
+
+    if input_path is None:
+        input_path = load_part(day, part).INPUT_PATH
+    # END IF
+
+    module = load_part(day, part, resolve_engine(day, engine, input_path, [part]))
+
+    # The traces that some solvers print would otherwise end up in the report. The null device is opened before the
+    # census, so it does not count as an object of the solver
+    with silenced():
+        gc.collect()
+        objects_before = count_objects()
+        collections_before = count_collections()
+
+        tracemalloc.start()
+
+        try:
+            parsed = module.parse(input_path)
+            _, parse_peak = tracemalloc.get_traced_memory()
+
+            objects = count_objects() - objects_before
+
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__)
+            ])
+
+            allocation_sites = [
+                AllocationSite(
+                    location=f"{relative_location(statistic.traceback[0].filename)}:{statistic.traceback[0].lineno}",
+                    size=statistic.size,
+                    count=statistic.count
+                )
+                for statistic in snapshot.statistics("lineno")[:top]
+            ]
+
+            # The census and the snapshot should not count towards the peak of the solver
+            del snapshot
+            tracemalloc.reset_peak()
+
+            answer = module.solve(parsed, **(parameters or {}))
+            _, solve_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # END TRY
+    # END WITH silenced
+
+    collections = [after - before for before, after in zip(collections_before, count_collections())]
+
+    report = MemoryReport(
+        parse_peak=parse_peak,
+        solve_peak=solve_peak,
+        peak_rss=peak_rss(),
+        allocation_sites=allocation_sites,
+        n_objects=sum(objects.values()),
+        object_counts=objects.most_common(top),
+        gc_collections=collections
+    )
+
+    return answer, report
+# END measure_memory
+
+
+def measure_memory_isolated(day: Day, part: Part, input_path: Optional[str] = None, parameters: Optional[dict] = None, top: int = 10, engine: Engine = REFERENCE_ENGINE) -> Tuple[Answer, MemoryReport]:
+    """
+    Runs `measure_memory` in a fresh interpreter, so the peak resident set size belongs to this solver alone
+    rather than to everything the current process ran before.
+    """
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn"), initializer=silence) as executor:
+        return executor.submit(measure_memory, day, part, input_path, parameters, top, engine).result()
+    # END WITH executor
+# END measure_memory_isolated
+
+
+def format_size(size: int) -> str:
+    return f"{size / 2 ** 20:>10.2f} MiB"
+# END format_size
+
+
+def format_memory_report(report: MemoryReport) -> str:
+    lines = [
+        f"    parse peak   {format_size(report.parse_peak)}",
+        f"    solve peak   {format_size(report.solve_peak)}",
+        f"    peak RSS     {format_size(report.peak_rss) if report.peak_rss is not None else '-':>14}",
+        f"    gc runs      {' / '.join(str(collections) for collections in report.gc_collections):>14}",
+        "Allocation sites of the parsed input",
+    ]
+
+    for site in report.allocation_sites:
+        lines.append(f"    {format_size(site.size)} {site.count:>10} blocks  {site.location}")
+    # END LOOP
+
+    lines.append(f"Objects held by the parsed input ({report.n_objects} in total)")
+
+    for name, count in report.object_counts:
+        lines.append(f"    {count:>10}  {name}")
+    # END LOOP
+
+    return "\n".join(lines)
+# END format_memory_report
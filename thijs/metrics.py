@@ -0,0 +1,67 @@
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Iterator, List, TypeVar
+
+Metrics = Dict[str, int]
+
+Function = TypeVar("Function", bound=Callable)
+
+# The counters that are listening, of which the innermost is last
+recorders: List[Counter] = []
+
+
+def enabled() -> bool:
+    """
+    Returns `True` while metrics are being recorded, so solvers only derive the costlier counts when they are wanted.
+    """
+
+    return bool(recorders)
+# END enabled
+
+
+def count(name: str, amount: int = 1):
+    """
+    Adds `amount` to the counter with the given `name`, if metrics are being recorded.
+    Solvers keep their counts in locals, or derive them afterwards, and report them once per call rather than once
+    per step, so counting costs next to nothing when no metrics are recorded.
+    """
+
+    if recorders:
+        recorders[-1][name] += amount
+    # END IF
+# END count
+
+
+def count_calls(name: str, function: Function) -> Function:
+    """
+    Wraps `function` so every call adds one to the counter with the given `name`.
+    Meant to wrap a recursive function only while metrics are being recorded, so the function is left as is otherwise.
+    """
+
+    @wraps(function)
+    def counted(*args, **kwargs):
+        count(name)
+        return function(*args, **kwargs)
+    # END counted
+
+    return counted
+# END count_calls
+
+
+@contextmanager
+def record_metrics() -> Iterator[Counter]:
+    """
+    Records the counts of everything that runs within the block, in the counter that is yielded.
+    Recordings nest, with the counts going to the innermost one only.
+    """
+
+    counters: Counter = Counter()
+    recorders.append(counters)
+
+    try:
+        yield counters
+    finally:
+        recorders.remove(counters)
+    # END TRY
+# END record_metrics
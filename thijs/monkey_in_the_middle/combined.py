@@ -0,0 +1,55 @@
+from collections import deque
+from dataclasses import replace
+from typing import Iterator, List
+
+from ..io import Source
+from . import part_2
+from .part_2 import Game, Monkey, calculate_monkey_business
+
+INPUT_PATH = part_2.INPUT_PATH
+
+
+def play_with_relief(monkeys: List[Monkey], rounds: int = 20) -> int:
+    """
+    Plays the rounds of part 1 with copies of the monkeys of part 2, dividing every worry level by 3 after inspection.
+    Unlike the `Game` of part 1, this does not narrate every turn.
+    """
+
+    game = Game([replace(monkey, items=deque(monkey.items)) for monkey in monkeys])
+
+    for _ in range(0, rounds):
+        for monkey in game.monkeys:
+            while monkey.items:
+                worry_level = monkey.inspect(monkey.items.popleft()) // 3
+                partner = monkey.partners[0] if monkey.test(worry_level) else monkey.partners[1]
+
+                game.monkeys[partner].catch_item(worry_level)
+            # END LOOP
+        # END LOOP
+    # END LOOP
+
+    return calculate_monkey_business(game)
+# END play_with_relief
+
+
+def parse(path: Source) -> List[Monkey]:
+    return part_2.parse(path)
+# END parse
+
+
+def solve(monkeys: List[Monkey]) -> Iterator[int]:
+    yield play_with_relief(monkeys)
+    yield part_2.solve(monkeys)
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
@@ -1,8 +1,25 @@
+import re
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import partial
 from math import prod
+from os import path
 from typing import Callable, Deque, Iterable, List, Tuple
 
+from ..io import Source, read_records
+from ..metrics import count
+
+INPUT_PATH = path.join(path.dirname(__file__), "data")
+
+MONKEY_PATTERN = re.compile(
+    r"Monkey \d+:\n"
+    r"  Starting items: (?P<items>[\d, ]*)\n"
+    r"  Operation: new = old (?P<operator>[*+]) (?P<operand>old|\d+)\n"
+    r"  Test: divisible by (?P<test_value>\d+)\n"
+    r"    If true: throw to monkey (?P<if_true>\d+)\n"
+    r"    If false: throw to monkey (?P<if_false>\d+)"
+)
+
 WorryLevel = int
 Operation = Callable[[WorryLevel], WorryLevel]
 Test = Callable[[WorryLevel], bool]
@@ -10,6 +27,12 @@ Partners = Tuple[int, int]
 Throw = Tuple[int, WorryLevel]
 
 
+@dataclass
+class RegexParseException(Exception):
+    input_string: str
+# END RegexParseException
+
+
 @dataclass
 class Monkey:
     operation: Operation
@@ -72,6 +95,9 @@ class Game:
 
 
 def calculate_monkey_business(game: Game) -> int:
+    # Every monkey already counts its own inspections, so the total is reported once the game is over
+    count("monkey.inspections", sum(monkey.inspections for monkey in game.monkeys))
+
     inspections = sorted(
         (monkey.inspections for monkey in game.monkeys),
         reverse=True
@@ -80,69 +106,84 @@ def calculate_monkey_business(game: Game) -> int:
 # END calculate_monkey_business
 
 
-if __name__ == "__main__":
+def add(term: WorryLevel, old: WorryLevel) -> WorryLevel:
+    return old + term
+# END add
+
+
+def multiply(factor: WorryLevel, old: WorryLevel) -> WorryLevel:
+    return old * factor
+# END multiply
+
+
+def square(old: WorryLevel) -> WorryLevel:
+    return old * old
+# END square
+
+
+def parse_operation(operator: str, operand: str) -> Operation:
+    if operand == "old":
+        return square
+    # END IF
+
+    if operator == "*":
+        return partial(multiply, int(operand))
+    # END IF
+
+    return partial(add, int(operand))
+# END parse_operation
+
 
-    monkeys = [
-        Monkey(
-            items=deque([73, 77]),
-            operation=lambda old: old * 5,
-            test_value=11,
-            partners=(6, 5)
-        ),
-        Monkey(
-            items=deque([57, 88, 80]),
-            operation=lambda old: old + 5,
-            test_value=19,
-            partners=(6, 0)
-        ),
-        Monkey(
-            items=deque([61, 81, 84, 69, 77, 88]),
-            operation=lambda old: old * 19,
-            test_value=5,
-            partners=(3, 1)
-        ),
-        Monkey(
-            items=deque([78, 89, 71, 60, 81, 84, 87, 75]),
-            operation=lambda old: old + 7,
-            test_value=3,
-            partners=(1, 0)
-        ),
-        Monkey(
-            items=deque([60, 76, 90, 63, 86, 87, 89]),
-            operation=lambda old: old + 2,
-            test_value=13,
-
-            partners=(2, 7)
-        ),
-        Monkey(
-            items=deque([88]),
-            operation=lambda old: old + 1,
-            test_value=17,
-            partners=(4, 7)
-        ),
-        Monkey(
-            items=deque([84, 98, 78, 85]),
-            operation=lambda old: old * old,
-            test_value=7,
-            partners=(5, 4)
-        ),
-        Monkey(
-            items=deque([98, 89, 78, 73, 71]),
-            operation=lambda old: old + 4,
-            test_value=2,
-            partners=(3, 2)
-        ),
-    ]
-
-    game = Game(monkeys)
-
-    rounds = 10000
+def read_monkeys(path: Source) -> List[Monkey]:
+
+    monkeys: List[Monkey] = []
+
+    # Every monkey is described by a block of lines, separated by an empty line
+    blocks = (block.strip("\n") for block in read_records(path, "\n\n"))
+
+    for block in blocks:
+
+        matches = MONKEY_PATTERN.match(block)
+
+        if matches is None:
+            raise RegexParseException(block)
+        # END IF
+
+        group_dict = matches.groupdict()
+        items = [int(item) for item in group_dict['items'].split(", ") if item]
+
+        monkeys.append(Monkey(
+            items=deque(items),
+            operation=parse_operation(group_dict['operator'], group_dict['operand']),
+            test_value=int(group_dict['test_value']),
+            partners=(int(group_dict['if_true']), int(group_dict['if_false']))
+        ))
+    # END LOOP
+
+    return monkeys
+# END read_monkeys
+
+
+def parse(path: Source) -> List[Monkey]:
+    return read_monkeys(path)
+# END parse
+
+
+def solve(monkeys: List[Monkey], rounds: int = 10000) -> int:
+
+    # Plays with copies of the monkeys, so the parsed monkeys can be solved again
+    game = Game([replace(monkey, items=deque(monkey.items)) for monkey in monkeys])
 
     for _ in range(0, rounds):
         game.play_round()
     # END LOOP
 
-    monkey_business = calculate_monkey_business(game)
+    return calculate_monkey_business(game)
+# END solve
+
+
+if __name__ == "__main__":
+    monkeys = parse(INPUT_PATH)
 
-    print(monkey_business)
+    print(solve(monkeys))
 # END MAIN
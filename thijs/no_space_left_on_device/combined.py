@@ -0,0 +1,41 @@
+from typing import Iterator, List
+
+from ..io import Source
+from . import part_1
+from .part_1 import Directory
+
+INPUT_PATH = part_1.INPUT_PATH
+
+
+def parse(path: Source) -> Directory:
+    return part_1.parse(path)
+# END parse
+
+
+def solve(file_system: Directory) -> Iterator[int]:
+    """
+    Yields the answers of both parts, computing the size of every directory only once.
+    """
+
+    sizes = [directory.size for directory in file_system.tree().values()]
+
+    yield sum(size for size in sizes if size <= 100000)
+
+    # The root holds every other directory, so it is the largest
+    available_space = 70000000 - max(sizes)
+    required_space = max(0, 30000000 - available_space)
+
+    yield min(size for size in sizes if size >= required_space)
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
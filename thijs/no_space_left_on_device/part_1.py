@@ -3,6 +3,8 @@ from dataclasses import dataclass, field
 from os import path
 from typing import Dict, Iterable, Optional, Protocol
 
+from ..io import Source, read_lines
+
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
 
@@ -92,11 +94,8 @@ class Directory:
 # END Directory
 
 
-def read_terminal_output(path: str) -> Iterable[str]:
-    with open(path) as file:
-        terminal_output = (line.rstrip('/n') for line in file)
-        yield from terminal_output
-    # END LOOP
+def read_terminal_output(path: Source) -> Iterable[str]:
+    yield from read_lines(path)
 # END read_terminal_output
 
 
@@ -140,15 +139,23 @@ def parse_terminal_output(terminal_output: Iterable[str]):
 # END parse_terminal_output
 
 
-if __name__ == "__main__":
-    terminal_output = read_terminal_output(INPUT_PATH)
-    file_system = parse_terminal_output(terminal_output)
-
-    print(
-        sum(
-            directory.size
-            for directory in file_system.tree().values()
-            if directory.size <= 100000
-        )
+def parse(path: Source) -> Directory:
+    terminal_output = read_terminal_output(path)
+    return parse_terminal_output(terminal_output)
+# END parse
+
+
+def solve(file_system: Directory) -> int:
+    return sum(
+        directory.size
+        for directory in file_system.tree().values()
+        if directory.size <= 100000
     )
+# END solve
+
+
+if __name__ == "__main__":
+    file_system = parse(INPUT_PATH)
+
+    print(solve(file_system))
 # END IF
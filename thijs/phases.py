@@ -0,0 +1,69 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Iterator, List
+
+# The markers are kept apart from the profiler, so the solvers that use them do not import cProfile and pstats
+
+
+@dataclass
+class PhaseStats:
+    name: str
+    calls: int = 0
+    total_time: float = 0.0
+# END PhaseStats
+
+
+@dataclass
+class PhaseRecorder:
+    phases: Dict[str, PhaseStats] = field(default_factory=dict)
+
+    def get(self, name: str) -> PhaseStats:
+        """
+        Looks up the stats of the phase with the given `name`, so the phases are listed in the order they were entered.
+        """
+
+        return self.phases.setdefault(name, PhaseStats(name))
+    # END get
+# END PhaseRecorder
+
+
+# The recorders that are listening, of which the innermost is last
+recorders: List[PhaseRecorder] = []
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Marks a phase of a solver, like building a graph or searching it, for the profiling report.
+    Works as a context manager and as a decorator, and only measures while phases are being recorded.
+    """
+
+    if not recorders:
+        yield
+        return
+    # END IF
+
+    stats = recorders[-1].get(name)
+    start = perf_counter()
+
+    try:
+        yield
+    finally:
+        stats.calls += 1
+        stats.total_time += perf_counter() - start
+    # END TRY
+# END phase
+
+
+@contextmanager
+def record_phases() -> Iterator[PhaseRecorder]:
+    recorder = PhaseRecorder()
+    recorders.append(recorder)
+
+    try:
+        yield recorder
+    finally:
+        recorders.remove(recorder)
+    # END TRY
+# END record_phases
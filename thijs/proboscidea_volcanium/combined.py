@@ -0,0 +1,38 @@
+from typing import Iterator, List
+
+from ..io import Source
+from . import part_1, part_2
+from .part_1 import TunnelSystem, Valve
+
+INPUT_PATH = part_1.INPUT_PATH
+
+CODEC = part_1.CODEC
+
+
+def parse(path: Source) -> List[Valve]:
+    return part_1.parse(path)
+# END parse
+
+
+def solve(valves: List[Valve], starting_valve: str = "AA") -> Iterator[int]:
+    """
+    Yields the answers of both parts, which search the same tunnel system and so share its distance matrix.
+    """
+
+    tunnel_system = TunnelSystem.from_valves(valves)
+
+    yield part_1.find_max_pressure_release(tunnel_system, starting_valve, 30)
+    yield part_2.find_max_pressure_release(tunnel_system, starting_valve, 26)
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
@@ -1,11 +1,21 @@
 import re
-from collections import defaultdict, deque
+from array import array
+from collections import defaultdict
 from dataclasses import dataclass, field
 from os import path
-from typing import Deque, Dict, Iterable, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..graph import UNREACHABLE, CSRGraph, Interner, all_pairs_bfs, bfs
+from ..io import Buffer, Source, read_lines
+from ..metrics import count_calls, enabled
+from ..phases import phase
+from ..sidecar import (Codec, pack_ints, pack_sections, pack_strings,
+                       unpack_ints, unpack_sections, unpack_strings)
 
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
+VALVE_PATTERN = re.compile(r"^Valve (?P<label>[A-Z]+) has flow rate=(?P<flow_rate>\d+); tunnels? leads? to valves? (?P<neighbors>.*)$")
+
 Label = str
 Path = List[str]
 
@@ -31,11 +41,13 @@ class TunnelSystem:
         default_factory=lambda: defaultdict(set)
     )
 
-    _shortest_paths: Dict[Label, Dict[Label, Path]] = field(
-        default_factory=lambda: defaultdict(dict)
-    )
+    # The number of every valve, the tunnels between them and the hop counts between every pair, computed on first use
+    _interner: Optional[Interner] = field(default=None, init=False, compare=False, repr=False)
+    _graph: Optional[CSRGraph] = field(default=None, init=False, compare=False, repr=False)
+    _distances: Optional[List[array]] = field(default=None, init=False, compare=False, repr=False)
 
     @classmethod
+    @phase("build")
     def from_valves(cls, valves: Iterable[Valve]):
         instance = cls()
 
@@ -44,65 +56,71 @@ class TunnelSystem:
             instance.register_edges(valve.label, valve.neighbors)
         # END LOOP
 
+        instance.compute_distances()
+
         return instance
     # END from_valves
 
-    def shortest_path(self, source: Label, target: Label) -> Path:
-
-        if source in self._shortest_paths and target in self._shortest_paths[source]:
-            return self._shortest_paths[source][target]
-        # END IF
+    def compute_distances(self):
+        interner: Interner[Label] = Interner()
 
-        if source == target:
-            result: Path = []
+        for label in self.nodes:
+            interner.intern(label)
+        # END LOOP
 
-            self._shortest_paths[source][target] = result
-            self._shortest_paths[target][source] = result
+        for neighbors in self.edges.values():
+            for neighbor in neighbors:
+                interner.intern(neighbor)
+            # END LOOP
+        # END LOOP
 
-            return result
+        self._interner = interner
+        self._graph = CSRGraph.from_adjacency(
+            sorted(interner[neighbor] for neighbor in self.edges.get(label, ()))
+            for label in interner.labels
+        )
+        self._distances = all_pairs_bfs(self._graph)
+    # END compute_distances
+
+    def distance(self, source: Label, target: Label) -> int:
+        """
+        Returns the number of minutes it takes to walk from `source` to `target`, or `UNREACHABLE`
+        """
+
+        if self._distances is None:
+            self.compute_distances()
         # END IF
 
-        seen: Set[Label] = set()
-        paths: Deque[Path] = deque([[source]])
-
-        while len(paths) > 0:
-
-            path = paths.popleft()
-            current_node = path[-1]
+        return self._distances[self._interner[source]][self._interner[target]]
+    # END distance
 
-            if current_node in seen:
-                continue
-            # END IF
-
-            edges = [
-                label
-                for label in self.edges[current_node]
-                if label not in seen
-            ]
+    def distance_map(self) -> Dict[Label, Dict[Label, int]]:
+        """
+        Returns the distances between every pair of valves by their labels, for searches that look them up often
+        """
 
-            for label in edges:
-                branch = list(path)
-                branch.append(label)
+        if self._distances is None:
+            self.compute_distances()
+        # END IF
 
-                self._shortest_paths[source][label] = branch
-                self._shortest_paths[label][source] = branch
+        labels = self._interner.labels
 
-                if label == target:
-                    return branch
-                # END IF
+        return {source: dict(zip(labels, row)) for source, row in zip(labels, self._distances)}
+    # END distance_map
 
-                paths.append(branch)
-            # END LOOP
+    def shortest_path(self, source: Label, target: Label) -> Path:
+        """
+        Returns the valves on the way from `source` to `target`, both included, or an empty path if they are the same
+        """
 
-            seen.add(current_node)
-        # END LOOP
+        if source == target or self.distance(source, target) == UNREACHABLE:
+            return []
+        # END IF
 
-        result = []
-        
-        self._shortest_paths[source][target] = result
-        self._shortest_paths[target][source] = result
+        target_node = self._interner[target]
+        search = bfs(self._graph, [self._interner[source]], lambda node: node == target_node)
 
-        return result
+        return self._interner.lookup(search.path(target_node))
     # END shortest_path
 
     def get_node(self, label: str) -> Optional[Valve]:
@@ -111,40 +129,35 @@ class TunnelSystem:
 
     def register_edges(self, node: Label, edges: Set[Label]):
         self.edges[node] = edges
+        self._distances = None
     # END register_edges
 
     def register_node(self, valve: Valve):
         self.nodes[valve.label] = valve
+        self._distances = None
     # END register_node
 # END TunnelSystem
 
 
-def read_valves(path: str) -> Iterable[Valve]:
-
-    PATTERN = r"^Valve (?P<label>[A-Z]+) has flow rate=(?P<flow_rate>\d+); tunnels? leads? to valves? (?P<neighbors>.*)$"
-
-    with open(path) as file:
-
-        lines = (line.rstrip("\n") for line in file)
+def read_valves(path: Source) -> Iterable[Valve]:
 
-        for line in lines:
+    for line in read_lines(path):
 
-            matches = re.match(PATTERN, line)
+        matches = VALVE_PATTERN.match(line)
 
-            if matches is None:
-                raise RegexParseException(line)
-            # END IF
+        if matches is None:
+            raise RegexParseException(line)
+        # END IF
 
-            group_dict = matches.groupdict()
-            neighbors = group_dict['neighbors'].split(", ")
+        group_dict = matches.groupdict()
+        neighbors = group_dict['neighbors'].split(", ")
 
-            yield Valve(
-                label=group_dict['label'],
-                flow_rate=int(group_dict['flow_rate']),
-                neighbors=set(neighbors)
-            )
-        # END LOOP
-    # END WITH file
+        yield Valve(
+            label=group_dict['label'],
+            flow_rate=int(group_dict['flow_rate']),
+            neighbors=set(neighbors)
+        )
+    # END LOOP
 # END read_valves
 
 
@@ -153,6 +166,7 @@ def find_unblocked_valves(tunnel_system: TunnelSystem) -> Set[Label]:
 # END find_unblocked_valves
 
 
+@phase("search")
 def find_max_pressure_release(tunnel_system: TunnelSystem, starting_valve: Label, minutes: int):
 
     def dfs(current_valve: Label, closed_valves: Set[Label], time_remaining: int, pressure_released: int = 0) -> int:
@@ -161,15 +175,18 @@ def find_max_pressure_release(tunnel_system: TunnelSystem, starting_valve: Label
 
         for valve in closed_valves:
 
-            path = tunnel_system.shortest_path(current_valve, valve)
+            distance = distances[current_valve][valve]
+
+            # Walking to the valve and opening it takes a minute per tunnel, plus one
+            travel_time = distance + 1
 
             # A valve needs to be open for at least one minute to be of any effect
-            if len(path) > (time_remaining - 2):
+            if distance == UNREACHABLE or travel_time > (time_remaining - 2):
                 continue
             # END IF
 
             flow_rate = tunnel_system.nodes[valve].flow_rate
-            pressure_over_time = flow_rate * (time_remaining - len(path))
+            pressure_over_time = flow_rate * (time_remaining - travel_time)
 
             valves_remaining = closed_valves.copy()
             valves_remaining.discard(valve)
@@ -177,7 +194,7 @@ def find_max_pressure_release(tunnel_system: TunnelSystem, starting_valve: Label
             potential_pressure_released = dfs(
                 valve,
                 valves_remaining,
-                time_remaining - len(path),
+                time_remaining - travel_time,
                 pressure_released + pressure_over_time
             )
 
@@ -190,17 +207,75 @@ def find_max_pressure_release(tunnel_system: TunnelSystem, starting_valve: Label
         return result
     # END dfs
 
+    # The calls are only counted while metrics are recorded, so the search runs unwrapped otherwise
+    if enabled():
+        dfs = count_calls("dfs.calls", dfs)
+    # END IF
+
+    distances = tunnel_system.distance_map()
     unblocked_valves = find_unblocked_valves(tunnel_system)
 
     return dfs(starting_valve, unblocked_valves, minutes)
 # END find_max_pressure_release
 
 
-if __name__ == "__main__":
-    valves = read_valves(INPUT_PATH)
+def parse(path: Source) -> List[Valve]:
+    return list(read_valves(path))
+# END parse
+
+
+def encode_parsed(valves: List[Valve]) -> bytes:
+    """
+    Packs the labels and flow rates of the valves, and their neighbors as the positions of their labels.
+    """
+
+    positions = {valve.label: position for position, valve in enumerate(valves)}
+
+    neighbors = [sorted(positions[neighbor] for neighbor in valve.neighbors) for valve in valves]
+    offsets = [0]
+
+    for valve_neighbors in neighbors:
+        offsets.append(offsets[-1] + len(valve_neighbors))
+    # END LOOP
+
+    return pack_sections([
+        pack_strings([valve.label for valve in valves]),
+        pack_ints([valve.flow_rate for valve in valves]),
+        pack_ints(offsets),
+        pack_ints([position for valve_neighbors in neighbors for position in valve_neighbors])
+    ])
+# END encode_parsed
+
+
+def decode_parsed(buffer: Buffer) -> List[Valve]:
+    labels, flow_rates, offsets, neighbors = unpack_sections(buffer)
+
+    labels = unpack_strings(labels)
+    offsets = unpack_ints(offsets)
+    neighbors = unpack_ints(neighbors)
+
+    return [
+        Valve(
+            label=label,
+            flow_rate=flow_rate,
+            neighbors={labels[position] for position in neighbors[offsets[index]:offsets[index + 1]]}
+        )
+        for index, (label, flow_rate) in enumerate(zip(labels, unpack_ints(flow_rates)))
+    ]
+# END decode_parsed
+
+
+CODEC = Codec(encode_parsed, decode_parsed)
+
+
+def solve(valves: List[Valve], minutes: int = 30) -> int:
     tunnel_system = TunnelSystem.from_valves(valves)
+    return find_max_pressure_release(tunnel_system, "AA", minutes)
+# END solve
 
-    max_pressure_release = find_max_pressure_release(tunnel_system, "AA", 30)
 
-    print(max_pressure_release)
+if __name__ == "__main__":
+    valves = parse(INPUT_PATH)
+
+    print(solve(valves))
 # END IF
@@ -37,3 +37,19 @@ def test__find_max_pressure_release(data: List[Valve]):
 
     assert max_pressure_release == 2253
 # END test__find_max_pressure_release_sample_data
+
+
+def test__tunnel_system_caches_not_compared(sample_data: List[Valve]):
+    tunnel_system = TunnelSystem.from_valves(sample_data)
+
+    # A system that did not compute its distances yet holds the same valves and tunnels
+    unprepared = TunnelSystem()
+
+    for valve in sample_data:
+        unprepared.register_node(valve)
+        unprepared.register_edges(valve.label, valve.neighbors)
+    # END LOOP
+
+    assert unprepared == tunnel_system
+    assert "_distances" not in repr(tunnel_system)
+# END test__tunnel_system_caches_not_compared
@@ -0,0 +1,220 @@
+import cProfile
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from os import path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .phases import PhaseStats, phase, record_phases
+from .runner import (REFERENCE_ENGINE, Answer, Day, Engine, Part, load_part,
+                     resolve_engine, silenced)
+
+PACKAGE_PATH = path.dirname(__file__)
+
+# The seconds between two samples of the line that is running
+DEFAULT_SAMPLE_INTERVAL = 0.001
+
+Location = Tuple[str, int, str]
+
+
+@dataclass
+class LineSampler:
+    """
+    Samples the line the given thread is running at a fixed interval, from a background thread.
+    Only lines in this package count, so the report points at the solvers rather than the standard library.
+    """
+
+    thread_id: int = field(default_factory=threading.get_ident)
+    interval: float = DEFAULT_SAMPLE_INTERVAL
+
+    counts: Counter = field(default_factory=Counter)
+    samples: int = 0
+
+    def __post_init__(self):
+        self.stopped = threading.Event()
+        self.sampler = threading.Thread(target=self.run, name="thijs-line-sampler", daemon=True)
+    # END __post_init__
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+
+            # Walks out of library code to the innermost line of the package
+            while frame is not None and not frame.f_code.co_filename.startswith(PACKAGE_PATH):
+                frame = frame.f_back
+            # END LOOP
+
+            self.samples += 1
+
+            if frame is not None:
+                code = frame.f_code
+                self.counts[(code.co_filename, frame.f_lineno, code.co_name)] += 1
+            # END IF
+        # END LOOP
+    # END run
+
+    def __enter__(self) -> "LineSampler":
+        self.sampler.start()
+        return self
+    # END __enter__
+
+    def __exit__(self, *exception):
+        self.stopped.set()
+        self.sampler.join()
+    # END __exit__
+
+    def top(self, n: int) -> List[Tuple[Location, int]]:
+        return self.counts.most_common(n)
+    # END top
+# END LineSampler
+
+
+@dataclass
+class FunctionStats:
+    # Formatted like `file:line(function)`, relative to the package for its own modules
+    function: str
+    calls: int
+    total_time: float
+    cumulative_time: float
+# END FunctionStats
+
+
+SORT_KEYS: Dict[str, Callable[[FunctionStats], float]] = {
+    "tottime": lambda row: row.total_time,
+    "cumtime": lambda row: row.cumulative_time,
+}
+
+
+@dataclass
+class ProfileReport:
+    phases: List[PhaseStats]
+    functions: List[FunctionStats]
+
+    # The most sampled lines with their sample counts, if lines were sampled
+    lines: List[Tuple[Location, int]] = field(default_factory=list)
+    samples: int = 0
+# END ProfileReport
+
+
+def relative_location(filename: str) -> str:
+    if filename.startswith(PACKAGE_PATH):
+        return path.relpath(filename, path.dirname(PACKAGE_PATH))
+    # END IF
+
+    return filename
+# END relative_location
+
+
+def top_functions(profiler: cProfile.Profile, n: int, sort: str = "tottime") -> List[FunctionStats]:
+    """
+    Lists the `n` functions with the highest internal time, or cumulative time if `sort` is `cumtime`.
+    """
+
+    rows = [
+        FunctionStats(
+            function=f"{relative_location(filename)}:{line}({name})",
+            calls=calls,
+            total_time=total_time,
+            cumulative_time=cumulative_time
+        )
+        for (filename, line, name), (_, calls, total_time, cumulative_time, _) in pstats.Stats(profiler).stats.items()
+    ]
+
+    rows.sort(key=SORT_KEYS[sort], reverse=True)
+
+    return rows[:n]
+# END top_functions
+
+
+@contextmanager
+def profile(top: int = 20, sort: str = "tottime", dump_path: Optional[str] = None, sample_lines: bool = False, sample_interval: float = DEFAULT_SAMPLE_INTERVAL) -> Iterator[ProfileReport]:
+    """
+    Profiles the enclosed code with cProfile, records its phases and optionally samples its lines.
+    The report is filled in once the block exits, and the raw stats are written to `dump_path` if given.
+    """
+
+    report = ProfileReport(phases=[], functions=[])
+    profiler = cProfile.Profile()
+    sampler = LineSampler(interval=sample_interval) if sample_lines else None
+
+    with ExitStack() as stack:
+        recorder = stack.enter_context(record_phases())
+
+        if sampler is not None:
+            stack.enter_context(sampler)
+        # END IF
+
+        profiler.enable()
+        stack.callback(profiler.disable)
+
+        yield report
+    # END WITH stack
+
+    report.phases = list(recorder.phases.values())
+    report.functions = top_functions(profiler, top, sort)
+
+    if sampler is not None:
+        report.lines = sampler.top(top)
+        report.samples = sampler.samples
+    # END IF
+
+    if dump_path is not None:
+        profiler.dump_stats(dump_path)
+    # END IF
+# END profile
+
+
+def format_report(report: ProfileReport) -> str:
+    lines = ["Phases"]
+
+    for stats in report.phases:
+        lines.append(f"    {stats.name:<16} {stats.total_time * 1000:>12.3f} ms  {stats.calls:>8} calls")
+    # END LOOP
+
+    lines.append("Hot functions")
+    lines.append(f"    {'calls':>10} {'tottime':>10} {'cumtime':>10}  function")
+
+    for row in report.functions:
+        lines.append(f"    {row.calls:>10} {row.total_time:>10.4f} {row.cumulative_time:>10.4f}  {row.function}")
+    # END LOOP
+
+    if report.samples:
+        lines.append(f"Hot lines ({report.samples} samples)")
+
+        for (filename, line, name), count in report.lines:
+            lines.append(f"    {count:>10} {count / report.samples:>9.1%}  {relative_location(filename)}:{line}({name})")
+        # END LOOP
+    # END IF
+
+    return "\n".join(lines)
+# END format_report
+
+
+def profile_part(day: Day, part: Part, input_path: Optional[str] = None, engine: Engine = REFERENCE_ENGINE, **options) -> Tuple[Answer, ProfileReport]:
+    """
+    Parses and solves the input of the given `day` and `part` under the profiler, bypassing the caches.
+    The `parse` and `solve` phases are always recorded, around any phases the solver marks itself.
+    The `options` are passed on to `profile`.
+    """
+
+    if input_path is None:
+        input_path = load_part(day, part).INPUT_PATH
+    # END IF
+
+    module = load_part(day, part, resolve_engine(day, engine, input_path, [part]))
+
+    with silenced(), profile(**options) as report:
+        with phase("parse"):
+            parsed = module.parse(input_path)
+        # END WITH phase
+
+        with phase("solve"):
+            answer = module.solve(parsed)
+        # END WITH phase
+    # END WITH report
+
+    return answer, report
+# END profile_part
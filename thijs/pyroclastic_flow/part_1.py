@@ -1,9 +1,19 @@
+from os import path
 from typing import List
 
+from ..grid import Grid
+from ..io import Source, read_text
+from ..metrics import count
+
+INPUT_PATH = path.join(path.dirname(__file__), "data")
+
 Vertex = List[int]
 Shape = List[Vertex]
 JetPattern = str
 
+# The width of the chamber the rocks fall into
+WIDTH = 7
+
 HORIZONRAL: Shape = [
     [0, 0, 1, 1, 1, 1, 0]
 ]
@@ -65,36 +75,58 @@ def merge(a: Vertex, b: Vertex) -> Vertex:
 # END merge
 
 
+def collides(tower: Grid, shape: Shape, y: int) -> bool:
+    """
+    Returns `True` if the given `shape` overlaps the rocks in the `tower` when its bottom row is at height `y`.
+    """
+
+    cells = tower.cells
+
+    for vertex in reversed(shape):
+        if 0 <= y < tower.height:
+            start = y * WIDTH
+
+            for x, cell in enumerate(vertex):
+                if cell and cells[start + x]:
+                    return True
+                # END IF
+            # END LOOP
+        # END IF
+
+        y += 1
+    # END LOOP
+
+    return False
+# END collides
+
+
 MOVEMENTS = {
     ">": shift_right,
     "<": shift_left
 }
 
 
-def read_jet_pattern(path: str) -> JetPattern:
-    with open(path) as file:
-        return file.read()
-    # END WITH file
+def read_jet_pattern(path: Source) -> JetPattern:
+    return read_text(path)
 # END read_jet_pattern
 
 
-def simulate_falling_rocks(n_rocks: int, jet_pattern: JetPattern) -> Shape:
+def simulate_falling_rocks(n_rocks: int, jet_pattern: JetPattern) -> Grid:
+    """
+    Drops `n_rocks` rocks into the chamber and returns the tower they form, one row of the grid per unit of height.
+    The bottom row of the tower is the floor.
+    """
 
-    tower: Shape = [[1, 1, 1, 1, 1, 1, 1]]
+    tower = Grid(WIDTH, 1, cells=bytearray([1]) * WIDTH)
     ticks = 0
 
     for i in range(n_rocks):
 
-        base_y = len(tower) + 3
+        base_y = tower.height + 3
         shape = ROCKS[i % len(ROCKS)]
         dy = 0
 
-        while not any(
-            has_collision(vertex, tower[base_y - dy + index])
-            for index, vertex
-            in enumerate(reversed(shape))
-            if 0 <= base_y - dy + index < len(tower)
-        ):
+        while not collides(tower, shape, base_y - dy):
             direction = jet_pattern[ticks % len(jet_pattern)]
             movement = MOVEMENTS[direction]
             shape = movement(shape)
@@ -106,13 +138,40 @@ def simulate_falling_rocks(n_rocks: int, jet_pattern: JetPattern) -> Shape:
         for index, vertex in enumerate(reversed(shape)):
             y = base_y - (dy - 1) + index
 
-            if y < len(tower):
-                tower[y] = merge(vertex, tower[y])
-            else:
-                tower.append(vertex)
+            if y >= tower.height:
+                tower.add_rows(y - tower.height + 1)
+            # END IF
+
+            for x, cell in enumerate(vertex):
+                if cell:
+                    tower[(x, y)] = cell
+                # END IF
             # END LOOP
         # END LOOP
     # END LOOP
 
+    count("rocks.dropped", n_rocks)
+    count("rocks.jet_ticks", ticks)
+
     return tower
 # END simulate_falling_rocks
+
+
+def parse(path: Source) -> JetPattern:
+    return read_jet_pattern(path)
+# END parse
+
+
+def solve(jet_pattern: JetPattern, n_rocks: int = 2022) -> int:
+    tower = simulate_falling_rocks(n_rocks, jet_pattern)
+
+    # The bottom row of the tower is the floor
+    return len(tower) - 1
+# END solve
+
+
+if __name__ == "__main__":
+    jet_pattern = parse(INPUT_PATH)
+
+    print(solve(jet_pattern))
+# END MAIN
@@ -0,0 +1,43 @@
+from typing import Iterator, List
+
+from ..io import Source
+from . import part_1, part_2
+from .part_1 import SAND, CaveSystem, Segment
+
+INPUT_PATH = part_1.INPUT_PATH
+
+
+def parse(path: Source) -> List[Segment]:
+    return part_1.parse(path)
+# END parse
+
+
+def solve(rock_segments: List[Segment]) -> Iterator[int]:
+    """
+    Yields the answers of both parts from a single cave.
+    Until the first grain falls past the lowest rock, the sand comes to rest in the same places with or without a
+    floor. Part 2 therefore continues from the sand of part 1, rather than dropping every grain again.
+    """
+
+    cave_system = CaveSystem()
+    cave_system.init_rock_map(rock_segments)
+    cave_system.simulate_sand()
+
+    yield cave_system.cave.count(SAND)
+
+    part_2.CaveSystem(cave_system.cave, cave_system.sand_entrance, cave_system.floor_y).simulate_sand()
+
+    yield cave_system.cave.count(SAND)
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
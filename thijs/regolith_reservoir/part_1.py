@@ -1,13 +1,22 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from itertools import tee
 from os import path
-from typing import Iterable, Set, Tuple
+from typing import Iterable, List, Optional, Set, Tuple
+
+from ..grid import MAX_DENSE_CELLS, AnyGrid, Cell, SparseGrid, make_grid
+from ..io import Source, read_lines
+from ..metrics import count, enabled
+from ..phases import phase
 
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
 Point = Tuple[int, int]
 Segment = Tuple[Point, Point]
 
+AIR: Cell = 0
+ROCK: Cell = 1
+SAND: Cell = 2
+
 
 def pairwise(iterable):
     a, b = tee(iterable)
@@ -22,28 +31,78 @@ def fmt_point(point: str) -> Point:
 # END fmt_point
 
 
-def read_rock_segments(path: str) -> Iterable[Segment]:
-    with open(path) as file:
-        rock_paths = (line.rstrip("\n") for line in file)
-        for rock_path in rock_paths:
-            yield from pairwise(
-                fmt_point(point)
-                for point in rock_path.split(" -> ")
-            )
-        # END LOOP
-    # END WITH file
+def read_rock_segments(path: Source) -> Iterable[Segment]:
+    for rock_path in read_lines(path):
+        yield from pairwise(
+            fmt_point(point)
+            for point in rock_path.split(" -> ")
+        )
+    # END LOOP
 # END read_rock_segments
 
 
 @dataclass
 class CaveSystem:
 
-    rock_map: Set[Point] = field(default_factory=set)
+    cave: Optional[AnyGrid] = None
 
     sand_entrance: Point = (500, 0)
-    sand_map: Set[Point] = field(default_factory=set)
 
+    # The depth of the floor, two rows below the lowest rock, which a sparse cave does not know by its height
+    floor_y: int = 0
+
+    # A cave of more cells than this, like one with a rock far below the others, is stored as a sparse grid instead
+    max_cells: int = MAX_DENSE_CELLS
+
+    @property
+    def rock_map(self) -> Set[Point]:
+        """
+        Collects the points of the rocks, which are stored in the cells of the cave
+        """
+
+        return self.find(ROCK)
+    # END rock_map
+
+    @property
+    def sand_map(self) -> Set[Point]:
+        """
+        Collects the points of the sand that came to rest, which is stored in the cells of the cave
+        """
+
+        return self.find(SAND)
+    # END sand_map
+
+    def find(self, material: Cell) -> Set[Point]:
+        if self.cave is None:
+            return set()
+        # END IF
+
+        if isinstance(self.cave, SparseGrid):
+            return {point for point, cell in self.cave.cells.items() if cell == material}
+        # END IF
+
+        return {
+            self.cave.point(index)
+            for index, cell in enumerate(self.cave.cells)
+            if cell == material
+        }
+    # END find
+
+    @phase("build")
     def init_rock_map(self, segments: Iterable[Segment]):
+        segments = list(segments)
+
+        entrance_x, _ = self.sand_entrance
+        floor_y = max((y for segment in segments for _, y in segment), default=0) + 2
+
+        # Sand moves at most one step sideways for every step down, so it never gets further from the entrance than the floor is deep
+        xs = [x for segment in segments for x, _ in segment]
+        min_x = min(xs + [entrance_x - floor_y]) - 1
+        max_x = max(xs + [entrance_x + floor_y]) + 1
+
+        self.floor_y = floor_y
+        self.cave = make_grid(max_x - min_x + 1, floor_y + 1, origin=(min_x, 0), max_cells=self.max_cells)
+
         for a, b in segments:
             x_a, y_a = a
             x_b, y_b = b
@@ -52,64 +111,133 @@ class CaveSystem:
             x_end = max(x_a, x_b)
 
             for x in range(x_start, x_end + 1):
-                self.rock_map.add((x, y_a))
+                self.cave[(x, y_a)] = ROCK
             # END LOOP
 
             y_start = min(y_a, y_b)
             y_end = max(y_a, y_b)
 
             for y in range(y_start, y_end + 1):
-                self.rock_map.add((x_a, y))
+                self.cave[(x_a, y)] = ROCK
             # END LOOP
         # END LOOP
     # END init_rock_map
 
-    def simulate_sand(self):
+    def sand_depth(self) -> int:
+        """
+        Sums the number of rows every grain of sand came to rest below the entrance.
+        Every step of a grain takes it one row down, so this is also the number of steps the grains took.
+        """
 
-        x, y = self.sand_entrance
-        max_y = max(y for _, y in self.rock_map)
+        cells = self.cave.cells
+        width = self.cave.width
+        entrance_row = self.cave.index(self.sand_entrance) // width
 
-        while y < max_y:
-            if not (
-                (x, y + 1) in self.rock_map
-                or (x, y + 1) in self.sand_map
-            ):
-                y += 1
+        return sum(
+            (row - entrance_row) * cells.count(SAND, row * width, (row + 1) * width)
+            for row in range(entrance_row, self.cave.height)
+        )
+    # END sand_depth
+
+    @phase("search")
+    def simulate_sand(self):
+        if isinstance(self.cave, SparseGrid):
+            self.simulate_sparse_sand()
+            return
+        # END IF
+
+        cells = self.cave.cells
+        width = self.cave.width
+
+        # The grain is tracked by the index of its cell, so the cell below it is one row, or `width` cells, further
+        entrance = self.cave.index(self.sand_entrance)
+        index = entrance
+        # The cave reaches two rows below the lowest rock, where the floor would be
+        max_y = self.cave.height - 3
+        end = max_y * width
+
+        if enabled():
+            grains, depth = self.cave.count(SAND), self.sand_depth()
+        # END IF
+
+        while index < end:
+            below = index + width
+
+            if not cells[below]:
+                index = below
                 continue
             # END IF
 
-            if not (
-                (x - 1, y + 1) in self.rock_map
-                or (x - 1, y + 1) in self.sand_map
-            ):
-                x -= 1
-                y += 1
+            if not cells[below - 1]:
+                index = below - 1
                 continue
             # END IF
 
-            if not (
-                (x + 1, y + 1) in self.rock_map
-                or (x + 1, y + 1) in self.sand_map
-            ):
-                x += 1
-                y += 1
+            if not cells[below + 1]:
+                index = below + 1
                 continue
             # END IF
 
-            self.sand_map.add((x, y))
-            x, y = self.sand_entrance
+            cells[index] = SAND
+            index = entrance
         # END LOOP
+
+        if enabled():
+            # The last grain fell from the entrance into the abyss, without coming to rest
+            count("sand.grains", self.cave.count(SAND) - grains)
+            count("sand.steps", self.sand_depth() - depth + max_y - entrance // width)
+        # END IF
     # END simulate_sand
 
+    def simulate_sparse_sand(self):
+        """
+        Drops the sand into a sparse cave one point at a time, like `simulate_sand` does by the index of a cell.
+        """
+
+        cave = self.cave
+        entrance = self.sand_entrance
+        x, y = entrance
+        # The lowest rock is two rows above the floor, and a grain that gets as deep falls into the abyss
+        max_y = self.floor_y - 2
+        grains = steps = 0
+
+        while y < max_y:
+            below = next(((x + dx, y + 1) for dx in (0, -1, 1) if cave[(x + dx, y + 1)] == AIR), None)
+
+            if below is None:
+                cave[(x, y)] = SAND
+                grains += 1
+                x, y = entrance
+                continue
+            # END IF
+
+            x, y = below
+            steps += 1
+        # END LOOP
+
+        count("sand.grains", grains)
+        count("sand.steps", steps)
+    # END simulate_sparse_sand
+
 # END CaveSystem
 
 
-if __name__ == "__main__":
+def parse(path: Source) -> List[Segment]:
+    return list(read_rock_segments(path))
+# END parse
+
 
+def solve(rock_segments: List[Segment]) -> int:
     cave_system = CaveSystem()
-    rock_segments = read_rock_segments(INPUT_PATH)
     cave_system.init_rock_map(rock_segments)
     cave_system.simulate_sand()
 
-    print(len(cave_system.sand_map))
+    return cave_system.cave.count(SAND)
+# END solve
+
+
+if __name__ == "__main__":
+    rock_segments = parse(INPUT_PATH)
+
+    print(solve(rock_segments))
 # END MAIN
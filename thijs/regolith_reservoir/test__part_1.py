@@ -3,6 +3,8 @@ from typing import Iterable
 
 from pytest import fixture
 
+from ..grid import SparseGrid
+from ..metrics import record_metrics
 from .part_1 import CaveSystem, Segment, read_rock_segments
 
 
@@ -53,3 +55,38 @@ def test__simulate_sand(data: Iterable[Segment]):
 
     assert len(cave_system.sand_map) == 795
 # END test__simulate_sand
+
+
+def test__simulate_sand_sparse(data: Iterable[Segment]):
+    segments = list(data)
+
+    dense = CaveSystem()
+    sparse = CaveSystem(max_cells=0)
+
+    with record_metrics() as dense_metrics:
+        dense.init_rock_map(segments)
+        dense.simulate_sand()
+    # END WITH dense_metrics
+
+    with record_metrics() as sparse_metrics:
+        sparse.init_rock_map(segments)
+        sparse.simulate_sand()
+    # END WITH sparse_metrics
+
+    assert isinstance(sparse.cave, SparseGrid)
+    assert sparse.rock_map == dense.rock_map
+    assert sparse.sand_map == dense.sand_map
+    assert sparse_metrics == dense_metrics
+# END test__simulate_sand_sparse
+
+
+def test__simulate_sand_far_rock(sample_data: Iterable[Segment]):
+    cave_system = CaveSystem()
+
+    # A rock this deep would make a dense cave of about 2 * 10 ** 10 cells
+    cave_system.init_rock_map(list(sample_data) + [((100000, 100000), (100000, 100000))])
+    cave_system.simulate_sand()
+
+    assert isinstance(cave_system.cave, SparseGrid)
+    assert len(cave_system.sand_map) == 24
+# END test__simulate_sand_far_rock
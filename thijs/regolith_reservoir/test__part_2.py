@@ -3,6 +3,9 @@ from typing import Iterable
 
 from pytest import fixture
 
+from ..grid import SparseGrid
+from ..metrics import record_metrics
+from . import part_1
 from .part_2 import CaveSystem, Segment, read_rock_segments
 
 
@@ -53,3 +56,37 @@ def test__simulate_sand(data: Iterable[Segment]):
 
     assert len(cave_system.sand_map) == 30214
 # END test__simulate_sand
+
+
+def test__simulate_sand_sparse(sample_data: Iterable[Segment]):
+    segments = list(sample_data)
+
+    dense = CaveSystem()
+    sparse = CaveSystem(max_cells=0)
+
+    with record_metrics() as dense_metrics:
+        dense.init_rock_map(segments)
+        dense.simulate_sand()
+    # END WITH dense_metrics
+
+    with record_metrics() as sparse_metrics:
+        sparse.init_rock_map(segments)
+        sparse.simulate_sand()
+    # END WITH sparse_metrics
+
+    assert isinstance(sparse.cave, SparseGrid)
+    assert sparse.sand_map == dense.sand_map
+    assert sparse_metrics == dense_metrics
+# END test__simulate_sand_sparse
+
+
+def test__simulate_sand_sparse_after_part_1(sample_data: Iterable[Segment]):
+    # Part 2 continues from the sand of part 1 in the same sparse cave, as the combined module does
+    cave_system = part_1.CaveSystem(max_cells=0)
+    cave_system.init_rock_map(sample_data)
+    cave_system.simulate_sand()
+
+    CaveSystem(cave_system.cave, cave_system.sand_entrance, cave_system.floor_y).simulate_sand()
+
+    assert len(cave_system.sand_map) == 93
+# END test__simulate_sand_sparse_after_part_1
@@ -0,0 +1,30 @@
+from typing import Iterator, List
+
+from ..io import Source
+from . import part_1, part_2
+from .part_1 import Round
+
+INPUT_PATH = part_1.INPUT_PATH
+
+
+def parse(path: Source) -> List[Round]:
+    return part_1.parse(path)
+# END parse
+
+
+def solve(rounds: List[Round]) -> Iterator[int]:
+    yield part_1.solve(rounds)
+    yield part_2.solve(rounds)
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
@@ -0,0 +1,2 @@
+# Counts the nine kinds of round straight from the bytes, in chunks of whole lines, so it suits inputs of any size
+MIN_INPUT_BYTES = 1
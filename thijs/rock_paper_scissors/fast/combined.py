@@ -0,0 +1,25 @@
+from typing import Iterator, List
+
+from ...io import Source
+from . import part_1, part_2
+from .part_1 import Histogram, read_histogram
+
+
+def parse(path: Source) -> Histogram:
+    return read_histogram(path)
+# END parse
+
+
+def solve(histogram: Histogram) -> Iterator[int]:
+    """
+    Yields the answers of both parts from the same counts, which only differ in the scores they weigh them by.
+    """
+
+    yield part_1.solve(histogram)
+    yield part_2.solve(histogram)
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
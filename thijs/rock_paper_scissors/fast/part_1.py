@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from ...io import CHUNK_SIZE, Source, iter_source_chunks, open_source
+from .. import part_1 as reference
+
+# The number of times every kind of round was played, in the order of `ROUNDS`
+Histogram = List[int]
+
+# Every line of the input is one of these nine rounds, of a move, a space and the answer to it
+ROUNDS = [f"{move} {answer}".encode() for move in "ABC" for answer in "XYZ"]
+
+# The score of every kind of round, in the order of `ROUNDS`, taken from the reference so the two cannot disagree
+SCORES = [reference.play_round(*round.decode().split(" ")) for round in ROUNDS]
+
+NEWLINE = b"\n"
+
+
+@dataclass
+class RoundFormatException(Exception):
+    # The number of lines in the chunk, and the number of those that were a known round
+    n_lines: int
+    n_rounds: int
+# END RoundFormatException
+
+
+def count_chunk(chunk: bytes) -> Histogram:
+    """
+    Counts the rounds in a `chunk` of whole lines, with one `bytes.count` per kind of round rather than a pass per line.
+    No round spans a newline, so the counts are exact, and those of separate chunks simply add up.
+    """
+
+    histogram = [chunk.count(round) for round in ROUNDS]
+
+    n_lines = chunk.count(NEWLINE) + 1
+    n_rounds = sum(histogram)
+
+    # Every line is three bytes exactly when the chunk has the size of that many lines and every fourth byte is a
+    # newline, and every such line is a known round exactly when the rounds cover all lines
+    is_aligned = len(chunk) == 4 * n_lines - 1 and chunk[3::4] == NEWLINE * (n_lines - 1)
+
+    if not is_aligned or n_rounds != n_lines:
+        raise RoundFormatException(n_lines, n_rounds)
+    # END IF
+
+    return histogram
+# END count_chunk
+
+
+def add_histograms(histogram: Histogram, other: Histogram) -> Histogram:
+    return [count + other_count for count, other_count in zip(histogram, other)]
+# END add_histograms
+
+
+def read_histogram(path: Source) -> Histogram:
+    """
+    Counts the rounds in the input chunk by chunk, so only a single chunk is held in memory at a time.
+    """
+
+    histogram = [0] * len(ROUNDS)
+
+    with open_source(path) as opened:
+        for chunk in iter_source_chunks(opened, NEWLINE, CHUNK_SIZE):
+            histogram = add_histograms(histogram, count_chunk(chunk))
+        # END LOOP
+    # END WITH opened
+
+    return histogram
+# END read_histogram
+
+
+def calculate_total_score(histogram: Histogram, scores: Sequence[int]) -> int:
+    return sum(count * score for count, score in zip(histogram, scores))
+# END calculate_total_score
+
+
+def parse(path: Source) -> Histogram:
+    return read_histogram(path)
+# END parse
+
+
+def solve(histogram: Histogram) -> int:
+    return calculate_total_score(histogram, SCORES)
+# END solve
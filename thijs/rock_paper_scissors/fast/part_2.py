@@ -0,0 +1,16 @@
+from ...io import Source
+from .. import part_2 as reference
+from .part_1 import ROUNDS, Histogram, calculate_total_score, read_histogram
+
+# The score of every kind of round when the answer is read as the outcome, in the order of `ROUNDS`
+SCORES = [reference.play_round(*round.decode().split(" ")) for round in ROUNDS]
+
+
+def parse(path: Source) -> Histogram:
+    return read_histogram(path)
+# END parse
+
+
+def solve(histogram: Histogram) -> int:
+    return calculate_total_score(histogram, SCORES)
+# END solve
@@ -0,0 +1,45 @@
+from pytest import raises
+
+from ...generators import generate
+from .. import combined as reference
+from .combined import solve_all
+from .part_1 import (ROUNDS, RoundFormatException, add_histograms,
+                     count_chunk, read_histogram)
+
+SAMPLE_DATA = "A Y\nB X\nC Z\n"
+
+
+def test__count_chunk():
+    assert count_chunk(b"A Y\nB X\nC Z\nA Y") == [0, 2, 0, 1, 0, 0, 0, 0, 1]
+    assert add_histograms([1] * len(ROUNDS), count_chunk(b"C Z")) == [1, 1, 1, 1, 1, 1, 1, 1, 2]
+# END test__count_chunk
+
+
+def test__count_chunk_malformed():
+    for chunk in (b"A Y\nD X", b"A Y\n\nB X", b"A Y\r\nB X", b"A YB X", b"A YB X\n\nC Z", b"A YB\nX\nC Z", b"\n\n\n"):
+        with raises(RoundFormatException):
+            count_chunk(chunk)
+        # END WITH raises
+    # END LOOP
+# END test__count_chunk_malformed
+
+
+def test__read_histogram(tmpdir):
+    input_path = tmpdir.join("sample_data")
+    input_path.write(SAMPLE_DATA)
+
+    assert read_histogram(str(input_path)) == [0, 1, 0, 1, 0, 0, 0, 0, 1]
+    assert solve_all(str(input_path)) == [15, 12]
+
+    with open(str(input_path), "rb") as file:
+        assert read_histogram(file) == [0, 1, 0, 1, 0, 0, 0, 0, 1]
+    # END WITH file
+# END test__read_histogram
+
+
+def test__solve_matches_reference(tmpdir):
+    input_path = generate("rock_paper_scissors", str(tmpdir.join("generated")), size=5000, seed=2)
+
+    assert solve_all(input_path) == reference.solve_all(input_path)
+    assert solve_all(reference.INPUT_PATH) == [12156, 10835]
+# END test__solve_matches_reference
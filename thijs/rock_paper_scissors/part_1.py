@@ -1,6 +1,8 @@
 from os import path
 from typing import Iterable, List
 
+from ..io import Source, read_lines
+
 INPUT_PATH = path.join(path.dirname(__file__), 'data')
 
 Round = List[str]
@@ -25,12 +27,10 @@ shape_value = {
 }
 
 
-def read_rounds(path: str) -> Iterable[Round]:
-    with open(path) as file:
-        for move in file:
-            yield move.rstrip('\n').split(' ')
-        # END LOOP
-    # END WITH file
+def read_rounds(path: Source) -> Iterable[Round]:
+    for move in read_lines(path):
+        yield move.split(' ')
+    # END LOOP
 # END read_rounds
 
 
@@ -52,9 +52,19 @@ def calculate_total_score(rounds: Iterable[Round]):
 # END calculate_total_score
 
 
+def parse(path: Source) -> List[Round]:
+    return list(read_rounds(path))
+# END parse
+
+
+def solve(rounds: List[Round]) -> int:
+    return calculate_total_score(rounds)
+# END solve
+
+
 if __name__ == '__main__':
-    rounds = read_rounds(INPUT_PATH)
-    total_score = calculate_total_score(rounds)
+    rounds = parse(INPUT_PATH)
+    total_score = solve(rounds)
 
     print(total_score)
 # END MAIN
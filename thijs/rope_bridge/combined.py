@@ -0,0 +1,91 @@
+from typing import Dict, Iterable, Iterator, List, Sequence, Set
+
+from ..io import Source
+from . import part_2
+from .part_2 import Move, Position, are_touching, movements
+
+INPUT_PATH = part_2.INPUT_PATH
+
+
+def track_knots(moves: Iterable[Move], n_knots: int, tracked: Sequence[int]) -> Dict[int, Set[Position]]:
+    """
+    Moves a rope of `n_knots` knots like `part_2.track_bridge`, collecting the positions visited by every knot in
+    `tracked`, where knot 0 is the one right behind the head.
+    A knot only follows the knots ahead of it, so the first knot of a long rope moves like the tail of a short one.
+    """
+
+    head = (0, 0)
+    knots: List[Position] = [(0, 0) for _ in range(n_knots - 1)]
+
+    visited: Dict[int, Set[Position]] = {index: {knots[index]} for index in tracked}
+
+    for direction, distance in moves:
+
+        for step in movements[direction](head, distance):
+
+            head = step
+            last = step
+
+            for index, current in enumerate(knots):
+
+                if are_touching(last, current):
+                    last = current
+                    continue
+                # END IF
+
+                while not are_touching(last, current):
+                    dx = (
+                        max(-1, last[0] - current[0])
+                        if current[0] > last[0]
+                        else min(1, last[0] - current[0])
+                    )
+
+                    dy = (
+                        max(-1, last[1] - current[1])
+                        if current[1] > last[1]
+                        else min(1, last[1] - current[1])
+                    )
+
+                    new = (current[0] + dx, current[1] + dy)
+                    knots[index] = new
+                    last = new
+
+                    if index in visited:
+                        visited[index].add(last)
+                    # END IF
+                # END LOOP
+            # END LOOP
+        # END LOOP
+    # END LOOP
+
+    return visited
+# END track_knots
+
+
+def parse(path: Source) -> List[Move]:
+    return part_2.parse(path)
+# END parse
+
+
+def solve(moves: List[Move], n_knots: int = 10) -> Iterator[int]:
+    """
+    Yields the answers of both parts from a single simulation of the long rope.
+    """
+
+    visited = track_knots(moves, n_knots, [0, n_knots - 2])
+
+    yield len(visited[0])
+    yield len(visited[n_knots - 2])
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
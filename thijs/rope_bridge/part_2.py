@@ -1,6 +1,8 @@
 from os import path
 from typing import Callable, Dict, Iterable, List, Set, Tuple
 
+from ..io import Source, read_lines
+
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
 Direction = str
@@ -22,14 +24,11 @@ def are_touching(a: Position, b: Position):
 # END are_touching
 
 
-def read_moves(path: str) -> Iterable[Move]:
-    with open(path) as file:
-        moves = (line.rstrip("\n") for line in file)
-        for move in moves:
-            direction, distance = move.split()
-            yield (direction, int(distance))
-        # END LOOP
-    # END WITH file
+def read_moves(path: Source) -> Iterable[Move]:
+    for move in read_lines(path):
+        direction, distance = move.split()
+        yield (direction, int(distance))
+    # END LOOP
 # END read_moves
 
 
@@ -86,9 +85,18 @@ def track_bridge(moves: Iterable[Move], n_knots: int = 2):
 # END track_bridge
 
 
+def parse(path: Source) -> List[Move]:
+    return list(read_moves(path))
+# END parse
+
+
+def solve(moves: List[Move], n_knots: int = 10) -> int:
+    return len(track_bridge(moves, n_knots))
+# END solve
+
+
 if __name__ == "__main__":
-    moves = read_moves(INPUT_PATH)
-    visited = track_bridge(moves, 10)
+    moves = parse(INPUT_PATH)
 
-    print(len(visited))
+    print(solve(moves))
 # END MAIN
@@ -0,0 +1,40 @@
+from typing import Iterator, List
+
+from ..io import Source, read_lines
+from . import part_1, part_2
+
+INPUT_PATH = part_1.INPUT_PATH
+
+
+def parse(path: Source) -> List[str]:
+    """
+    Reads the contents of the rucksacks, which part 1 splits into compartments and part 2 groups.
+    """
+
+    return list(read_lines(path))
+# END parse
+
+
+def solve(rucksacks: List[str], group_size: int = 3) -> Iterator[int]:
+    yield part_1.get_total_priority(
+        (rucksack[:len(rucksack) // 2], rucksack[len(rucksack) // 2:])
+        for rucksack in rucksacks
+    )
+
+    yield part_2.get_total_priority(
+        tuple(rucksacks[start:start + group_size])
+        for start in range(0, len(rucksacks), group_size)
+    )
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
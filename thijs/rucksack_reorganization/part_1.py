@@ -1,5 +1,7 @@
 from os import path
-from typing import Iterable, Set, Tuple
+from typing import Iterable, List, Set, Tuple
+
+from ..io import Source, read_lines
 
 INPUT_PATH = path.join(path.dirname(__file__), 'data')
 
@@ -16,14 +18,11 @@ def get_priority(items: Iterable[RucksackItem]) -> int:
 # END get_priority
 
 
-def read_rucksacks(path: str) -> Iterable[Rucksack]:
-    with open(path) as file:
-        rucksacks = (line.rstrip('\n') for line in file)
-        for rucksack in rucksacks:
-            split_index = len(rucksack)//2
-            yield rucksack[:split_index], rucksack[split_index:]
-        # END LOOP
-    # END WITH file
+def read_rucksacks(path: Source) -> Iterable[Rucksack]:
+    for rucksack in read_lines(path):
+        split_index = len(rucksack)//2
+        yield rucksack[:split_index], rucksack[split_index:]
+    # END LOOP
 # END read_rucksacks
 
 
@@ -39,9 +38,19 @@ def get_total_priority(rucksacks: Iterable[Rucksack]) -> int:
 # END get_total_priority
 
 
+def parse(path: Source) -> List[Rucksack]:
+    return list(read_rucksacks(path))
+# END parse
+
+
+def solve(rucksacks: List[Rucksack]) -> int:
+    return get_total_priority(rucksacks)
+# END solve
+
+
 if __name__ == '__main__':
-    rucksacks = read_rucksacks(INPUT_PATH)
-    total_priority = get_total_priority(rucksacks)
+    rucksacks = parse(INPUT_PATH)
+    total_priority = solve(rucksacks)
 
     print(total_priority)
 # END MAIN
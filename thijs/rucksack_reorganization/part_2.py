@@ -1,6 +1,8 @@
 from itertools import islice
 from os import path
-from typing import Iterable, Set, Tuple
+from typing import Iterable, List, Set, Tuple
+
+from ..io import Source, read_lines
 
 INPUT_PATH = path.join(path.dirname(__file__), 'data')
 
@@ -17,13 +19,11 @@ def get_priority(items: Iterable[RucksackItem]) -> int:
 # END get_priority
 
 
-def read_groups(path: str, group_size: int) -> Iterable[Group]:
-    with open(path) as file:
-        rucksacks = (line.rstrip('\n') for line in file)
-        while group := tuple(islice(rucksacks, group_size)):
-            yield group
-        # END LOOP
-    # END WITH file
+def read_groups(path: Source, group_size: int) -> Iterable[Group]:
+    rucksacks = read_lines(path)
+    while group := tuple(islice(rucksacks, group_size)):
+        yield group
+    # END LOOP
 # END read_groups
 
 
@@ -39,9 +39,19 @@ def get_total_priority(groups: Iterable[Group]) -> int:
 # END get_total_priority
 
 
+def parse(path: Source, group_size: int = 3) -> List[Group]:
+    return list(read_groups(path, group_size))
+# END parse
+
+
+def solve(groups: List[Group]) -> int:
+    return get_total_priority(groups)
+# END solve
+
+
 if __name__ == '__main__':
-    groups = read_groups(INPUT_PATH, 3)
-    total_priority = get_total_priority(groups)
+    groups = parse(INPUT_PATH)
+    total_priority = solve(groups)
 
     print(total_priority)
 # END MAIN
@@ -0,0 +1,521 @@
+import re
+from contextlib import contextmanager, nullcontext, redirect_stdout
+from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
+from os import devnull, path, scandir
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .cache import (ParsedCache, ResultCache, hash_input, hash_source,
+                    make_key)
+from .io import Source, is_path, source_name
+from .metrics import Metrics, record_metrics
+
+PACKAGE_PATH = path.dirname(__file__)
+
+PART_PATTERN = re.compile(r"part_(?P<part>\d+)")
+
+# The module of a day that solves all its parts from a single parse
+COMBINED_MODULE = "combined"
+
+Day = str
+Part = int
+Answer = Any
+
+Engine = str
+
+# The part under which the input parsed for all parts of a day is cached
+ALL_PARTS: Part = 0
+
+# The engine made of the `part_N` modules of a day itself, which every other engine has to agree with
+REFERENCE_ENGINE: Engine = "reference"
+
+# Picks the engine by the size of the input, rather than by name
+AUTO_ENGINE: Engine = "auto"
+
+
+@dataclass
+class UnknownDayException(Exception):
+    day: Day
+# END UnknownDayException
+
+
+@dataclass
+class UnknownPartException(Exception):
+    day: Day
+    part: Part
+# END UnknownPartException
+
+
+@dataclass
+class UnknownEngineException(Exception):
+    day: Day
+    engine: Engine
+# END UnknownEngineException
+
+
+@dataclass
+class Result:
+    day: Day
+    part: Part
+    input_path: str
+    answer: Answer
+
+    parse_time: float
+    solve_time: float
+
+    # Whether the answer came from the result cache, in which case the parse time is the time taken to look it up
+    cached: bool = False
+
+    # Whether the input was parsed once for an earlier part of the same day, so no parse time is counted for this part
+    shared_parse: bool = False
+
+    # The operations the solver counted while parsing and solving, if metrics were collected
+    metrics: Metrics = field(default_factory=dict)
+
+    # The engine that solved the part
+    engine: Engine = REFERENCE_ENGINE
+
+    @property
+    def total_time(self) -> float:
+        return self.parse_time + self.solve_time
+    # END total_time
+# END Result
+
+
+@contextmanager
+def silenced() -> Iterator[None]:
+    """
+    Sends whatever the solvers print to the null device, so their traces do not mix with the results.
+    """
+
+    with open(devnull, "w") as sink, redirect_stdout(sink):
+        yield
+    # END WITH sink
+# END silenced
+
+
+@lru_cache(maxsize=None)
+def list_modules(directory: str) -> Dict[str, bool]:
+    """
+    Maps the name of every module in `directory` to whether it is a package, without importing any of them.
+    The modules do not change while the solvers run, so every directory is only scanned once.
+    """
+
+    modules: Dict[str, bool] = {}
+
+    if not path.isdir(directory):
+        return modules
+    # END IF
+
+    for entry in scandir(directory):
+        if entry.is_dir() and path.isfile(path.join(entry.path, "__init__.py")):
+            modules[entry.name] = True
+        elif entry.name.endswith(".py") and entry.is_file():
+            modules[entry.name[:-len(".py")]] = False
+        # END IF
+    # END LOOP
+
+    return modules
+# END list_modules
+
+
+def find_parts(directory: str) -> List[Part]:
+    """
+    Lists the parts of the `part_N` modules in `directory`, without importing any of them.
+    """
+
+    modules = list_modules(directory)
+
+    return sorted(
+        int(matches.group("part"))
+        for name, is_package in modules.items()
+        if not is_package and (matches := PART_PATTERN.fullmatch(name))
+    )
+# END find_parts
+
+
+def list_parts(day: Day) -> List[Part]:
+    """
+    Lists the parts of the given `day`, without importing any of them.
+    """
+
+    return find_parts(path.join(PACKAGE_PATH, day))
+# END list_parts
+
+
+def list_days() -> List[Day]:
+    """
+    Lists every package in `thijs` that holds at least one `part_N` module.
+    """
+
+    return sorted(
+        name
+        for name, is_package in list_modules(PACKAGE_PATH).items()
+        if is_package and list_parts(name)
+    )
+# END list_days
+
+
+def list_engines(day: Day) -> List[Engine]:
+    """
+    Lists the engines of the given `day`, without importing any of them: the reference engine, followed by every
+    package in the day that holds at least one `part_N` module with the same `parse` and `solve` as the day itself.
+    """
+
+    if day not in list_days():
+        raise UnknownDayException(day)
+    # END IF
+
+    return [REFERENCE_ENGINE] + sorted(
+        name
+        for name, is_package in list_modules(path.join(PACKAGE_PATH, day)).items()
+        if is_package and find_parts(path.join(PACKAGE_PATH, day, name))
+    )
+# END list_engines
+
+
+def engine_package(day: Day, engine: Engine) -> str:
+    """
+    Returns the name of the package that holds the modules of `engine` for the given `day`.
+    Raises `UnknownEngineException` if the day has no such engine.
+    """
+
+    if engine not in list_engines(day):
+        raise UnknownEngineException(day, engine)
+    # END IF
+
+    return f"{__package__}.{day}" if engine == REFERENCE_ENGINE else f"{__package__}.{day}.{engine}"
+# END engine_package
+
+
+def engine_directory(day: Day, engine: Engine) -> str:
+    return path.join(PACKAGE_PATH, *engine_package(day, engine).split(".")[1:])
+# END engine_directory
+
+
+def list_engine_parts(day: Day, engine: Engine) -> List[Part]:
+    return find_parts(engine_directory(day, engine))
+# END list_engine_parts
+
+
+def load_part(day: Day, part: Part, engine: Engine = REFERENCE_ENGINE) -> ModuleType:
+    """
+    Imports the module for the given `day` and `part`, of the given `engine`.
+    Only the requested module is imported, so the other days do not add to the startup time.
+    """
+
+    if day not in list_days():
+        raise UnknownDayException(day)
+    # END IF
+
+    if part not in list_engine_parts(day, engine):
+        raise UnknownPartException(day, part)
+    # END IF
+
+    return import_module(f"{engine_package(day, engine)}.part_{part}")
+# END load_part
+
+
+def load_combined(day: Day, engine: Engine = REFERENCE_ENGINE) -> Optional[ModuleType]:
+    """
+    Imports the module that solves all parts of the given `day` at once, or returns `None` if the day has none.
+    """
+
+    if COMBINED_MODULE not in list_modules(engine_directory(day, engine)):
+        return None
+    # END IF
+
+    return import_module(f"{engine_package(day, engine)}.{COMBINED_MODULE}")
+# END load_combined
+
+
+def engine_settings(day: Day, engine: Engine) -> Tuple[Optional[int], Tuple[str, ...]]:
+    """
+    Returns the input size in bytes from which `engine` is picked automatically, and the packages it requires.
+    Both are declared in the package of the engine as `MIN_INPUT_BYTES` and `REQUIRES`. An engine that declares no
+    size is only used when asked for by name, and the reference engine is used for inputs of any size.
+    """
+
+    if engine == REFERENCE_ENGINE:
+        return 0, ()
+    # END IF
+
+    package = import_module(engine_package(day, engine))
+
+    return getattr(package, "MIN_INPUT_BYTES", None), tuple(getattr(package, "REQUIRES", ()))
+# END engine_settings
+
+
+def is_available(day: Day, engine: Engine) -> bool:
+    """
+    Returns whether the packages that `engine` requires are installed, without importing them.
+    """
+
+    _, requires = engine_settings(day, engine)
+    return all(find_spec(name) is not None for name in requires)
+# END is_available
+
+
+def input_size(input_path: str) -> int:
+    if path.isdir(input_path):
+        return sum(entry.stat().st_size for entry in scandir(input_path) if entry.is_file())
+    # END IF
+
+    return path.getsize(input_path)
+# END input_size
+
+
+def select_engine(day: Day, input_path: Optional[Source] = None, parts: Optional[List[Part]] = None) -> Engine:
+    """
+    Picks the engine with the largest `MIN_INPUT_BYTES` that the input reaches, among the available engines that
+    solve all the given `parts`, or every part of the day if none are given.
+    A stream has no size up front, so it is always solved by the reference engine.
+    """
+
+    if input_path is None:
+        input_path = load_part(day, list_parts(day)[0]).INPUT_PATH
+    # END IF
+
+    if not is_path(input_path):
+        return REFERENCE_ENGINE
+    # END IF
+
+    size = input_size(input_path)
+    parts = parts or list_parts(day)
+    candidates: List[Tuple[int, Engine]] = []
+
+    for engine in list_engines(day):
+        min_size, _ = engine_settings(day, engine)
+
+        if min_size is not None and min_size <= size and set(parts) <= set(list_engine_parts(day, engine)) and is_available(day, engine):
+            candidates.append((min_size, engine))
+        # END IF
+    # END LOOP
+
+    return max(candidates)[1]
+# END select_engine
+
+
+def resolve_engine(day: Day, engine: Engine, input_path: Optional[Source], parts: List[Part]) -> Engine:
+    return select_engine(day, input_path, parts) if engine == AUTO_ENGINE else engine
+# END resolve_engine
+
+
+def run_part(day: Day, part: Part, input_path: Optional[Source] = None, cache: Optional[ResultCache] = None, parsed_cache: Optional[ParsedCache] = None, collect_metrics: bool = False, engine: Engine = REFERENCE_ENGINE) -> Result:
+    """
+    Parses and solves the input at `input_path` with the given `day` and `part`, timing both phases separately.
+    Falls back to the bundled input of the day if no `input_path` is given. It may also be an open stream, which is
+    parsed while it is read, but never cached.
+    If a `cache` is given, the answer is looked up by the contents of the input and the source of the solver first.
+    If a `parsed_cache` is given, the parsed input is reused if the part module has a `CODEC` to store it with.
+    If `collect_metrics` is set, the counts of `thijs.metrics` are collected, but only for an answer that was solved.
+    The part is solved by the given `engine`, or by the one that suits the size of the input for `AUTO_ENGINE`.
+    """
+
+    if input_path is None:
+        input_path = load_part(day, part).INPUT_PATH
+    # END IF
+
+    engine = resolve_engine(day, engine, input_path, [part])
+    module = load_part(day, part, engine)
+
+    codec = getattr(module, "CODEC", None)
+
+    if parsed_cache is not None and codec is None:
+        parsed_cache = None
+    # END IF
+
+    # A stream can only be read once, by the parser, so it cannot be hashed to look up the caches
+    if not is_path(input_path):
+        cache = parsed_cache = None
+    # END IF
+
+    start = perf_counter()
+    key = None
+
+    if cache is not None or parsed_cache is not None:
+        key = make_key(day, part, hash_input(input_path), hash_source(module))
+    # END IF
+
+    if cache is not None:
+        entry = cache.get(key)
+
+        if entry is not None:
+            return Result(
+                day=day,
+                part=part,
+                input_path=source_name(input_path),
+                answer=entry.answer,
+                parse_time=perf_counter() - start,
+                solve_time=0.0,
+                cached=True,
+                engine=engine
+            )
+        # END IF
+    # END IF
+
+    parsed = None
+
+    with silenced(), record_metrics() if collect_metrics else nullcontext({}) as metrics:
+        if parsed_cache is not None:
+            parsed = parsed_cache.load(key, codec)
+        # END IF
+
+        if parsed is None:
+            parsed = module.parse(input_path)
+
+            if parsed_cache is not None:
+                parsed_cache.store(key, codec, parsed)
+            # END IF
+        # END IF
+
+        parsed_at = perf_counter()
+        answer = module.solve(parsed)
+        solved_at = perf_counter()
+    # END WITH metrics
+
+    if cache is not None:
+        cache.put(key, answer)
+    # END IF
+
+    return Result(
+        day=day,
+        part=part,
+        input_path=source_name(input_path),
+        answer=answer,
+        parse_time=parsed_at - start,
+        solve_time=solved_at - parsed_at,
+        metrics=dict(metrics),
+        engine=engine
+    )
+# END run_part
+
+
+def run_day(day: Day, input_path: Optional[Source] = None, cache: Optional[ResultCache] = None, parsed_cache: Optional[ParsedCache] = None, collect_metrics: bool = False, engine: Engine = REFERENCE_ENGINE) -> List[Result]:
+    """
+    Solves every part of the given `day`, parsing the input only once if the day has a combined module.
+    Its `solve` yields the answers in the order of the parts, so every part is timed on its own. The parse time is
+    counted with the first part only.
+    Days without a combined module fall back to `run_part` for every part.
+    Metrics are collected for every part on its own, with those of the parse counted with the first part.
+    All parts are solved by the same engine, picked once for the whole day for `AUTO_ENGINE`.
+    """
+
+    parts = list_parts(day)
+
+    if input_path is None:
+        input_path = load_part(day, parts[0]).INPUT_PATH
+    # END IF
+
+    engine = resolve_engine(day, engine, input_path, parts)
+    module = load_combined(day, engine)
+
+    if module is None:
+        return [run_part(day, part, input_path, cache, parsed_cache, collect_metrics, engine) for part in parts]
+    # END IF
+
+    codec = getattr(module, "CODEC", None)
+
+    if parsed_cache is not None and codec is None:
+        parsed_cache = None
+    # END IF
+
+    # A stream can only be read once, by the parser, so it cannot be hashed to look up the caches
+    if not is_path(input_path):
+        cache = parsed_cache = None
+    # END IF
+
+    start = perf_counter()
+    input_hash = source_hash = None
+
+    if cache is not None or parsed_cache is not None:
+        input_hash = hash_input(input_path)
+        source_hash = hash_source(module)
+    # END IF
+
+    if cache is not None:
+        entries = [cache.get(make_key(day, part, input_hash, source_hash)) for part in parts]
+
+        if all(entry is not None for entry in entries):
+            lookup_time = perf_counter() - start
+
+            return [
+                Result(
+                    day=day,
+                    part=part,
+                    input_path=source_name(input_path),
+                    answer=entry.answer,
+                    parse_time=lookup_time,
+                    solve_time=0.0,
+                    cached=True,
+                    engine=engine
+                )
+                for part, entry in zip(parts, entries)
+            ]
+        # END IF
+    # END IF
+
+    parsed = None
+
+    with silenced(), record_metrics() if collect_metrics else nullcontext({}) as parse_metrics:
+        if parsed_cache is not None:
+            parsed = parsed_cache.load(make_key(day, ALL_PARTS, input_hash, source_hash), codec)
+        # END IF
+
+        if parsed is None:
+            parsed = module.parse(input_path)
+
+            if parsed_cache is not None:
+                parsed_cache.store(make_key(day, ALL_PARTS, input_hash, source_hash), codec, parsed)
+            # END IF
+        # END IF
+    # END WITH parse_metrics
+
+    parsed_at = perf_counter()
+    parse_time = parsed_at - start
+
+    results: List[Result] = []
+    answers = module.solve(parsed)
+
+    for part in parts:
+        # The answers are generated one at a time, so whatever is counted while waiting for one belongs to its part
+        with silenced(), record_metrics() if collect_metrics else nullcontext({}) as metrics:
+            answer = next(answers)
+        # END WITH metrics
+
+        solved_at = perf_counter()
+
+        if not results:
+            # The parse is counted with the first part, added to what that part counted under the same names
+            for name, amount in parse_metrics.items():
+                metrics[name] = metrics.get(name, 0) + amount
+            # END LOOP
+        # END IF
+
+        results.append(Result(
+            day=day,
+            part=part,
+            input_path=source_name(input_path),
+            answer=answer,
+            parse_time=parse_time if not results else 0.0,
+            solve_time=solved_at - parsed_at,
+            shared_parse=bool(results),
+            metrics=dict(metrics),
+            engine=engine
+        ))
+
+        parsed_at = solved_at
+    # END LOOP
+
+    if cache is not None:
+        for result in results:
+            cache.put(make_key(day, result.part, input_hash, source_hash), result.answer)
+        # END LOOP
+    # END IF
+
+    return results
+# END run_day
@@ -0,0 +1,195 @@
+from array import array
+from dataclasses import dataclass
+from struct import Struct
+from typing import Any, Callable, List, Sequence
+
+from .io import Buffer
+
+Parsed = Any
+
+MAGIC = b"THJS"
+
+# The magic bytes, the format version and the number of sections
+HEADER = Struct("<4sHI")
+
+# The length of a section
+SECTION = Struct("<Q")
+
+FORMAT_VERSION = 1
+
+
+@dataclass
+class SidecarFormatException(Exception):
+    reason: str
+# END SidecarFormatException
+
+
+@dataclass
+class Codec:
+    """
+    Converts the output of a `parse` function to a compact binary form and back.
+    Both functions should pack plain arrays and strings, rather than pickle objects.
+    """
+
+    encode: Callable[[Parsed], bytes]
+    decode: Callable[[Buffer], Parsed]
+# END Codec
+
+
+def pack_sections(sections: Sequence[bytes]) -> bytes:
+    """
+    Concatenates the given `sections`, each prefixed by its length, behind a header.
+    """
+
+    parts = [HEADER.pack(MAGIC, FORMAT_VERSION, len(sections))]
+
+    for section in sections:
+        parts.append(SECTION.pack(len(section)))
+        parts.append(section)
+    # END LOOP
+
+    return b"".join(parts)
+# END pack_sections
+
+
+def unpack_sections(buffer: Buffer) -> List[memoryview]:
+    """
+    Splits a buffer written by `pack_sections` back into its sections, without copying them.
+    """
+
+    view = memoryview(buffer)
+
+    if len(view) < HEADER.size:
+        raise SidecarFormatException("truncated header")
+    # END IF
+
+    magic, version, n_sections = HEADER.unpack_from(view)
+
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise SidecarFormatException("unknown format")
+    # END IF
+
+    sections: List[memoryview] = []
+    offset = HEADER.size
+
+    for _ in range(n_sections):
+        (length,) = SECTION.unpack_from(view, offset)
+        offset += SECTION.size
+
+        if offset + length > len(view):
+            raise SidecarFormatException("truncated section")
+        # END IF
+
+        sections.append(view[offset:offset + length])
+        offset += length
+    # END LOOP
+
+    return sections
+# END unpack_sections
+
+
+def pack_ints(values: Sequence[int], typecode: str = "q") -> bytes:
+    return array(typecode, values).tobytes()
+# END pack_ints
+
+
+def unpack_ints(section: memoryview, typecode: str = "q") -> array:
+    values = array(typecode)
+    values.frombytes(section)
+    return values
+# END unpack_ints
+
+
+def pack_strings(strings: Sequence[str]) -> bytes:
+    """
+    Packs the given `strings` as their lengths, followed by their concatenated UTF-8 bytes.
+    """
+
+    encoded = [string.encode() for string in strings]
+    lengths = pack_ints([len(string) for string in encoded], "I")
+
+    return pack_sections([lengths, b"".join(encoded)])
+# END pack_strings
+
+
+def unpack_strings(section: memoryview) -> List[str]:
+    lengths, blob = unpack_sections(section)
+    text = bytes(blob)
+
+    strings: List[str] = []
+    offset = 0
+
+    for length in unpack_ints(lengths, "I"):
+        strings.append(text[offset:offset + length].decode())
+        offset += length
+    # END LOOP
+
+    return strings
+# END unpack_strings
+
+
+# The tokens that open and close a list in a packed nested list, which otherwise holds non-negative integers
+OPEN = -1
+CLOSE = -2
+
+
+def pack_nested(lists: Sequence[list]) -> bytes:
+    """
+    Packs lists of non-negative integers and nested lists as a flat stream of tokens.
+    """
+
+    tokens = array("q")
+
+    def pack(values: list):
+        tokens.append(OPEN)
+
+        for value in values:
+            if isinstance(value, int):
+                if value < 0:
+                    raise SidecarFormatException("negative value in nested list")
+                # END IF
+
+                tokens.append(value)
+            else:
+                pack(value)
+            # END IF
+        # END LOOP
+
+        tokens.append(CLOSE)
+    # END pack
+
+    for values in lists:
+        pack(values)
+    # END LOOP
+
+    return tokens.tobytes()
+# END pack_nested
+
+
+def unpack_nested(section: memoryview) -> List[list]:
+    lists: List[list] = []
+    parents: List[list] = []
+    current: list = []
+
+    for token in unpack_ints(section):
+        if token == OPEN:
+            parents.append(current)
+            current = []
+        elif token == CLOSE:
+            parent = parents.pop()
+
+            # The outermost lists are collected once they close
+            if parents:
+                parent.append(current)
+            else:
+                lists.append(current)
+            # END IF
+
+            current = parent
+        else:
+            current.append(token)
+        # END IF
+    # END LOOP
+
+    return lists
+# END unpack_nested
@@ -0,0 +1,33 @@
+from typing import Iterator, List, Tuple
+
+from ..io import Source
+from . import part_1, part_2
+from .part_1 import Move, Stacks
+
+INPUT_PATH = part_1.INPUT_PATH
+
+CODEC = part_1.CODEC
+
+
+def parse(input_path: Source) -> Tuple[Stacks, List[Move]]:
+    return part_1.parse(input_path)
+# END parse
+
+
+def solve(stacks_and_moves: Tuple[Stacks, List[Move]]) -> Iterator[str]:
+    # Both parts copy the stacks before moving crates, so they can start from the same parsed stacks
+    yield part_1.solve(stacks_and_moves)
+    yield part_2.solve(stacks_and_moves)
+# END solve
+
+
+def solve_all(input_path: Source) -> List[str]:
+    return list(solve(parse(input_path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
@@ -2,11 +2,21 @@ import re
 from collections import deque
 from dataclasses import dataclass
 from os import path
-from typing import Deque, Iterable, List
+from typing import Deque, Iterable, List, Tuple
+
+from ..io import Buffer, Source, is_path, read_lines
+from ..sidecar import (Codec, pack_ints, pack_sections, pack_strings,
+                       unpack_ints, unpack_sections, unpack_strings)
 
 STACKS_PATH = path.join(path.dirname(__file__), "crates")
 MOVES_PATH = path.join(path.dirname(__file__), "moves")
 
+# The runner input for this day is either a directory holding a `crates` and `moves` file,
+# or a single file containing the crates, an empty line and the moves
+INPUT_PATH = path.dirname(__file__)
+
+MOVE_PATTERN = re.compile(r'move (?P<quantity>\d+) from (?P<source>\d+) to (?P<target>\d+)')
+
 Stacks = List[Deque[str]]
 
 
@@ -25,12 +35,7 @@ class Move:
     @classmethod
     def from_input_string(cls, input_string: str):
 
-        PATTERN = r'move (?P<quantity>\d+) from (?P<source>\d+) to (?P<target>\d+)'
-
-        matches = re.match(
-            pattern=PATTERN,
-            string=input_string
-        )
+        matches = MOVE_PATTERN.match(input_string)
 
         if matches is None:
             raise MoveParseException(input_string)
@@ -48,34 +53,33 @@ class Move:
 
 
 
-def read_moves(path: str) -> Iterable[Move]:
-    with open(path) as file:
-        moves = (line.rstrip('\n') for line in file)
-        for move in moves:
-            yield Move.from_input_string(move)
-        # END LOOP
-    # END WITH file
+def read_moves(path: Source) -> Iterable[Move]:
+    for move in read_lines(path):
+        yield Move.from_input_string(move)
+    # END LOOP
 # END read_moves
 
 
-def read_stacks(path: str) -> Stacks:
+def build_stacks(levels: Iterable[str]) -> Stacks:
     stacks: Stacks = [deque() for _ in range(0, 9)]
 
-    with open(path) as file:
-        levels = (line.rstrip('\n') for line in file)
-        for level in levels:
-            for index, stack in enumerate(stacks):
-                crate = level[index * 4 + 1]
+    for level in levels:
+        for index, stack in enumerate(stacks):
+            crate = level[index * 4 + 1]
 
-                if crate == " ":
-                    continue
-                # END IF
+            if crate == " ":
+                continue
+            # END IF
 
-                stack.appendleft(crate)
-            # END LOOP
+            stack.appendleft(crate)
         # END LOOP
-    # END WITH file
+    # END LOOP
     return stacks
+# END build_stacks
+
+
+def read_stacks(path: Source) -> Stacks:
+    return build_stacks(read_lines(path))
 # END read_stacks
 
 
@@ -94,11 +98,62 @@ def apply_moves(stacks: Stacks, moves: Iterable[Move]) -> Stacks:
 # END apply_moves
 
 
-if __name__ == '__main__':
-    moves = read_moves(MOVES_PATH)
-    stacks = read_stacks(STACKS_PATH)
+def parse(input_path: Source) -> Tuple[Stacks, List[Move]]:
+    if is_path(input_path) and path.isdir(input_path):
+        stacks = read_stacks(path.join(input_path, "crates"))
+        moves = list(read_moves(path.join(input_path, "moves")))
+        return stacks, moves
+    # END IF
+
+    lines = read_lines(input_path)
+
+    # The crate levels are separated from the moves by an empty line
+    levels = iter(lines.__next__, '')
+    stacks = build_stacks(levels)
+    moves = [Move.from_input_string(move) for move in lines]
+
+    return stacks, moves
+# END parse
+
+
+def encode_parsed(stacks_and_moves: Tuple[Stacks, List[Move]]) -> bytes:
+    stacks, moves = stacks_and_moves
+
+    return pack_sections([
+        pack_strings(["".join(stack) for stack in stacks]),
+        pack_ints([value for move in moves for value in (move.quantity, move.source, move.target)], "I")
+    ])
+# END encode_parsed
+
+
+def decode_parsed(buffer: Buffer) -> Tuple[Stacks, List[Move]]:
+    stacks, moves = unpack_sections(buffer)
+    values = iter(unpack_ints(moves, "I"))
+
+    return (
+        [deque(stack) for stack in unpack_strings(stacks)],
+        [Move(quantity, source, target) for quantity, source, target in zip(values, values, values)]
+    )
+# END decode_parsed
+
+
+CODEC = Codec(encode_parsed, decode_parsed)
+
+
+def solve(stacks_and_moves: Tuple[Stacks, List[Move]]) -> str:
+    stacks, moves = stacks_and_moves
+
+    # Leaves the parsed stacks untouched so they can be solved again
+    stacks = [deque(stack) for stack in stacks]
 
     apply_moves(stacks, moves)
 
-    print("".join([stack[-1] for stack in stacks]))
+    return "".join([stack[-1] for stack in stacks])
+# END solve
+
+
+if __name__ == '__main__':
+    stacks_and_moves = parse(INPUT_PATH)
+
+    print(solve(stacks_and_moves))
 # END IF
@@ -0,0 +1,78 @@
+from os import path
+
+from pytest import fixture, raises
+
+from .__main__ import main
+from .batch import Failure, NoInputsException, find_inputs, run_batch
+from .generators import generate
+from .runner import Result, UnknownPartException, run_part
+
+
+@fixture
+def inputs(tmpdir) -> str:
+    directory = tmpdir.mkdir("inputs")
+
+    for seed in range(4):
+        generate("rope_bridge", str(directory.join(f"input_{seed}")), size=50, seed=seed)
+    # END LOOP
+
+    return str(directory)
+# END inputs
+
+
+def test__find_inputs(inputs):
+    expected = [path.join(inputs, f"input_{seed}") for seed in range(4)]
+
+    assert find_inputs(inputs) == expected
+    assert find_inputs(path.join(inputs, "input_*")) == expected
+
+    with raises(NoInputsException):
+        find_inputs(path.join(inputs, "missing_*"))
+    # END WITH raises
+# END test__find_inputs
+
+
+def test__run_batch(inputs):
+    input_paths = find_inputs(inputs)
+
+    outcomes = list(run_batch("rope_bridge", [1, 2], input_paths, workers=2, chunksize=3))
+
+    assert all(isinstance(outcome, Result) for outcome in outcomes)
+
+    answers = {(outcome.input_path, outcome.part): outcome.answer for outcome in outcomes}
+
+    assert answers == {
+        (input_path, part): run_part("rope_bridge", part, input_path).answer
+        for input_path in input_paths
+        for part in [1, 2]
+    }
+# END test__run_batch
+
+
+def test__run_batch_failure(inputs, tmpdir):
+    broken = tmpdir.join("broken")
+    broken.write("not a move")
+
+    outcomes = list(run_batch("rope_bridge", [1], [str(broken)], workers=1))
+
+    assert len(outcomes) == 1
+    assert isinstance(outcomes[0], Failure)
+    assert outcomes[0].error.startswith("ValueError")
+# END test__run_batch_failure
+
+
+def test__run_batch_unknown_part(inputs):
+    with raises(UnknownPartException):
+        list(run_batch("rope_bridge", [3], find_inputs(inputs)))
+    # END WITH raises
+# END test__run_batch_unknown_part
+
+
+def test__batch_command(inputs, capsys):
+    assert main(["batch", "rope_bridge", inputs, "--part", "1", "--workers", "2"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+
+    assert len(lines) == 4
+    assert all(" part 1: " in line for line in lines)
+# END test__batch_command
@@ -0,0 +1,86 @@
+from os import utime
+
+from pytest import fixture
+
+from .cache import (ResultCache, find_source_modules, hash_input, hash_source,
+                    make_key)
+from .runner import load_part, run_part
+
+
+@fixture
+def cache(tmpdir) -> ResultCache:
+    return ResultCache(str(tmpdir.join("cache")))
+# END cache
+
+
+def test__get_and_put(cache):
+    assert cache.get("key") is None
+
+    cache.put("key", 42)
+    cache.put("display", "#..\n.#.")
+
+    assert cache.get("key").answer == 42
+    assert cache.get("display").answer == "#..\n.#."
+# END test__get_and_put
+
+
+def test__evict_least_recently_used(cache):
+    cache.put("a", 1)
+    entry_size = cache.size()
+
+    cache.max_bytes = 2 * entry_size
+
+    cache.put("b", 2)
+    utime(cache.entry_path("a"), (0, 0))
+    utime(cache.entry_path("b"), (1, 1))
+
+    # Reading an entry marks it as used
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+# END test__evict_least_recently_used
+
+
+def test__hash_input(tmpdir):
+    first = tmpdir.join("first")
+    second = tmpdir.join("second")
+
+    first.write("1000\n2000")
+    second.write("1000\n2000")
+
+    assert hash_input(str(first)) == hash_input(str(second))
+
+    second.write("1000\n2001")
+
+    assert hash_input(str(first)) != hash_input(str(second))
+# END test__hash_input
+
+
+def test__hash_source():
+    module = load_part("calorie_counting", 1)
+
+    names = [source_module.__name__ for source_module in find_source_modules(module)]
+
+    # The shared reader is part of the solver, so changing it invalidates the cached answers
+    assert "thijs.io" in names
+    assert hash_source(module) != hash_source(load_part("calorie_counting", 2))
+# END test__hash_source
+
+
+def test__make_key():
+    assert make_key("day", 1, "input", "source") != make_key("day", 2, "input", "source")
+    assert make_key("day", 1, "input", "source") != make_key("day", 1, "input", "changed")
+# END test__make_key
+
+
+def test__run_part_cached(cache):
+    first = run_part("calorie_counting", 1, cache=cache)
+    second = run_part("calorie_counting", 1, cache=cache)
+
+    assert not first.cached
+    assert second.cached
+    assert second.answer == first.answer == 72070
+# END test__run_part_cached
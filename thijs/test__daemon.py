@@ -0,0 +1,188 @@
+import asyncio
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from os import path
+
+from pytest import fixture, raises
+
+from .client import DaemonException, query, send
+from .daemon import Daemon, LRUCache
+from .generators import generate
+from .runner import PACKAGE_PATH, run_day, run_part
+
+
+@fixture
+def moves(tmpdir) -> str:
+    input_path = str(tmpdir.join("moves"))
+    generate("rope_bridge", input_path, size=200, seed=1)
+    return input_path
+# END moves
+
+
+def test__lru_cache():
+    cache = LRUCache(2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # Reading `a` makes `b` the least recently used
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+# END test__lru_cache
+
+
+def test__daemon_solve(moves):
+    daemon = Daemon()
+
+    results = asyncio.run(daemon.solve("rope_bridge", None, moves))
+
+    assert [result.answer for result in results] == [result.answer for result in run_day("rope_bridge", moves)]
+    assert not any(result.cached for result in results)
+    assert [result.shared_parse for result in results] == [False, True]
+
+    again = asyncio.run(daemon.solve("rope_bridge", None, moves))
+
+    assert [result.answer for result in again] == [result.answer for result in results]
+    assert all(result.cached for result in again)
+# END test__daemon_solve
+
+
+def test__daemon_solve_changed_input(moves):
+    daemon = Daemon()
+
+    first = asyncio.run(daemon.solve("rope_bridge", 1, moves))
+
+    generate("rope_bridge", moves, size=300, seed=2)
+
+    second = asyncio.run(daemon.solve("rope_bridge", 1, moves))
+
+    assert not second[0].cached
+    assert second[0].answer == run_part("rope_bridge", 1, moves).answer
+    assert len(daemon.answers) == 2
+    assert first[0].answer != second[0].answer
+# END test__daemon_solve_changed_input
+
+
+def test__daemon_solve_without_combined():
+    sample_data = path.join(PACKAGE_PATH, "pyroclastic_flow", "sample_data")
+
+    results = asyncio.run(Daemon().solve("pyroclastic_flow", None, sample_data))
+
+    assert [result.part for result in results] == [1]
+    assert results[0].answer == run_part("pyroclastic_flow", 1, sample_data).answer
+# END test__daemon_solve_without_combined
+
+
+def test__daemon_heavy_solve(moves):
+    daemon = Daemon()
+    daemon.solve_times[("rope_bridge", 2)] = daemon.heavy_solve_time + 1
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        daemon.executor = executor
+        results = asyncio.run(daemon.solve("rope_bridge", 2, moves))
+    # END WITH executor
+
+    assert results[0].answer == run_part("rope_bridge", 2, moves).answer
+# END test__daemon_heavy_solve
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """
+    Runs the work of the process pool on a thread instead, counting how often it was given any.
+    """
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.n_submitted = 0
+    # END __init__
+
+    def submit(self, *args, **kwargs):
+        self.n_submitted += 1
+        return super().submit(*args, **kwargs)
+    # END submit
+# END CountingExecutor
+
+
+def test__daemon_first_solve_on_pool(moves):
+    daemon = Daemon()
+
+    with CountingExecutor() as executor:
+        daemon.executor = executor
+
+        # A target that was never solved runs on the pool, rather than holding up the daemon on a thread
+        first = asyncio.run(daemon.solve("rope_bridge", 1, moves))
+
+        assert executor.n_submitted == 1
+        assert first[0].answer == run_part("rope_bridge", 1, moves).answer
+        assert first[0].parse_time > 0
+
+        # Once it turned out to be quick, it is solved in the daemon
+        daemon.heavy_solve_time = daemon.solve_times[("rope_bridge", 1)] + 1
+        generate("rope_bridge", moves, size=300, seed=2)
+
+        second = asyncio.run(daemon.solve("rope_bridge", 1, moves))
+
+        assert executor.n_submitted == 1
+        assert second[0].answer == run_part("rope_bridge", 1, moves).answer
+    # END WITH executor
+# END test__daemon_first_solve_on_pool
+
+
+def test__daemon_respond_errors(tmpdir):
+    daemon = Daemon()
+
+    def respond(request):
+        return asyncio.run(daemon.respond(request))
+    # END respond
+
+    assert respond({"day": "no_such_day"}) == {"ok": False, "error": "Unknown day: no_such_day"}
+    assert respond({"day": "rope_bridge", "part": 3}) == {"ok": False, "error": "Unknown part 3 for rope_bridge"}
+    assert respond({"day": "rope_bridge", "input": str(tmpdir.join("missing"))})["error"].startswith("FileNotFoundError")
+    assert respond({"command": "reboot"}) == {"ok": False, "error": "Unknown command: reboot"}
+    assert respond({"command": "ping"}) == {"ok": True}
+# END test__daemon_respond_errors
+
+
+def test__daemon_socket(moves, tmpdir):
+    socket_path = str(tmpdir.join("daemon.sock"))
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "thijs", "daemon", "--socket", socket_path, "--workers", "1"],
+        cwd=path.dirname(PACKAGE_PATH),
+        stderr=subprocess.DEVNULL
+    )
+
+    try:
+        deadline = time.monotonic() + 30
+
+        while not path.exists(socket_path):
+            assert process.poll() is None and time.monotonic() < deadline
+            time.sleep(0.05)
+        # END LOOP
+
+        results = query("rope_bridge", 1, moves, socket_path)
+
+        assert results[0]["answer"] == run_part("rope_bridge", 1, moves).answer
+        assert not results[0]["cached"]
+        assert query("rope_bridge", 1, moves, socket_path)[0]["cached"]
+
+        with raises(DaemonException):
+            query("no_such_day", socket_path=socket_path)
+        # END WITH raises
+
+        assert send({"command": "shutdown"}, socket_path) == {"ok": True}
+        assert process.wait(timeout=30) == 0
+        assert not path.exists(socket_path)
+    finally:
+        process.kill()
+    # END TRY
+# END test__daemon_socket
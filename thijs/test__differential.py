@@ -0,0 +1,77 @@
+from .differential import (combined_solver, day_solver, default_sizes,
+                           part_solver, read_input, run_differential, shrink,
+                           split_units)
+
+
+def test__shrink():
+    # Fails while both a 3 and a 7 remain
+    units = shrink([str(number) for number in range(10)], lambda units: "3" in units and "7" in units)
+
+    assert units == ["3", "7"]
+# END test__shrink
+
+
+def test__shrink_max_attempts():
+    attempts = []
+
+    def is_failing(units):
+        attempts.append(units)
+        return "3" in units
+    # END is_failing
+
+    shrink([str(number) for number in range(100)], is_failing, max_attempts=5)
+
+    assert len(attempts) == 5
+# END test__shrink_max_attempts
+
+
+def test__split_units():
+    assert split_units("A Y\nB X") == (["A Y", "B X"], "\n")
+    assert split_units("<<>") == (["<", "<", ">"], "")
+# END test__split_units
+
+
+def test__default_sizes():
+    assert default_sizes("rope_bridge") == [20, 200, 2000]
+    assert default_sizes("monkey_in_the_middle") == [2, 8]
+# END test__default_sizes
+
+
+def test__run_differential_agrees():
+    reports = list(run_differential(day_solver("rope_bridge"), combined_solver("rope_bridge"), "rope_bridge", [10, 50], seeds=2))
+
+    assert [report.size for report in reports] == [10, 50]
+    assert all(report.n_inputs == 2 and not report.mismatches for report in reports)
+    assert all(report.speedup > 0 for report in reports)
+# END test__run_differential_agrees
+
+
+def test__run_differential_shrinks_mismatch():
+    reference = part_solver("rock_paper_scissors", 1)
+
+    # Scores a rock against paper one point too high
+    def candidate(input_path: str) -> int:
+        return reference(input_path) + read_input(input_path).split("\n").count("A Y")
+    # END candidate
+
+    (report,) = run_differential(reference, candidate, "rock_paper_scissors", [100], seeds=2)
+
+    assert [mismatch.seed for mismatch in report.mismatches] == [0, 1]
+    assert all(mismatch.input_text == "A Y" for mismatch in report.mismatches)
+    assert all(mismatch.actual > mismatch.expected for mismatch in report.mismatches)
+# END test__run_differential_shrinks_mismatch
+
+
+def test__run_differential_candidate_fails():
+    def candidate(input_path: str) -> int:
+        raise ValueError("no engine")
+    # END candidate
+
+    (report,) = run_differential(part_solver("tuning_trouble", 1), candidate, "tuning_trouble", [100], seeds=1)
+    (mismatch,) = report.mismatches
+
+    assert mismatch.actual == "ValueError: no engine"
+
+    # Shrinks down to the shortest signals the reference still finds a marker in
+    assert len(mismatch.input_text) < 10
+# END test__run_differential_candidate_fails
@@ -0,0 +1,106 @@
+from os import path
+
+from pytest import fixture, mark, raises
+
+from .generators import (DEFAULT_SIZES, GENERATORS, UnknownGeneratorException,
+                         generate, valve_label)
+from .runner import list_days, list_parts, load_part
+
+# Parts that take too long on a generated input for a unit test, even a small one
+SLOW_PARTS = {("beacon_exclusion_zone", 2), ("proboscidea_volcanium", 2)}
+
+PARTS = [
+    (day, part)
+    for day in list_days()
+    for part in list_parts(day)
+    if (day, part) not in SLOW_PARTS
+]
+
+
+@fixture
+def target(tmpdir) -> str:
+    return str(tmpdir.join("generated"))
+# END target
+
+
+def test__every_day_has_a_generator():
+    assert sorted(GENERATORS) == list_days()
+    assert sorted(DEFAULT_SIZES) == list_days()
+# END test__every_day_has_a_generator
+
+
+@mark.parametrize("day, part", PARTS)
+def test__generated_input_is_solvable(day, part, target):
+    module = load_part(day, part)
+
+    generate(day, target, size=max(2, DEFAULT_SIZES[day] // 10), seed=1)
+
+    assert module.solve(module.parse(target)) is not None
+# END test__generated_input_is_solvable
+
+
+def test__generate_is_deterministic(tmpdir):
+    first = generate("calorie_counting", str(tmpdir.join("first")), seed=7)
+    second = generate("calorie_counting", str(tmpdir.join("second")), seed=7)
+    other = generate("calorie_counting", str(tmpdir.join("other")), seed=8)
+
+    with open(first) as a, open(second) as b, open(other) as c:
+        text = a.read()
+        assert text == b.read()
+        assert text != c.read()
+    # END WITH a, b, c
+
+    assert not text.endswith("\n")
+# END test__generate_is_deterministic
+
+
+def test__generate_calories_size(target):
+    from .calorie_counting.part_1 import parse
+
+    generate("calorie_counting", target, size=50)
+
+    assert len(list(parse(target))) == 50
+# END test__generate_calories_size
+
+
+def test__generate_rucksacks(target):
+    from .rucksack_reorganization.part_1 import parse as parse_rucksacks
+    from .rucksack_reorganization.part_2 import parse as parse_groups
+
+    generate("rucksack_reorganization", target, size=30)
+
+    # Every rucksack has exactly one item in both compartments, and every group exactly one badge
+    for rucksack in parse_rucksacks(target):
+        left, right = rucksack
+        assert len(set(left) & set(right)) == 1
+    # END LOOP
+
+    for group in parse_groups(target):
+        first, *others = group
+        assert len(set(first).intersection(*others)) == 1
+    # END LOOP
+# END test__generate_rucksacks
+
+
+def test__generate_supply_stacks(target):
+    from .supply_stacks.part_1 import parse, solve
+
+    generate("supply_stacks", target, size=100)
+
+    assert path.isfile(path.join(target, "crates"))
+    assert len(solve(parse(target))) == 9
+# END test__generate_supply_stacks
+
+
+def test__generate_unknown_day(target):
+    with raises(UnknownGeneratorException):
+        generate("does_not_exist", target)
+    # END WITH raises
+# END test__generate_unknown_day
+
+
+def test__valve_label():
+    assert valve_label(0) == "AA"
+    assert valve_label(27) == "BB"
+    assert valve_label(26 * 26) == "BAA"
+# END test__valve_label
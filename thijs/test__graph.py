@@ -0,0 +1,81 @@
+from .graph import (UNREACHABLE, CSRGraph, Interner, all_pairs_bfs, bfs,
+                    dijkstra, floyd_warshall)
+
+#   0 -> 1 -> 2 -> 3, with a costly shortcut 0 -> 3 and an isolated node 4
+EDGES = [(0, 1, 1), (1, 2, 1), (2, 3, 1), (0, 3, 5)]
+
+
+def create_graph() -> CSRGraph:
+    return CSRGraph.from_weighted_edges(5, EDGES)
+# END create_graph
+
+
+def test__interner():
+    interner: Interner[str] = Interner()
+
+    assert [interner.intern(label) for label in ["AA", "BB", "AA"]] == [0, 1, 0]
+    assert interner["BB"] == 1
+    assert "CC" not in interner
+    assert interner.lookup([1, 0]) == ["BB", "AA"]
+# END test__interner
+
+
+def test__from_edges():
+    graph = CSRGraph.from_edges(3, [(2, 0), (0, 1), (2, 1)])
+
+    assert (graph.n_nodes, graph.n_edges) == (3, 3)
+    assert list(graph.offsets) == [0, 1, 1, 3]
+    assert list(graph.neighbors(2)) == [0, 1]
+    assert list(graph.neighbors(1)) == []
+# END test__from_edges
+
+
+def test__bfs():
+    search = bfs(create_graph(), [0])
+
+    assert list(search.distances) == [0, 1, 2, 1, UNREACHABLE]
+    assert search.path(3) == [0, 3]
+    assert search.path(4) == []
+# END test__bfs
+
+
+def test__bfs_target():
+    search = bfs(create_graph(), [0], lambda node: node == 2)
+
+    assert search.target == 2
+    assert search.path(2) == [0, 1, 2]
+# END test__bfs_target
+
+
+def test__multi_source_bfs():
+    search = bfs(create_graph(), [0, 2])
+
+    assert list(search.distances) == [0, 1, 0, 1, UNREACHABLE]
+    assert search.path(3) in ([0, 3], [2, 3])
+# END test__multi_source_bfs
+
+
+def test__dijkstra():
+    search = dijkstra(create_graph(), [0])
+
+    assert list(search.distances) == [0, 1, 2, 3, UNREACHABLE]
+    assert search.path(3) == [0, 1, 2, 3]
+    assert dijkstra(create_graph(), [0], lambda node: node == 3).target == 3
+# END test__dijkstra
+
+
+def test__all_pairs():
+    graph = create_graph()
+
+    hops = [list(row) for row in all_pairs_bfs(graph)]
+    weighted = [list(row) for row in floyd_warshall(graph)]
+
+    assert hops[0] == [0, 1, 2, 1, UNREACHABLE]
+    assert weighted[0] == [0, 1, 2, 3, UNREACHABLE]
+    assert weighted[3] == [UNREACHABLE, UNREACHABLE, UNREACHABLE, 0, UNREACHABLE]
+
+    # Without weights both agree
+    unweighted = CSRGraph.from_edges(5, [(source, target) for source, target, _ in EDGES])
+
+    assert [list(row) for row in floyd_warshall(unweighted)] == [list(row) for row in all_pairs_bfs(unweighted)]
+# END test__all_pairs
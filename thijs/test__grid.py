@@ -0,0 +1,92 @@
+from pytest import raises
+
+from .grid import Grid, GridShapeException, SparseGrid, make_grid
+
+
+def test__from_rows():
+    grid = Grid.from_rows([b"123", b"456"], bytes(range(256)).replace(b"0123456789", bytes(range(10))))
+
+    assert (grid.width, grid.height, len(grid)) == (3, 2, 2)
+    assert grid[(0, 0)] == 1
+    assert grid[(2, 1)] == 6
+
+    with raises(GridShapeException):
+        Grid.from_rows([b"123", b"45"])
+    # END WITH raises
+# END test__from_rows
+
+
+def test__bounds():
+    grid = Grid(3, 2, origin=(10, 5))
+
+    grid[(12, 6)] = 7
+
+    assert grid.cells[5] == 7
+    assert grid.point(5) == (12, 6)
+    assert grid.get((13, 6)) is None
+    assert grid.get((9, 5), 255) == 255
+
+    # Out of bounds points do not wrap around, like negative list indices would
+    with raises(IndexError):
+        grid[(9, 5)]
+    # END WITH raises
+# END test__bounds
+
+
+def test__views():
+    grid = Grid.from_rows([b"abc", b"def", b"ghi"])
+
+    assert bytes(grid.row(1)) == b"def"
+    assert bytes(grid.column(1)) == b"beh"
+    assert bytes(grid.column(2)[::-1]) == b"ifc"
+
+    # The views share the cells of the grid
+    grid[(1, 1)] = ord("x")
+
+    assert bytes(grid.row(1)) == b"dxf"
+
+    with raises(IndexError):
+        grid.column(3)
+    # END WITH raises
+# END test__views
+
+
+def test__neighbors():
+    grid = Grid(3, 3)
+
+    assert sorted(grid.neighbors((1, 1))) == [(0, 1), (1, 0), (1, 2), (2, 1)]
+    assert sorted(grid.neighbors((0, 0))) == [(0, 1), (1, 0)]
+    assert len(list(grid.neighbors((1, 1), diagonal=True))) == 8
+# END test__neighbors
+
+
+def test__add_rows():
+    grid = Grid(2, 1, cells=bytearray(b"\x01\x01"))
+
+    grid.add_rows(2)
+
+    assert len(grid) == 3
+    assert grid.count(1) == 2
+    assert list(grid.points())[-1] == (1, 2)
+# END test__add_rows
+
+
+def test__sparse_grid():
+    grid = make_grid(2 ** 20, 2 ** 20)
+
+    assert isinstance(grid, SparseGrid)
+
+    grid[(-5, 10 ** 9)] = 3
+    grid[(0, 0)] = 0
+
+    assert grid[(-5, 10 ** 9)] == 3
+    assert grid[(1, 1)] == 0
+
+    # A cell that is not stored holds the fill value, as an unchanged cell of a dense grid does
+    assert grid.get((1, 1)) == 0
+    assert grid.get((1, 1), 7) == Grid(3, 3).get((1, 1), 7) == 0
+    assert grid.get((-5, 10 ** 9), 7) == 3
+    assert grid.count(3) == 1
+    assert len(grid.cells) == 1
+    assert isinstance(make_grid(10, 10), Grid)
+# END test__sparse_grid
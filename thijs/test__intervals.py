@@ -0,0 +1,93 @@
+from pytest import raises
+
+from .intervals import (IntervalException, IntervalSet, interval_contains,
+                        interval_overlaps, merge_intervals)
+
+
+def test__merge_intervals():
+    # Overlapping, touching and nested intervals are merged, disjoint ones are kept apart
+    assert merge_intervals([(5, 6), (1, 2), (3, 3), (10, 12), (11, 11)]) == [(1, 3), (5, 6), (10, 12)]
+    assert merge_intervals([(1, 1), (3, 3)]) == [(1, 1), (3, 3)]
+    assert merge_intervals([]) == []
+
+    with raises(IntervalException):
+        merge_intervals([(2, 1)])
+    # END WITH raises
+# END test__merge_intervals
+
+
+def test__interval_contains_and_overlaps():
+    assert interval_contains((2, 8), (3, 7))
+    assert not interval_contains((3, 7), (2, 8))
+
+    assert interval_overlaps((5, 7), (7, 9))
+    assert not interval_overlaps((2, 4), (6, 8))
+# END test__interval_contains_and_overlaps
+
+
+def test__interval_set_queries():
+    intervals = IntervalSet.from_intervals([(10, 12), (1, 3)])
+
+    assert list(intervals) == [(1, 3), (10, 12)]
+    assert len(intervals) == 2
+    assert intervals.length == 6
+
+    assert 3 in intervals
+    assert 4 not in intervals
+    assert 0 not in intervals
+
+    assert intervals.contains((10, 11))
+    assert not intervals.contains((3, 10))
+
+    assert intervals.overlaps((3, 10))
+    assert not intervals.overlaps((4, 9))
+    assert not intervals.overlaps((13, 20))
+# END test__interval_set_queries
+
+
+def test__interval_set_update():
+    intervals = IntervalSet()
+
+    intervals.add((5, 5))
+    intervals.update([(1, 3), (4, 4), (8, 9)])
+
+    assert intervals.intervals == [(1, 5), (8, 9)]
+# END test__interval_set_update
+
+
+def test__interval_set_operations():
+    a = IntervalSet.from_intervals([(1, 5), (10, 15)])
+    b = IntervalSet.from_intervals([(4, 11), (20, 20)])
+
+    assert a.union(b).intervals == [(1, 15), (20, 20)]
+    assert a.intersection(b).intervals == [(4, 5), (10, 11)]
+
+    assert IntervalSet([(2, 3)]).issubset(a)
+    assert not b.issubset(a)
+
+    assert a.isdisjoint(IntervalSet([(6, 9)]))
+    assert not a.isdisjoint(b)
+# END test__interval_set_operations
+
+
+def test__interval_set_intersection_merges_touching():
+    # Built directly from intervals that touch, which `from_intervals` would have merged
+    a = IntervalSet([(0, 2), (3, 5), (8, 9)])
+    b = IntervalSet([(0, 10)])
+
+    expected = IntervalSet.from_intervals([(0, 5), (8, 9)])
+
+    assert a.intersection(b) == expected
+    assert b.intersection(a) == expected
+    assert a.intersection(b).length == expected.length == 8
+    assert a.intersection(b).find(3) == (0, 5)
+# END test__interval_set_intersection_merges_touching
+
+
+def test__interval_set_gaps():
+    intervals = IntervalSet.from_intervals([(-5, 2), (5, 6), (20, 30)])
+
+    assert list(intervals.gaps(0, 10)) == [(3, 4), (7, 10)]
+    assert list(intervals.gaps(-5, 2)) == []
+    assert list(IntervalSet().gaps(1, 3)) == [(1, 3)]
+# END test__interval_set_gaps
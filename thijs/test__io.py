@@ -0,0 +1,211 @@
+import gzip
+import sys
+from io import BytesIO, RawIOBase, StringIO
+from threading import Event
+from time import perf_counter
+
+from pytest import fixture, mark, raises
+
+from . import io
+from .io import (DecompressorUnavailableException, background_readers,
+                 iter_blocks_in_background, iter_lines, iter_records,
+                 read_lines, read_records, read_text, split_blocks)
+
+TEXTS = [
+    "",
+    "\n",
+    "a",
+    "a\n",
+    "a\n\n",
+    "a\nbb\n\nccc",
+    "1000\n2000\n\n4000\n\n5000\n6000\n",
+    "é\nü\n",
+]
+
+
+@fixture
+def write(tmpdir):
+    def write(text: str) -> str:
+        file = tmpdir.join("input")
+        file.write_binary(text.encode("utf-8"))
+        return str(file)
+    # END write
+    return write
+# END write
+
+
+def read_lines_with_open(path: str):
+    with open(path, encoding="utf-8") as file:
+        return [line.rstrip("\n") for line in file]
+    # END WITH file
+# END read_lines_with_open
+
+
+@mark.parametrize("text", TEXTS)
+@mark.parametrize("chunk_size", [1, 2, 3, 1 << 20])
+def test__read_lines(write, text, chunk_size):
+    path = write(text)
+
+    expected = read_lines_with_open(path)
+
+    assert list(read_lines(path, chunk_size)) == expected
+    assert list(iter_lines(path, chunk_size)) == [line.encode("utf-8") for line in expected]
+# END test__read_lines
+
+
+@mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test__read_records(write, chunk_size):
+    path = write("1\n2\n\n3\n\n4\n5")
+
+    assert list(read_records(path, "\n\n", chunk_size)) == ["1\n2", "3", "4\n5"]
+    assert list(iter_records(path, b"\n\n", chunk_size)) == [b"1\n2", b"3", b"4\n5"]
+# END test__read_records
+
+
+@mark.parametrize("text", TEXTS)
+@mark.parametrize("chunk_size", [1, 2, 3, 1 << 20])
+def test__read_lines_crlf(write, text, chunk_size):
+    encoded = text.replace("\n", "\r\n").encode("utf-8")
+    path = write(encoded.decode("utf-8"))
+
+    # Text mode reads Windows line endings as plain newlines
+    expected = read_lines_with_open(path)
+
+    assert list(read_lines(path, chunk_size)) == expected
+    assert list(read_lines(BytesIO(encoded), chunk_size)) == expected
+    assert list(read_lines(BytesIO(gzip.compress(encoded)), chunk_size)) == expected
+# END test__read_lines_crlf
+
+
+@mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test__read_records_crlf(write, chunk_size):
+    encoded = b"1\r\n2\r\n\r\n3\r\n\r\n4\r\n5"
+
+    assert list(read_records(write(encoded.decode("utf-8")), "\n\n", chunk_size)) == ["1\n2", "3", "4\n5"]
+    assert list(iter_records(BytesIO(encoded), b"\n\n", chunk_size)) == [b"1\n2", b"3", b"4\n5"]
+    assert read_text(BytesIO(encoded)) == "1\n2\n\n3\n\n4\n5"
+# END test__read_records_crlf
+
+
+def test__read_text(write):
+    assert read_text(write("")) == ""
+    assert read_text(write("<>\n")) == "<>\n"
+# END test__read_text
+
+
+@mark.parametrize("text", TEXTS)
+@mark.parametrize("chunk_size", [1, 2, 3, 1 << 20])
+def test__read_lines_stream(text, chunk_size):
+    expected = text.split("\n")
+
+    # A trailing newline does not start another line
+    if text.endswith("\n"):
+        expected.pop()
+    elif not text:
+        expected = []
+    # END IF
+
+    encoded = text.encode("utf-8")
+
+    assert list(read_lines(BytesIO(encoded), chunk_size)) == expected
+    assert list(read_lines(StringIO(text), chunk_size)) == expected
+    assert list(read_lines(BytesIO(gzip.compress(encoded)), chunk_size)) == expected
+    assert list(iter_lines(BytesIO(encoded), chunk_size)) == [line.encode("utf-8") for line in expected]
+# END test__read_lines_stream
+
+
+def test__split_blocks():
+    # The separator may be split over two blocks
+    blocks = [b"1\n", b"\n2", b"\n\n", b"3"]
+
+    assert [chunk.split(b"\n\n") for chunk in split_blocks(iter(blocks), b"\n\n")] == [[b"1"], [b"2"], [b"3"]]
+    assert list(split_blocks(iter([]), b"\n")) == []
+# END test__split_blocks
+
+
+def test__read_records_stream():
+    stream = BytesIO(gzip.compress(b"1\n2\n\n3\n\n4\n5"))
+
+    assert list(read_records(stream, "\n\n", 3)) == ["1\n2", "3", "4\n5"]
+# END test__read_records_stream
+
+
+def test__read_compressed_file(tmpdir):
+    file = tmpdir.join("input.gz")
+    file.write_binary(gzip.compress(b"a\nbb\n"))
+
+    assert list(read_lines(str(file))) == ["a", "bb"]
+    assert read_text(str(file)) == "a\nbb\n"
+# END test__read_compressed_file
+
+
+def test__read_lines_abandoned():
+    lines = read_lines(BytesIO(gzip.compress(b"line\n" * 100000)), 16)
+
+    assert next(lines) == "line"
+
+    # Closing the reader halfway stops its background thread
+    lines.close()
+
+    assert not background_readers
+# END test__read_lines_abandoned
+
+
+class StalledStream(RawIOBase):
+    """
+    Returns a single block and then blocks on its next read until `resumed` is set, like a pipe with a quiet writer.
+    """
+
+    def __init__(self):
+        self.resumed = Event()
+        self.n_reads = 0
+    # END __init__
+
+    def readable(self) -> bool:
+        return True
+    # END readable
+
+    def read(self, size: int = -1) -> bytes:
+        self.n_reads += 1
+
+        if self.n_reads > 1:
+            self.resumed.wait()
+            return b""
+        # END IF
+
+        return b"line\n"
+    # END read
+# END StalledStream
+
+
+def test__iter_blocks_in_background_stalled(monkeypatch):
+    monkeypatch.setattr(io, "STOP_TIMEOUT", 0.1)
+
+    stream = StalledStream()
+    blocks = iter_blocks_in_background(stream, 16)
+
+    assert next(blocks) == b"line\n"
+
+    # Stopping early does not wait for the read that is still blocked
+    start = perf_counter()
+    blocks.close()
+
+    assert perf_counter() - start < 5
+    assert len(background_readers) == 1
+
+    # The thread stops once its read returns, and is stopped at exit otherwise
+    stream.resumed.set()
+    io.stop_background_readers()
+
+    assert not background_readers
+# END test__iter_blocks_in_background_stalled
+
+
+def test__read_zstd_without_decompressor(monkeypatch):
+    # A module set to `None` cannot be imported, as if the package was not installed
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    with raises(DecompressorUnavailableException):
+        list(read_lines(BytesIO(b"\x28\xb5\x2f\xfd" + bytes(8))))
+    # END WITH raises
+# END test__read_zstd_without_decompressor
@@ -0,0 +1,47 @@
+from .__main__ import main
+from .memory import measure_memory, measure_memory_isolated
+
+
+def test__measure_memory():
+    from .hill_climbing_algorithm.part_1 import INPUT_PATH, parse
+
+    answer, report = measure_memory("hill_climbing_algorithm", 1, top=3)
+    n_nodes = len(parse(INPUT_PATH).elevations)
+
+    assert answer == 350
+    assert report.parse_peak > 0
+    assert report.peak >= report.solve_peak
+    assert len(report.allocation_sites) == 3
+
+    # The parsed input holds its nodes and edges in flat arrays, rather than an object per cell of the height map
+    assert report.n_objects < n_nodes
+# END test__measure_memory
+
+
+def test__measure_memory_input_path(tmpdir):
+    input_path = tmpdir.join("camp_cleanup")
+    input_path.write("2-4,6-8\n2-3,4-5\n5-7,7-9\n2-8,3-7\n6-6,4-6\n2-6,4-8")
+
+    answer, report = measure_memory("camp_cleanup", 1, str(input_path))
+
+    assert answer == 2
+    assert report.allocation_sites[0].location.startswith("thijs/camp_cleanup/part_1.py:")
+# END test__measure_memory_input_path
+
+
+def test__measure_memory_isolated():
+    answer, report = measure_memory_isolated("calorie_counting", 1)
+
+    assert answer == 72070
+    assert report.peak_rss is None or report.peak_rss > report.peak
+# END test__measure_memory_isolated
+
+
+def test__memory_command(capsys):
+    assert main(["run", "rope_bridge", "--part", "1", "--memory", "--memory-top", "2"]) == 0
+
+    output = capsys.readouterr().out
+
+    assert "rope_bridge part 1: " in output
+    assert "Allocation sites of the parsed input" in output
+# END test__memory_command
@@ -0,0 +1,57 @@
+from .metrics import count, count_calls, enabled, record_metrics
+
+
+def test__count():
+    with record_metrics() as metrics:
+        assert enabled()
+
+        count("steps")
+        count("steps", 4)
+    # END WITH metrics
+
+    assert not enabled()
+    assert metrics == {"steps": 5}
+# END test__count
+
+
+def test__count_without_recording():
+    count("steps")
+
+    with record_metrics() as metrics:
+        pass
+    # END WITH metrics
+
+    assert metrics == {}
+# END test__count_without_recording
+
+
+def test__count_calls():
+    def fibonacci(n: int) -> int:
+        return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+    # END fibonacci
+
+    fibonacci = count_calls("fibonacci.calls", fibonacci)
+
+    with record_metrics() as metrics:
+        assert fibonacci(10) == 55
+    # END WITH metrics
+
+    assert fibonacci.__name__ == "fibonacci"
+    assert metrics == {"fibonacci.calls": 177}
+# END test__count_calls
+
+
+def test__record_metrics_nested():
+    with record_metrics() as outer:
+        count("steps")
+
+        with record_metrics() as inner:
+            count("steps", 2)
+        # END WITH inner
+
+        count("steps")
+    # END WITH outer
+
+    assert outer == {"steps": 2}
+    assert inner == {"steps": 2}
+# END test__record_metrics_nested
@@ -0,0 +1,86 @@
+import pstats
+from time import sleep
+
+from .__main__ import PROFILE_SORT_KEYS, main
+from .profiling import (SORT_KEYS, LineSampler, phase, profile, profile_part,
+                        record_phases)
+
+
+@phase("decorated")
+def decorated() -> int:
+    return 42
+# END decorated
+
+
+def test__phase_without_recorder():
+    with phase("ignored"):
+        pass
+    # END WITH phase
+
+    assert decorated() == 42
+# END test__phase_without_recorder
+
+
+def test__record_phases():
+    with record_phases() as recorder:
+        with phase("outer"):
+            decorated()
+            decorated()
+        # END WITH phase
+    # END WITH recorder
+
+    assert list(recorder.phases) == ["outer", "decorated"]
+    assert recorder.phases["decorated"].calls == 2
+    assert recorder.phases["outer"].total_time >= recorder.phases["decorated"].total_time
+# END test__record_phases
+
+
+def test__line_sampler():
+    with LineSampler(interval=0.001) as sampler:
+        sleep(0.05)
+    # END WITH sampler
+
+    assert sampler.samples > 0
+    assert any(name == "test__line_sampler" for (_, _, name), _ in sampler.top(5))
+# END test__line_sampler
+
+
+def test__profile(tmpdir):
+    dump_path = str(tmpdir.join("profile.prof"))
+
+    with profile(top=50, dump_path=dump_path) as report:
+        decorated()
+    # END WITH report
+
+    assert [stats.name for stats in report.phases] == ["decorated"]
+    assert any("(decorated)" in row.function for row in report.functions)
+    assert len(report.functions) <= 50
+
+    # The dump can be read back with the standard tools
+    assert pstats.Stats(dump_path).total_calls > 0
+# END test__profile
+
+
+def test__profile_part():
+    answer, report = profile_part("proboscidea_volcanium", 1, sort="cumtime")
+
+    assert answer == 2253
+    assert [stats.name for stats in report.phases] == ["parse", "solve", "build", "search"]
+    assert report.functions == sorted(report.functions, key=lambda row: row.cumulative_time, reverse=True)
+# END test__profile_part
+
+
+def test__profile_command(capsys):
+    assert main(["run", "tuning_trouble", "--part", "1", "--profile", "--profile-top", "3", "--profile-lines"]) == 0
+
+    output = capsys.readouterr().out
+
+    assert "tuning_trouble part 1: 1034" in output
+    assert "Hot functions" in output
+# END test__profile_command
+
+
+def test__profile_sort_keys():
+    # The command line repeats the sort keys, so it does not have to import the profiler to build its parser
+    assert sorted(PROFILE_SORT_KEYS) == sorted(SORT_KEYS)
+# END test__profile_sort_keys
@@ -0,0 +1,267 @@
+import sys
+from os import path
+
+from pytest import mark, raises
+
+from .cache import ParsedCache, ResultCache
+from .metrics import count
+from .runner import (AUTO_ENGINE, REFERENCE_ENGINE, UnknownDayException,
+                     UnknownEngineException, UnknownPartException,
+                     is_available, list_days, list_engine_parts, list_engines,
+                     list_parts,
+                     load_combined, load_part, run_day, run_part,
+                     select_engine)
+
+
+def test__list_days():
+    days = list_days()
+
+    assert "calorie_counting" in days
+    assert "pyroclastic_flow" in days
+    assert days == sorted(days)
+# END test__list_days
+
+
+def test__list_parts():
+    assert list_parts("calorie_counting") == [1, 2]
+    assert list_parts("pyroclastic_flow") == [1]
+# END test__list_parts
+
+
+def test__load_part_unknown_day():
+    with raises(UnknownDayException):
+        load_part("does_not_exist", 1)
+    # END WITH raises
+# END test__load_part_unknown_day
+
+
+def test__load_part_unknown_part():
+    with raises(UnknownPartException):
+        load_part("pyroclastic_flow", 2)
+    # END WITH raises
+# END test__load_part_unknown_part
+
+
+def test__load_part_is_lazy():
+    sys.modules.pop("thijs.rope_bridge.part_2", None)
+
+    load_part("rope_bridge", 1)
+
+    assert "thijs.rope_bridge.part_2" not in sys.modules
+# END test__load_part_is_lazy
+
+
+def test__run_part_default_input():
+    result = run_part("calorie_counting", 1)
+
+    assert result.answer == 72070
+    assert result.parse_time >= 0
+    assert result.solve_time >= 0
+# END test__run_part_default_input
+
+
+def test__run_part_sample_data():
+    INPUT_PATH = path.join(path.dirname(__file__), "regolith_reservoir", "sample_data")
+
+    result = run_part("regolith_reservoir", 1, INPUT_PATH)
+
+    assert result.answer == 24
+    assert result.input_path == INPUT_PATH
+    assert result.metrics == {}
+# END test__run_part_sample_data
+
+
+def test__run_part_metrics():
+    INPUT_PATH = path.join(path.dirname(__file__), "regolith_reservoir", "sample_data")
+
+    result = run_part("regolith_reservoir", 1, INPUT_PATH, collect_metrics=True)
+
+    assert result.metrics["sand.grains"] == result.answer
+    assert result.metrics["sand.steps"] > result.metrics["sand.grains"]
+# END test__run_part_metrics
+
+
+def test__run_part_silences_solver(capsys):
+    run_part("monkey_in_the_middle", 1)
+    run_day("monkey_in_the_middle")
+
+    assert capsys.readouterr().out == ""
+# END test__run_part_silences_solver
+
+
+def test__load_combined():
+    assert load_combined("calorie_counting").__name__ == "thijs.calorie_counting.combined"
+    assert load_combined("pyroclastic_flow") is None
+
+    with raises(UnknownDayException):
+        load_combined("does_not_exist")
+    # END WITH raises
+# END test__load_combined
+
+
+@mark.parametrize("day", [
+    "calorie_counting",
+    "camp_cleanup",
+    "cathode_ray_tube",
+    "distress_signal",
+    "hill_climbing_algorithm",
+    "monkey_in_the_middle",
+    "no_space_left_on_device",
+    "regolith_reservoir",
+    "rock_paper_scissors",
+    "rope_bridge",
+    "rucksack_reorganization",
+    "supply_stacks",
+    "treetop_tree_house",
+    "tuning_trouble",
+])
+def test__run_day_matches_parts(day: str):
+    results = run_day(day)
+
+    assert [result.part for result in results] == list_parts(day)
+    assert [result.answer for result in results] == [run_part(day, part).answer for part in list_parts(day)]
+# END test__run_day_matches_parts
+
+
+def test__run_day_shares_parse():
+    first, second = run_day("regolith_reservoir")
+
+    assert first.parse_time > 0 and not first.shared_parse
+    assert second.parse_time == 0 and second.shared_parse
+    assert (first.answer, second.answer) == (795, 30214)
+# END test__run_day_shares_parse
+
+
+def test__run_day_metrics():
+    first, second = run_day("monkey_in_the_middle", collect_metrics=True)
+
+    assert first.metrics == {"monkey.inspections": 1190}
+    assert second.metrics == {"monkey.inspections": 693563}
+# END test__run_day_metrics
+
+
+def test__run_day_metrics_of_parse(monkeypatch):
+    module = load_combined("monkey_in_the_middle")
+    parse = module.parse
+
+    def counting_parse(input_path):
+        count("monkey.inspections", 10)
+        count("monkey.parsed")
+        return parse(input_path)
+    # END counting_parse
+
+    monkeypatch.setattr(module, "parse", counting_parse)
+
+    first, second = run_day("monkey_in_the_middle", collect_metrics=True)
+
+    # What the parse counts is added to the first part, even under a name that part counts as well
+    assert first.metrics == {"monkey.inspections": 1200, "monkey.parsed": 1}
+    assert second.metrics == {"monkey.inspections": 693563}
+# END test__run_day_metrics_of_parse
+
+
+def test__run_day_without_combined():
+    INPUT_PATH = path.join(path.dirname(__file__), "pyroclastic_flow", "sample_data")
+
+    (result,) = run_day("pyroclastic_flow", INPUT_PATH)
+
+    assert result.part == 1
+    assert not result.shared_parse
+# END test__run_day_without_combined
+
+
+def test__run_day_cache(tmpdir):
+    cache = ResultCache(str(tmpdir.join("results")))
+    parsed_cache = ParsedCache(str(tmpdir.join("parsed")))
+
+    first = run_day("supply_stacks", cache=cache, parsed_cache=parsed_cache)
+    second = run_day("supply_stacks", cache=cache, parsed_cache=parsed_cache)
+
+    assert not any(result.cached for result in first)
+    assert all(result.cached for result in second)
+    assert [result.answer for result in second] == [result.answer for result in first]
+
+    # Without the answers, the parsed input of the whole day is reused
+    cache.clear()
+
+    third = run_day("supply_stacks", cache=cache, parsed_cache=parsed_cache)
+
+    assert [result.answer for result in third] == [result.answer for result in first]
+    assert sum(1 for _ in parsed_cache.entries()) == 1
+# END test__run_day_cache
+
+
+def test__run_part_stream():
+    with open(path.join(path.dirname(__file__), "regolith_reservoir", "sample_data"), "rb") as file:
+        result = run_part("regolith_reservoir", 1, file, cache=ResultCache("/does/not/exist"))
+    # END WITH file
+
+    assert result.answer == 24
+    assert result.input_path.endswith("sample_data")
+    assert not result.cached
+# END test__run_part_stream
+
+
+def test__list_engines():
+    assert list_engines("pyroclastic_flow") == [REFERENCE_ENGINE]
+    assert list_engines("calorie_counting") == [REFERENCE_ENGINE, "fast", "parallel", "vectorized"]
+    assert list_engine_parts("rope_bridge", REFERENCE_ENGINE) == [1, 2]
+
+    with raises(UnknownDayException):
+        list_engines("does_not_exist")
+    # END WITH raises
+# END test__list_engines
+
+
+def test__load_part_unknown_engine():
+    with raises(UnknownEngineException):
+        load_part("rope_bridge", 1, "does_not_exist")
+    # END WITH raises
+
+    with raises(UnknownEngineException):
+        run_day("rope_bridge", engine="does_not_exist")
+    # END WITH raises
+# END test__load_part_unknown_engine
+
+
+def test__select_engine(tmpdir):
+    assert select_engine("rope_bridge") == REFERENCE_ENGINE
+    assert select_engine("calorie_counting") == "fast"
+
+    # The fast engine only declares a size from which it is picked, so an empty input stays with the reference
+    empty = tmpdir.join("empty")
+    empty.write("")
+
+    assert select_engine("calorie_counting", str(empty)) == REFERENCE_ENGINE
+
+    # Only the size of the input counts, so a sparse file will do
+    large = tmpdir.join("large")
+
+    with open(str(large), "wb") as file:
+        file.truncate(8 << 20)
+    # END WITH file
+
+    assert select_engine("calorie_counting", str(large)) == ("vectorized" if is_available("calorie_counting", "vectorized") else "fast")
+
+    # A stream has no size to go by
+    with open(path.join(path.dirname(__file__), "rope_bridge", "data"), "rb") as file:
+        assert select_engine("rope_bridge", file) == REFERENCE_ENGINE
+    # END WITH file
+# END test__select_engine
+
+
+def test__run_part_engine():
+    result = run_part("rope_bridge", 1, engine=AUTO_ENGINE)
+
+    assert result.engine == REFERENCE_ENGINE
+    assert result.answer == run_part("rope_bridge", 1).answer
+# END test__run_part_engine
+
+
+def test__run_day_engine():
+    reference = run_day("calorie_counting", engine=REFERENCE_ENGINE)
+    fast = run_day("calorie_counting", engine=AUTO_ENGINE)
+
+    assert [result.engine for result in fast] == ["fast", "fast"]
+    assert [result.answer for result in fast] == [result.answer for result in reference]
+# END test__run_day_engine
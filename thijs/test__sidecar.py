@@ -0,0 +1,108 @@
+from pytest import mark, raises
+
+from .cache import ParsedCache
+from .runner import load_part, run_part
+from .sidecar import (SidecarFormatException, pack_ints, pack_nested,
+                      pack_sections, pack_strings, unpack_ints, unpack_nested,
+                      unpack_sections, unpack_strings)
+
+PARTS_WITH_CODEC = [
+    ("beacon_exclusion_zone", 1),
+    ("beacon_exclusion_zone", 2),
+    ("distress_signal", 1),
+    ("distress_signal", 2),
+    ("proboscidea_volcanium", 1),
+    ("proboscidea_volcanium", 2),
+    ("supply_stacks", 1),
+    ("supply_stacks", 2),
+]
+
+
+def test__sections():
+    sections = unpack_sections(pack_sections([b"abc", b"", pack_ints([-1, 2 ** 40])]))
+
+    assert [bytes(section) for section in sections[:2]] == [b"abc", b""]
+    assert list(unpack_ints(sections[2])) == [-1, 2 ** 40]
+# END test__sections
+
+
+def test__unpack_sections_invalid():
+    with raises(SidecarFormatException):
+        unpack_sections(b"nope")
+    # END WITH raises
+
+    with raises(SidecarFormatException):
+        unpack_sections(pack_sections([b"abc"])[:-1])
+    # END WITH raises
+# END test__unpack_sections_invalid
+
+
+def test__strings():
+    strings = ["AA", "", "BBB", "é"]
+
+    assert unpack_strings(memoryview(pack_strings(strings))) == strings
+# END test__strings
+
+
+def test__nested():
+    lists = [[1, [2, [3, [4, [5, 6, 7]]]], 8, 9], [], [[]], [[4, 4], 4, 4]]
+
+    assert unpack_nested(memoryview(pack_nested(lists))) == lists
+
+    with raises(SidecarFormatException):
+        pack_nested([[-1]])
+    # END WITH raises
+# END test__nested
+
+
+@mark.parametrize("day, part", PARTS_WITH_CODEC)
+def test__codec_round_trip(day, part):
+    module = load_part(day, part)
+
+    parsed = module.parse(module.INPUT_PATH)
+
+    assert module.CODEC.decode(module.CODEC.encode(parsed)) == parsed
+# END test__codec_round_trip
+
+
+@mark.parametrize("part", [1, 2])
+def test__hill_climbing_codec(part):
+    module = load_part("hill_climbing_algorithm", part)
+
+    parsed = module.parse(module.INPUT_PATH)
+    decoded = module.CODEC.decode(module.CODEC.encode(parsed))
+
+    assert decoded == parsed
+    assert module.solve(decoded) == module.solve(parsed)
+# END test__hill_climbing_codec
+
+
+def test__parsed_cache(tmpdir):
+    cache = ParsedCache(str(tmpdir))
+    module = load_part("beacon_exclusion_zone", 1)
+    parsed = module.parse(module.INPUT_PATH)
+
+    assert cache.load("key", module.CODEC) is None
+
+    cache.store("key", module.CODEC, parsed)
+
+    assert cache.load("key", module.CODEC) == parsed
+
+    # A damaged entry is ignored rather than trusted
+    with open(cache.entry_path("key"), "wb") as file:
+        file.write(b"garbage")
+    # END WITH file
+
+    assert cache.load("key", module.CODEC) is None
+# END test__parsed_cache
+
+
+def test__run_part_parsed_cache(tmpdir):
+    cache = ParsedCache(str(tmpdir))
+
+    first = run_part("supply_stacks", 1, parsed_cache=cache)
+    second = run_part("supply_stacks", 1, parsed_cache=cache)
+
+    assert len(list(cache.entries())) == 1
+    assert first.answer == second.answer == "TWSGQHNHL"
+# END test__run_part_parsed_cache
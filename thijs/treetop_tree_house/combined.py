@@ -0,0 +1,32 @@
+from typing import Iterator, List
+
+from ..io import Source
+from . import part_1, part_2
+from .part_1 import Forest
+
+INPUT_PATH = part_1.INPUT_PATH
+
+
+def parse(path: Source) -> Forest:
+    return part_1.parse(path)
+# END parse
+
+
+def solve(forest: Forest) -> Iterator[int]:
+    yield part_1.solve(forest)
+
+    # The trees of part 2 look at the same grid of heights
+    yield part_2.solve(part_2.Forest(forest.heights))
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
@@ -1,9 +1,15 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from os import path
-from typing import List
+from typing import Iterator
+
+from ..grid import Grid
+from ..io import Source, iter_lines
 
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
+# Maps the code of every digit to its value
+DIGITS = bytes(range(256)).replace(b"0123456789", bytes(range(10)))
+
 
 @dataclass
 class Tree:
@@ -17,8 +23,8 @@ class Tree:
         Returns `True` if this tree is visible from any side of the forest
         """
 
-        def visible_from_dimension(dimension: List[Tree]):
-            return all(tree.z < self.z for tree in dimension)
+        def visible_from_dimension(dimension: memoryview):
+            return all(z < self.z for z in dimension)
         # END visible_from_dimension
 
         return any(visible_from_dimension(dimension) for dimension in self.forest.get_neighbors(self))
@@ -28,60 +34,56 @@ class Tree:
 
 @dataclass
 class Forest:
-    trees: List[List[Tree]] = field(default_factory=list)
+    heights: Grid
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[Tree]:
         """
         Iterates over all trees in the forest
 
         :yield: A tree in this forest
         :rtype: Tree
         """
-        for col in self.trees:
-            yield from col
+        for index, z in enumerate(self.heights.cells):
+            x, y = self.heights.point(index)
+            yield Tree(self, x, y, z)
         # END LOOP
     # END __iter__
 
-    def get_neighbors(self, tree: Tree):
-        yield [tree for tree in self.trees[tree.y][:tree.x]]
-        yield [tree for tree in self.trees[tree.y][tree.x + 1:]]
-        yield [col[tree.x] for col in self.trees[:tree.y]]
-        yield [col[tree.x] for col in self.trees[tree.y + 1:]]
-    # END get_neighbors
+    def get_neighbors(self, tree: Tree) -> Iterator[memoryview]:
+        """
+        Yields the heights of the trees to the left, right, top and bottom of the given `tree`, as views on the grid
+        """
 
-    def add_tree(self, x: int, y: int, z: int):
-        if len(self.trees) == y:
-            self.trees.append([])
-        # END IF
+        row = self.heights.row(tree.y)
+        column = self.heights.column(tree.x)
 
-        tree = Tree(self, x, y, z)
+        yield row[:tree.x]
+        yield row[tree.x + 1:]
+        yield column[:tree.y]
+        yield column[tree.y + 1:]
+    # END get_neighbors
+# END Forest
 
-        self.trees[y].append(tree)
 
-        return tree
-    # END add_tree
-# END Forest
+def read_forest(path: Source) -> Forest:
+    # The rows are read as bytes, so every digit is mapped from its code to its height
+    return Forest(Grid.from_rows(iter_lines(path), DIGITS))
+# END read_forest
 
 
-def read_forest(path: str):
-    forest = Forest()
+def parse(path: Source) -> Forest:
+    return read_forest(path)
+# END parse
 
-    with open(path) as file:
-        rows = (row.rstrip('\n') for row in file)
-        for y, row in enumerate(rows):
-            for x, z in enumerate(row):
-                forest.add_tree(int(x), int(y), int(z))
-            # END LOOP
-        # END LOOP
-    # END WITH file
 
-    return forest
-# END read_forest
+def solve(forest: Forest) -> int:
+    visible_trees = [tree for tree in forest if tree.is_visible()]
+    return len(visible_trees)
+# END solve
 
 
 if __name__ == '__main__':
-    forest = read_forest(INPUT_PATH)
-    visible_trees = [tree for tree in forest if tree.is_visible()]
+    forest = parse(INPUT_PATH)
 
-    print(len(visible_trees))
+    print(solve(forest))
 # END IF
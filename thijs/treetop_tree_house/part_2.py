@@ -1,10 +1,16 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from math import prod
 from os import path
-from typing import List
+from typing import Iterator
+
+from ..grid import Grid
+from ..io import Source, iter_lines
 
 INPUT_PATH = path.join(path.dirname(__file__), "data")
 
+# Maps the code of every digit to its value
+DIGITS = bytes(range(256)).replace(b"0123456789", bytes(range(10)))
+
 
 @dataclass
 class Tree:
@@ -17,8 +23,8 @@ class Tree:
         dimensions = list(self.forest.get_neighbors(self))
         viewing_distance = []
         for dimension in dimensions:
-            for index, tree in enumerate(dimension):
-                if tree.z < self.z:
+            for index, z in enumerate(dimension):
+                if z < self.z:
                     continue
                 # END IF
 
@@ -35,66 +41,56 @@ class Tree:
 
 @dataclass
 class Forest:
-    trees: List[List[Tree]] = field(default_factory=list)
+    heights: Grid
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[Tree]:
         """
         Iterates over all trees in the forest
 
         :yield: A tree in this forest
         :rtype: Tree
         """
-        for col in self.trees:
-            yield from col
+        for index, z in enumerate(self.heights.cells):
+            x, y = self.heights.point(index)
+            yield Tree(self, x, y, z)
         # END LOOP
     # END __iter__
 
-    def get_neighbors(self, tree: Tree):
+    def get_neighbors(self, tree: Tree) -> Iterator[memoryview]:
+        """
+        Yields the heights of the trees to the left, right, top and bottom of the given `tree`, as views on the grid
+        Every view starts next to the tree and looks away from it
+        """
 
-        def reverse(trees: List[Tree]) -> List[Tree]:
-            trees.reverse()
-            return trees
-        # END reverse
+        row = self.heights.row(tree.y)
+        column = self.heights.column(tree.x)
 
-        yield reverse([tree for tree in self.trees[tree.y][:tree.x]])
-        yield [tree for tree in self.trees[tree.y][tree.x + 1:]]
-        yield reverse([col[tree.x] for col in self.trees[:tree.y]])
-        yield [col[tree.x] for col in self.trees[tree.y + 1:]]
+        yield row[tree.x - 1::-1] if tree.x > 0 else row[:0]
+        yield row[tree.x + 1:]
+        yield column[tree.y - 1::-1] if tree.y > 0 else column[:0]
+        yield column[tree.y + 1:]
     # END get_neighbors
+# END Forest
 
-    def add_tree(self, x: int, y: int, z: int):
-        if len(self.trees) == y:
-            self.trees.append([])
-        # END IF
-
-        tree = Tree(self, x, y, z)
-
-        self.trees[y].append(tree)
 
-        return tree
-    # END add_tree
-# END Forest
+def read_forest(path: Source) -> Forest:
+    # The rows are read as bytes, so every digit is mapped from its code to its height
+    return Forest(Grid.from_rows(iter_lines(path), DIGITS))
+# END read_forest
 
 
-def read_forest(path: str):
-    forest = Forest()
+def parse(path: Source) -> Forest:
+    return read_forest(path)
+# END parse
 
-    with open(path) as file:
-        rows = (row.rstrip('\n') for row in file)
-        for y, row in enumerate(rows):
-            for x, z in enumerate(row):
-                forest.add_tree(int(x), int(y), int(z))
-            # END LOOP
-        # END LOOP
-    # END WITH file
 
-    return forest
-# END read_forest
+def solve(forest: Forest) -> int:
+    return max(tree.scenic_score() for tree in forest)
+# END solve
 
 
 if __name__ == '__main__':
-    forest = read_forest(INPUT_PATH)
-    max_score = max(tree.scenic_score() for tree in forest)
+    forest = parse(INPUT_PATH)
 
-    print(max_score)
+    print(solve(forest))
 # END IF
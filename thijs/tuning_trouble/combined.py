@@ -0,0 +1,42 @@
+from typing import Iterator, List
+
+from ..io import Source
+from . import part_1, part_2
+from .part_1 import Signal, SignalReader
+
+INPUT_PATH = part_1.INPUT_PATH
+
+
+def parse(path: Source) -> Signal:
+    return part_1.parse(path)
+# END parse
+
+
+def solve(signal: Signal) -> Iterator[int]:
+    """
+    Yields the answers of both parts from a single scan of the signal.
+    Fourteen distinct characters end with four distinct ones, so the message marker cannot come before the packet
+    marker and part 2 picks up the scan where part 1 stopped.
+    """
+
+    packet_reader = SignalReader(part_1.packet_scanner, signal)
+    start_of_packet = len(next(packet_reader.read_packets()))
+
+    yield start_of_packet
+
+    message_reader = SignalReader(part_2.packet_scanner, signal, index=start_of_packet)
+
+    yield len(next(message_reader.read_packets()))
+# END solve
+
+
+def solve_all(path: Source) -> List[int]:
+    return list(solve(parse(path)))
+# END solve_all
+
+
+if __name__ == "__main__":
+    for answer in solve_all(INPUT_PATH):
+        print(answer)
+    # END LOOP
+# END MAIN
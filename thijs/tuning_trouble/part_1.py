@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from os import path
 from typing import Callable, Iterable
 
+from ..io import Source, read_text
+
 INPUT_PATH = path.join(path.dirname(__file__), 'data')
 
 
@@ -38,21 +40,28 @@ def packet_scanner(signal: Signal, start_of_packet: Position, index: Position):
 # END packet_scanner
 
 
-def read_signal(path: str):
-    with open(path) as file:
-        return file.read()
-    # END WITH file
+def read_signal(path: Source):
+    return read_text(path)
 # END read_signal
 
 
-if __name__ == "__main__":
+def parse(path: Source) -> Signal:
+    return read_signal(path)
+# END parse
 
-    signal = read_signal(INPUT_PATH)
 
+def solve(signal: Signal) -> int:
     reader = SignalReader(packet_scanner, signal)
 
     first_packet = next(reader.read_packets())
 
-    print(len(first_packet))
-    print(first_packet)
+    return len(first_packet)
+# END solve
+
+
+if __name__ == "__main__":
+
+    signal = parse(INPUT_PATH)
+
+    print(solve(signal))
 # END MAIN